@@ -1,16 +1,30 @@
 """HAR Analyzer - A comprehensive Chrome HAR file analyzer with PDF reporting."""
 
+import importlib
+from typing import Any
+
 __version__ = "1.0.0"
 __author__ = "Sanjay Gupta"
 __email__ = "sanjay.gupta@kinto-technologies.com"
 
-# Import main classes for easier access
-try:
-    from har_analyzer.core.analyzer import HARAnalyzer
-    from har_analyzer.core.parser import HARParser
-    from har_analyzer.reports.pdf_generator import PDFReportGenerator
+# Main classes, imported on first access so that importing the package (as
+# the command line does) does not load pandas or the reporting libraries
+_LAZY_ATTRIBUTES = {
+    "HARAnalyzer": "har_analyzer.core.analyzer",
+    "HARParser": "har_analyzer.core.parser",
+    "PDFReportGenerator": "har_analyzer.reports.pdf_generator",
+}
+
+__all__ = ["HARAnalyzer", "HARParser", "PDFReportGenerator"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
 
-    __all__ = ["HARAnalyzer", "HARParser", "PDFReportGenerator"]
-except ImportError:
-    # Handle import issues during development/testing
-    __all__ = []
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -0,0 +1,25 @@
+"""Synthetic HAR files and pipeline benchmarks."""
+
+from har_analyzer.benchmark.generator import (
+    SyntheticHARGenerator,
+    write_synthetic_har,
+)
+from har_analyzer.benchmark.harness import (
+    STAGES,
+    benchmark_file,
+    performance_target,
+    run_benchmark,
+    write_results,
+)
+from har_analyzer.utils.profiling import PeakMemorySampler
+
+__all__ = [
+    "STAGES",
+    "PeakMemorySampler",
+    "SyntheticHARGenerator",
+    "benchmark_file",
+    "performance_target",
+    "run_benchmark",
+    "write_results",
+    "write_synthetic_har",
+]
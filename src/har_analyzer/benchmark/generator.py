@@ -0,0 +1,246 @@
+"""Deterministic synthetic HAR files for benchmarks."""
+
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
+
+import numpy as np
+
+
+class ResourceProfile(NamedTuple):
+    """Distribution of one kind of generated resource."""
+
+    mime_type: str
+    extensions: tuple[str, ...]
+    weight: float
+    size_median_kb: float
+    wait_median_ms: float
+
+
+# Mix of a typical page load, by share of requests
+RESOURCE_PROFILES: tuple[ResourceProfile, ...] = (
+    ResourceProfile("text/html", (".html",), 0.04, 40, 180),
+    ResourceProfile("application/javascript", (".js",), 0.24, 60, 90),
+    ResourceProfile("text/css", (".css",), 0.09, 25, 70),
+    ResourceProfile("image/png", (".png",), 0.12, 45, 60),
+    ResourceProfile("image/jpeg", (".jpg",), 0.12, 110, 70),
+    ResourceProfile("image/webp", (".webp",), 0.07, 50, 60),
+    ResourceProfile("image/svg+xml", (".svg",), 0.04, 4, 40),
+    ResourceProfile("font/woff2", (".woff2",), 0.05, 30, 50),
+    ResourceProfile("application/json", ("",), 0.16, 3, 220),
+    ResourceProfile("video/mp4", (".mp4",), 0.01, 2500, 150),
+    ResourceProfile("text/plain", (".txt",), 0.06, 1, 30),
+)
+
+_STATUS_CODES = np.array([200, 204, 301, 304, 404, 500])
+_STATUS_WEIGHTS = np.array([0.86, 0.02, 0.02, 0.06, 0.03, 0.01])
+_METHODS = np.array(["GET", "POST", "PUT", "OPTIONS"])
+_METHOD_WEIGHTS = np.array([0.88, 0.08, 0.02, 0.02])
+_HOSTS = ("www.example.com", "cdn.example.net", "api.example.com", "img.example.org")
+
+# Entries drawn at once; keeps generation vectorized and memory bounded
+_BATCH_SIZE = 10_000
+# Random base64 text that bodies are cut from
+_BODY_POOL_BYTES = 4 * 1024 * 1024
+
+
+class SyntheticHARGenerator:
+    """Generate realistic HAR documents from a seed.
+
+    Resource types, sizes (log-normal around a per-type median), status
+    codes, methods and timing phases (with -1 for reused connections) are
+    drawn from fixed distributions, so the same seed always produces the
+    same file. A share of responses carries a base64 ``content.text`` body,
+    as browsers export for images and fonts, to exercise the cost of
+    skipping large strings.
+    """
+
+    def __init__(
+        self, seed: int = 0, body_fraction: float = 0.02, max_body_kb: int = 64
+    ):
+        """Initialize generator.
+
+        Args:
+            seed: Random seed
+            body_fraction: Share of entries with a base64 response body
+            max_body_kb: Largest body, in KB of decoded data
+        """
+        self.seed = seed
+        self.body_fraction = body_fraction
+        self.max_body_kb = max_body_kb
+        weights = np.array([profile.weight for profile in RESOURCE_PROFILES])
+        self._weights = weights / weights.sum()
+
+    def write(self, file_path: Path, entries: int) -> Path:
+        """Write a HAR file, streaming entries in batches.
+
+        Args:
+            file_path: Output path
+            entries: Number of entries
+
+        Returns:
+            The output path
+        """
+        rng = np.random.default_rng(self.seed)
+        pool = base64.b64encode(rng.bytes(_BODY_POOL_BYTES)).decode("ascii")
+        started = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            head = {
+                "version": "1.2",
+                "creator": {"name": "har-analyzer synthetic", "version": "1.0"},
+                "pages": [
+                    {
+                        "startedDateTime": _isoformat(started),
+                        "id": "page_1",
+                        "title": "Synthetic page",
+                        "pageTimings": {},
+                    }
+                ],
+            }
+            f.write('{"log": ' + json.dumps(head)[:-1] + ', "entries": [\n')
+            written = 0
+            elapsed_ms = 0.0
+            while written < entries:
+                count = min(_BATCH_SIZE, entries - written)
+                elapsed_ms = self._write_batch(
+                    f, rng, pool, started, elapsed_ms, written, count
+                )
+                written += count
+            f.write("\n]}}\n")
+        return file_path
+
+    def _write_batch(
+        self,
+        f: TextIO,
+        rng: np.random.Generator,
+        pool: str,
+        started: datetime,
+        elapsed_ms: float,
+        first: int,
+        count: int,
+    ) -> float:
+        """Draw and write ``count`` entries starting at index ``first``.
+
+        Returns:
+            Start offset of the last entry, in ms after ``started``
+        """
+        kinds = rng.choice(len(RESOURCE_PROFILES), count, p=self._weights)
+        medians = np.array([p.size_median_kb for p in RESOURCE_PROFILES])[kinds]
+        waits = np.array([p.wait_median_ms for p in RESOURCE_PROFILES])[kinds]
+        sizes = (medians * 1024 * rng.lognormal(0, 0.9, count)).astype(np.int64)
+        status = rng.choice(_STATUS_CODES, count, p=_STATUS_WEIGHTS)
+        methods = rng.choice(_METHODS, count, p=_METHOD_WEIGHTS)
+        hosts = rng.integers(0, len(_HOSTS), count)
+        reused = rng.random(count) < 0.7
+        bodies = rng.random(count) < self.body_fraction
+        offsets = rng.integers(0, len(pool) // 4, count) * 4
+        gaps = rng.exponential(25, count)
+
+        blocked = np.round(rng.exponential(4, count), 3)
+        dns = np.where(reused, -1, np.round(rng.lognormal(2.5, 0.6, count), 3))
+        connect = np.where(reused, -1, np.round(rng.lognormal(3.5, 0.5, count), 3))
+        send = np.round(rng.exponential(0.5, count), 3)
+        wait = np.round(waits * rng.lognormal(0, 0.7, count), 3)
+        # Roughly 5 MB/s with jitter
+        receive = np.round(sizes / 5000 * rng.lognormal(0, 0.5, count), 3)
+        total = (
+            blocked
+            + np.maximum(dns, 0)
+            + np.maximum(connect, 0)
+            + send
+            + wait
+            + receive
+        )
+        started_ms = np.cumsum(gaps) + elapsed_ms
+
+        for i in range(count):
+            profile = RESOURCE_PROFILES[kinds[i]]
+            index = first + i
+            extension = profile.extensions[index % len(profile.extensions)]
+            path = "api/v1/items" if not extension else f"assets/{index}"
+            content: dict[str, Any] = {
+                "size": int(sizes[i]),
+                "mimeType": profile.mime_type,
+            }
+            if bodies[i]:
+                length = min(int(sizes[i]), self.max_body_kb * 1024) * 4 // 3
+                length = min(length - length % 4, len(pool) - int(offsets[i]))
+                content["text"] = pool[offsets[i] : offsets[i] + length]
+                content["encoding"] = "base64"
+
+            entry = {
+                "pageref": "page_1",
+                "startedDateTime": _isoformat(
+                    started + timedelta(milliseconds=float(started_ms[i]))
+                ),
+                "time": round(float(total[i]), 3),
+                "request": {
+                    "method": str(methods[i]),
+                    "url": f"https://{_HOSTS[hosts[i]]}/{path}{extension}?v={index}",
+                    "httpVersion": "h2",
+                    "headers": [{"name": "accept", "value": "*/*"}],
+                    "queryString": [{"name": "v", "value": str(index)}],
+                    "cookies": [],
+                    "headersSize": -1,
+                    "bodySize": 0,
+                },
+                "response": {
+                    "status": int(status[i]),
+                    "statusText": "",
+                    "httpVersion": "h2",
+                    "headers": [
+                        {"name": "content-type", "value": profile.mime_type},
+                        {"name": "content-length", "value": str(int(sizes[i]))},
+                    ],
+                    "cookies": [],
+                    "content": content,
+                    "redirectURL": "",
+                    "headersSize": -1,
+                    "bodySize": int(sizes[i]),
+                },
+                "cache": {},
+                "timings": {
+                    "blocked": float(blocked[i]),
+                    "dns": float(dns[i]),
+                    "connect": float(connect[i]),
+                    "ssl": -1,
+                    "send": float(send[i]),
+                    "wait": float(wait[i]),
+                    "receive": float(receive[i]),
+                },
+            }
+            if index:
+                f.write(",\n")
+            f.write(json.dumps(entry, separators=(",", ":")))
+        return float(started_ms[-1])
+
+
+def _isoformat(value: datetime) -> str:
+    """Format a UTC datetime like Chrome's HAR export."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def write_synthetic_har(
+    file_path: Path,
+    entries: int,
+    seed: int = 0,
+    body_fraction: float = 0.02,
+    max_body_kb: int = 64,
+) -> Path:
+    """Write a deterministic synthetic HAR file.
+
+    Args:
+        file_path: Output path
+        entries: Number of entries
+        seed: Random seed
+        body_fraction: Share of entries with a base64 response body
+        max_body_kb: Largest body, in KB of decoded data
+
+    Returns:
+        The output path
+    """
+    generator = SyntheticHARGenerator(seed, body_fraction, max_body_kb)
+    return generator.write(Path(file_path), entries)
@@ -0,0 +1,208 @@
+"""Stage-by-stage timing and peak memory of the analysis pipeline."""
+
+import json
+import platform
+import tempfile
+import time
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from har_analyzer import __version__
+from har_analyzer.benchmark.generator import write_synthetic_har
+from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.core.formats import export_filename
+from har_analyzer.utils import get_logger, get_memory_usage, validate_har_file
+from har_analyzer.utils.profiling import PeakMemorySampler
+
+logger = get_logger(__name__)
+
+# Pipeline stages, in the order they run
+STAGES = ("validation", "parsing", "dataframe", "metrics", "export")
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_EXPORT_FORMATS = ("columnar", "ndjson")
+
+# (largest file size in MB, RAM limit in MB, time limit in seconds), from
+# tests/performance_benchmarks.md
+PERFORMANCE_TARGETS: tuple[tuple[Optional[float], float, float], ...] = (
+    (1, 100, 5),
+    (10, 500, 30),
+    (None, 1024, 120),
+)
+
+
+def _measure(name: str, stage: Callable[[], Any]) -> tuple[Any, dict[str, Any]]:
+    """Run one stage and record its time and memory."""
+    with PeakMemorySampler() as sampler:
+        started = time.perf_counter()
+        value = stage()
+        seconds = time.perf_counter() - started
+    logger.info(f"Stage {name}: {seconds:.3f}s, peak {sampler.peak_mb:.1f}MB")
+    return value, {
+        "seconds": round(seconds, 6),
+        "peak_rss_mb": round(sampler.peak_mb, 1),
+        "rss_delta_mb": round(sampler.end_mb - sampler.start_mb, 1),
+        "peak_over_start_mb": round(sampler.peak_mb - sampler.start_mb, 1),
+    }
+
+
+def performance_target(file_size_bytes: int) -> dict[str, float]:
+    """Get the documented time and memory limits for a file size.
+
+    Args:
+        file_size_bytes: Size of the HAR file
+
+    Returns:
+        Dictionary with ``max_rss_mb`` and ``max_seconds``
+    """
+    size_mb = file_size_bytes / 1024 / 1024
+    for max_size_mb, max_rss_mb, max_seconds in PERFORMANCE_TARGETS:
+        if max_size_mb is None or size_mb < max_size_mb:
+            return {"max_rss_mb": max_rss_mb, "max_seconds": max_seconds}
+    raise AssertionError("PERFORMANCE_TARGETS must end with an open size class")
+
+
+def benchmark_file(
+    har_file: Path,
+    export_formats: Iterable[str] = DEFAULT_EXPORT_FORMATS,
+    config: Optional[HARAnalyzerConfig] = None,
+) -> dict[str, Any]:
+    """Benchmark the analysis of one HAR file.
+
+    Each stage of the pipeline runs separately: validation, streaming the
+    entries into columns, building the DataFrame, computing every analysis
+    section, and exporting the data in each format.
+
+    Args:
+        har_file: Path to HAR file
+        export_formats: Formats written in the export stage
+        config: Analyzer configuration, uses default if None
+
+    Returns:
+        JSON-serializable dictionary with per-stage ``seconds``,
+        ``peak_rss_mb`` and ``rss_delta_mb``, totals, and whether the run
+        met the documented targets
+    """
+    har_file = Path(har_file)
+    analyzer = HARAnalyzer(config)
+    parser = analyzer.parser
+    stages: dict[str, dict[str, Any]] = {}
+    baseline_mb = get_memory_usage()
+
+    entries, stages["validation"] = _measure(
+        "validation", lambda: validate_har_file(har_file)
+    )
+    builder, stages["parsing"] = _measure(
+        "parsing", lambda: parser._parse_sequential(har_file)
+    )
+    analyzer.data, stages["dataframe"] = _measure(
+        "dataframe", lambda: parser._build_dataframe(builder)
+    )
+    # Release the raw columns before measuring later stages
+    builder = None
+    analyzer.metadata = parser.get_metadata()
+    _, stages["metrics"] = _measure(
+        "metrics", lambda: analyzer._perform_analysis().to_dict()
+    )
+
+    with tempfile.TemporaryDirectory() as export_dir:
+
+        def export() -> dict[str, int]:
+            sizes = {}
+            for format in export_formats:
+                path = Path(export_dir) / export_filename(format)
+                analyzer.export_data(path, format)
+                sizes[format] = path.stat().st_size
+            return sizes
+
+        export_sizes, stages["export"] = _measure("export", export)
+    stages["export"]["bytes"] = export_sizes
+
+    file_size = har_file.stat().st_size
+    total_seconds = sum(stage["seconds"] for stage in stages.values())
+    peak_mb = max(stage["peak_rss_mb"] for stage in stages.values())
+    target = performance_target(file_size)
+    return {
+        "file": str(har_file),
+        "file_size_bytes": file_size,
+        "entries": entries,
+        "requests": len(analyzer.data),
+        "baseline_rss_mb": round(baseline_mb, 1),
+        "stages": stages,
+        "total_seconds": round(total_seconds, 6),
+        "peak_rss_mb": peak_mb,
+        "entries_per_second": round(entries / total_seconds) if total_seconds else 0,
+        "target": {
+            **target,
+            "met": total_seconds < target["max_seconds"]
+            and peak_mb < target["max_rss_mb"],
+        },
+    }
+
+
+def run_benchmark(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    work_dir: Optional[Path] = None,
+    seed: int = 0,
+    har_files: Iterable[Path] = (),
+    export_formats: Iterable[str] = DEFAULT_EXPORT_FORMATS,
+    config: Optional[HARAnalyzerConfig] = None,
+) -> dict[str, Any]:
+    """Benchmark synthetic HAR files of several sizes and any given files.
+
+    Synthetic files are generated from ``seed``, so runs with the same
+    arguments on different machines or commits measure the same input.
+
+    Args:
+        sizes: Entry counts of the synthetic files
+        work_dir: Directory for generated files, a temporary one if None
+        seed: Random seed of the generator
+        har_files: Existing HAR files to benchmark as well
+        export_formats: Formats written in the export stage
+        config: Analyzer configuration, uses default if None
+
+    Returns:
+        JSON-serializable dictionary with the environment and one result of
+        ``benchmark_file`` per run
+    """
+    export_formats = tuple(export_formats)
+    runs = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(work_dir) if work_dir else Path(temp_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        for entries in sizes:
+            path = directory / f"synthetic_{entries}_{seed}.har"
+            if not path.exists():
+                logger.info(f"Generating {entries} entries: {path}")
+                write_synthetic_har(path, entries, seed=seed)
+            run = benchmark_file(path, export_formats, config)
+            runs.append({"source": "synthetic", "seed": seed, **run})
+            if not work_dir:
+                path.unlink()
+        for har_file in har_files:
+            run = benchmark_file(Path(har_file), export_formats, config)
+            runs.append({"source": "file", **run})
+
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "stages": list(STAGES),
+        "runs": runs,
+    }
+
+
+def write_results(results: dict[str, Any], output_file: Path) -> None:
+    """Save benchmark results as JSON.
+
+    Args:
+        results: Results of ``run_benchmark``
+        output_file: Output file path
+    """
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
@@ -1,17 +1,23 @@
-"""Command-line interface for HAR Analyzer."""
+"""Command-line interface for HAR Analyzer.
 
+Commands import pandas, pydantic and the reporting libraries only when they
+need them, so ``--version`` and ``validate`` start quickly.
+"""
+
+import cProfile
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
 
 from har_analyzer import __version__
-from har_analyzer.config import HARAnalyzerConfig
-from har_analyzer.core.analyzer import HARAnalyzer
-from har_analyzer.reports.pdf_generator import PDFReportGenerator
+from har_analyzer.core.formats import EXPORT_FORMATS, export_filename
 from har_analyzer.utils import HARAnalyzerError, get_logger, setup_logging
 
+if TYPE_CHECKING:
+    from har_analyzer.core.analyzer import HARAnalyzer
+
 
 @click.command()
 @click.version_option(version=__version__)
@@ -32,9 +38,9 @@ from har_analyzer.utils import HARAnalyzerError, get_logger, setup_logging
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["pdf", "json", "csv"], case_sensitive=False),
+    type=click.Choice(["pdf", *EXPORT_FORMATS], case_sensitive=False),
     default="pdf",
-    help="Output format (default: pdf)",
+    help="Output format: a PDF report or a data export (default: pdf)",
 )
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--debug", is_flag=True, help="Enable debug logging")
@@ -44,6 +50,54 @@ from har_analyzer.utils import HARAnalyzerError, get_logger, setup_logging
 @click.option(
     "--no-report", is_flag=True, help="Skip report generation, only perform analysis"
 )
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Processes used to parse large HAR files (default: 1)",
+)
+@click.option(
+    "--no-cache", is_flag=True, help="Ignore the parse cache set in the configuration"
+)
+@click.option(
+    "--sections",
+    help="Comma-separated analysis sections to compute, e.g. grade,percentiles "
+    "(implies --no-report)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Write a cProfile dump and a Chrome trace of the stages to the output "
+    "directory",
+)
+@click.option(
+    "--filter",
+    "filter_expr",
+    help="Analyze only matching entries, e.g. "
+    "'type in (API, JS) and status_code >= 400 and host == \"cdn.example.com\"'",
+)
+@click.option(
+    "--extended-fields",
+    is_flag=True,
+    help="Also extract server IP, connection, transfer and header sizes, "
+    "cache-control and content-encoding",
+)
+@click.option(
+    "--sample",
+    "sample_size",
+    type=click.IntRange(min=1),
+    help="Analyze a uniform sample of N entries; counts and totals stay exact",
+)
+@click.option(
+    "--sample-fraction",
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    help="Analyze each entry with probability F; counts and totals stay exact",
+)
+@click.option(
+    "--out-of-core",
+    is_flag=True,
+    help="Spill parsed data to disk instead of failing at the memory limit",
+)
 def main(
     har_file: Path,
     output_dir: Path,
@@ -53,11 +107,23 @@ def main(
     debug: bool,
     memory_limit: int,
     no_report: bool,
+    workers: Optional[int],
+    no_cache: bool,
+    sections: Optional[str],
+    profile: bool,
+    extended_fields: bool,
+    filter_expr: Optional[str],
+    sample_size: Optional[int],
+    sample_fraction: Optional[float],
+    out_of_core: bool,
 ) -> None:
     """Analyze Chrome HAR files and generate performance reports.
 
     HAR_FILE: Path to the Chrome HAR file to analyze
     """
+    from har_analyzer.config import HARAnalyzerConfig
+    from har_analyzer.core.analyzer import HARAnalyzer
+
     # Setup logging
     log_level = "DEBUG" if debug else ("INFO" if verbose else "WARNING")
     setup_logging(level=log_level, debug=debug)
@@ -75,6 +141,26 @@ def main(
         analyzer_config.output_dir = str(output_dir)
         analyzer_config.max_memory_mb = memory_limit
         analyzer_config.debug = debug
+        if workers:
+            analyzer_config.parse_workers = workers
+        if no_cache:
+            analyzer_config.cache_dir = None
+        if sections:
+            # The report needs every section
+            analyzer_config.analysis_sections = sections.split(",")
+            no_report = True
+        if profile:
+            analyzer_config.profile = True
+        if extended_fields:
+            analyzer_config.extended_fields = True
+        if filter_expr:
+            analyzer_config.filter_expr = filter_expr
+        if sample_size:
+            analyzer_config.sample_size = sample_size
+        if sample_fraction:
+            analyzer_config.sample_fraction = sample_fraction
+        if out_of_core:
+            analyzer_config.out_of_core = True
 
         logger.info(f"HAR Analyzer v{__version__}")
         logger.info(f"Analyzing: {har_file}")
@@ -86,22 +172,37 @@ def main(
 
         # Perform analysis
         click.echo("🚀 Starting HAR analysis...")
+        call_profiler = cProfile.Profile() if profile else None
+        if call_profiler:
+            call_profiler.enable()
         results = analyzer.analyze_file(har_file)
 
         # Display summary
         click.echo("\n" + analyzer.get_summary_text())
+        if sections and "percentiles" in results:
+            click.echo(
+                "📈 Percentiles: "
+                + ", ".join(
+                    f"{key} {value:.0f}ms"
+                    for key, value in results["percentiles"].items()
+                )
+            )
 
         # Export data if requested
-        if format in ["csv", "json"]:
-            export_file = output_dir / f"har_analysis.{format}"
+        if format in EXPORT_FORMATS:
+            export_file = output_dir / export_filename(format)
             click.echo(f"💾 Exporting data to: {export_file}")
-            analyzer.export_data(export_file, format)
+            with analyzer.profiler.stage("export", format=format):
+                analyzer.export_data(export_file, format)
 
         # Generate report
         if not no_report and format == "pdf":
             click.echo("📄 Generating PDF report...")
+            from har_analyzer.reports.pdf_generator import PDFReportGenerator
+
             generator = PDFReportGenerator(analyzer_config)
-            report_path = generator.generate_report(results, output_dir)
+            with analyzer.profiler.stage("report"):
+                report_path = generator.generate_report(results, output_dir)
             click.echo(f"✅ Report generated: {report_path}")
 
         # Show performance issues
@@ -115,6 +216,10 @@ def main(
                 click.echo(f"{severity_icon} {issue['description']}")
                 click.echo(f"   💡 {issue['recommendation']}")
 
+        if call_profiler:
+            call_profiler.disable()
+            _write_profile(analyzer, call_profiler, output_dir)
+
         click.echo(f"\n🎉 Analysis complete! Check {output_dir} for outputs.")
 
     except HARAnalyzerError as e:
@@ -130,6 +235,28 @@ def main(
         sys.exit(1)
 
 
+def _write_profile(
+    analyzer: "HARAnalyzer", call_profiler: cProfile.Profile, output_dir: Path
+) -> None:
+    """Save the cProfile dump and Chrome trace, and print the stage times."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stats_file = output_dir / "profile.prof"
+    trace_file = output_dir / "profile_trace.json"
+    call_profiler.dump_stats(stats_file)
+    analyzer.profiler.write_chrome_trace(trace_file)
+
+    click.echo("\n⏱️ Stages:")
+    for stage in analyzer.profiler.summary()["stages"]:
+        click.echo(
+            f"{'  ' * (stage['depth'] + 1)}{stage['name']}: "
+            f"{stage['seconds'] * 1000:.1f}ms, {stage['rss_delta_mb']:+.1f}MB "
+            f"(peak {stage['peak_rss_mb']:.0f}MB)"
+        )
+    for name, seconds in analyzer.profiler.timers.items():
+        click.echo(f"  {name}: {seconds * 1000:.1f}ms")
+    click.echo(f"📈 Profile: {stats_file} (cProfile), {trace_file} (Chrome trace)")
+
+
 @click.group()
 def cli() -> None:
     """HAR Analyzer CLI tools."""
@@ -140,6 +267,8 @@ def cli() -> None:
 @click.argument("output_file", type=click.Path(path_type=Path))
 def generate_config(output_file: Path) -> None:
     """Generate a default configuration file."""
+    from har_analyzer.config import HARAnalyzerConfig
+
     config = HARAnalyzerConfig()
     config.to_file(output_file)
     click.echo(f"✅ Default configuration saved to: {output_file}")
@@ -147,17 +276,250 @@ def generate_config(output_file: Path) -> None:
 
 @cli.command()
 @click.argument("har_file", type=click.Path(exists=True, path_type=Path))
-def validate(har_file: Path) -> None:
-    """Validate a HAR file format."""
-    from har_analyzer.utils.validators import validate_har_file
+@click.option("--fail-fast", is_flag=True, help="Stop at the first invalid entry")
+@click.option(
+    "--max-samples",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Example entry indices shown per kind of error",
+)
+def validate(har_file: Path, fail_fast: bool, max_samples: int) -> None:
+    """Validate a HAR file format and the shape of every entry."""
+    from har_analyzer.utils.validators import check_har_file
 
     try:
-        validate_har_file(har_file)
-        click.echo(f"✅ HAR file is valid: {har_file}")
+        report = check_har_file(har_file, fail_fast, max_samples)
     except Exception as e:
         click.echo(f"❌ HAR file validation failed: {e}", err=True)
         sys.exit(1)
 
+    if report.valid:
+        click.echo(f"✅ HAR file is valid: {har_file} ({report.entries_count} entries)")
+        return
+
+    checked = (
+        f"stopped at entry #{report.entries_count - 1}"
+        if report.stopped_early
+        else f"{report.invalid_entries} of {report.entries_count} entries invalid"
+    )
+    click.echo(f"❌ HAR file validation failed: {har_file} ({checked})", err=True)
+    click.echo(report.summary(), err=True)
+    sys.exit(1)
+
+
+@cli.command()
+@click.argument("output_file", type=click.Path(path_type=Path))
+@click.option(
+    "--entries",
+    "-n",
+    type=click.IntRange(min=0),
+    default=10_000,
+    show_default=True,
+    help="Number of entries",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed")
+@click.option(
+    "--body-fraction",
+    type=click.FloatRange(0, 1),
+    default=0.02,
+    show_default=True,
+    help="Share of entries with a base64 response body",
+)
+@click.option(
+    "--max-body-kb",
+    type=click.IntRange(min=0),
+    default=64,
+    show_default=True,
+    help="Largest response body in KB",
+)
+def generate_har(
+    output_file: Path, entries: int, seed: int, body_fraction: float, max_body_kb: int
+) -> None:
+    """Write a deterministic synthetic HAR file for benchmarks."""
+    from har_analyzer.benchmark import write_synthetic_har
+
+    write_synthetic_har(output_file, entries, seed, body_fraction, max_body_kb)
+    click.echo(f"✅ Wrote {entries:,} entries to: {output_file}")
+
+
+@cli.command()
+@click.option(
+    "--entries",
+    "-n",
+    default="1000,10000,100000",
+    show_default=True,
+    help="Comma-separated entry counts of synthetic files",
+)
+@click.option(
+    "--har",
+    "har_files",
+    multiple=True,
+    type=click.Path(exists=True, path_type=Path),
+    help="Also benchmark this HAR file (repeatable)",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed")
+@click.option(
+    "--work-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Keep generated files here and reuse them across runs",
+)
+@click.option(
+    "--format",
+    "-f",
+    "formats",
+    multiple=True,
+    type=click.Choice(EXPORT_FORMATS, case_sensitive=False),
+    help="Export format timed in the export stage (default: columnar, ndjson)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default="benchmark_results.json",
+    show_default=True,
+    help="JSON results file",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def benchmark(
+    entries: str,
+    har_files: tuple[Path, ...],
+    seed: int,
+    work_dir: Optional[Path],
+    formats: tuple[str, ...],
+    output: Path,
+    verbose: bool,
+) -> None:
+    """Time each pipeline stage and record its peak memory."""
+    from har_analyzer.benchmark import run_benchmark, write_results
+    from har_analyzer.benchmark.harness import DEFAULT_EXPORT_FORMATS
+
+    setup_logging(level="INFO" if verbose else "WARNING")
+
+    try:
+        sizes = [int(size) for size in entries.split(",") if size.strip()]
+    except ValueError:
+        raise click.BadParameter(
+            f"Expected comma-separated integers, got {entries!r}",
+            param_hint="--entries",
+        )
+
+    results = run_benchmark(
+        sizes,
+        work_dir=work_dir,
+        seed=seed,
+        har_files=har_files,
+        export_formats=formats or DEFAULT_EXPORT_FORMATS,
+    )
+    write_results(results, output)
+
+    for run in results["runs"]:
+        timings = ", ".join(
+            f"{name} {stage['seconds']:.2f}s" for name, stage in run["stages"].items()
+        )
+        icon = "✅" if run["target"]["met"] else "⚠️"
+        click.echo(
+            f"{icon} {run['entries']:,} entries: {run['total_seconds']:.2f}s, "
+            f"peak {run['peak_rss_mb']:.0f}MB ({timings})"
+        )
+    click.echo(f"📋 Results: {output}")
+
+
+@cli.command()
+@click.argument("target")
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(path_type=Path),
+    default="output",
+    help="Output directory for the summary and per-file artifacts",
+)
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True, path_type=Path),
+    help="Configuration file path",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of worker processes (default: available CPUs)",
+)
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice([*EXPORT_FORMATS, "none"], case_sensitive=False),
+    default="csv",
+    help="Per-file data export format (default: csv)",
+)
+@click.option(
+    "--memory-limit", type=int, default=1024, help="Memory limit in MB per worker"
+)
+@click.option(
+    "--no-cache", is_flag=True, help="Ignore the parse cache set in the configuration"
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def batch(
+    target: str,
+    output_dir: Path,
+    config: Optional[Path],
+    workers: Optional[int],
+    format: str,
+    memory_limit: int,
+    no_cache: bool,
+    verbose: bool,
+) -> None:
+    """Analyze every HAR file in a directory or matching a glob pattern.
+
+    TARGET: Directory containing .har (or .har.gz, .har.bz2, .har.xz) files,
+    or a glob such as "docs/**/*.har"
+    """
+    from har_analyzer.config import HARAnalyzerConfig
+    from har_analyzer.core.batch import BatchAnalyzer, discover_har_files
+
+    setup_logging(level="INFO" if verbose else "WARNING")
+
+    try:
+        files = discover_har_files(target)
+        analyzer_config = (
+            HARAnalyzerConfig.from_file(config) if config else HARAnalyzerConfig()
+        )
+        analyzer_config.output_dir = str(output_dir)
+        analyzer_config.max_memory_mb = memory_limit
+        if no_cache:
+            analyzer_config.cache_dir = None
+
+        batch_analyzer = BatchAnalyzer(analyzer_config, workers=workers)
+        click.echo(
+            f"🚀 Analyzing {len(files)} HAR files with {batch_analyzer.workers} workers..."
+        )
+
+        def report(row: dict[str, Any]) -> None:
+            icon = "✅" if row["status"] == "ok" else "❌"
+            click.echo(f"{icon} {row['file']}")
+
+        summary = batch_analyzer.analyze(
+            files,
+            output_dir,
+            export_format=None if format == "none" else format,
+            progress=report,
+        )
+    except HARAnalyzerError as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(
+        "\n" + summary.drop(columns=["artifacts"]).to_string(index=False, na_rep="-")
+    )
+    failed = int((summary["status"] != "ok").sum())
+    click.echo(
+        f"\n🎉 Batch complete: {len(summary) - failed} succeeded, {failed} failed"
+    )
+    click.echo(f"📋 Summary: {output_dir / 'batch_summary.csv'}")
+    if failed:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,13 @@
 """Configuration management for HAR Analyzer."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field
 
+from har_analyzer.utils.helpers import DEFAULT_RESOURCE_RULES
+
 
 class PerformanceThresholds(BaseModel):
     """Performance thresholds for grading."""
@@ -34,6 +36,25 @@ class ReportConfig(BaseModel):
     )
 
 
+class ResourceTypeRule(BaseModel):
+    """Rule assigning a resource type from MIME type and URL."""
+
+    name: str = Field(description="Resource type assigned on match")
+    mime_substrings: list[str] = Field(
+        default_factory=list, description="Substrings matched in the MIME type"
+    )
+    extensions: list[str] = Field(
+        default_factory=list, description="URL suffixes such as '.js' or '.min.js'"
+    )
+    url_substrings: list[str] = Field(
+        default_factory=list, description="Substrings matched in the URL"
+    )
+
+
+def _default_resource_types() -> list[ResourceTypeRule]:
+    return [ResourceTypeRule(**rule._asdict()) for rule in DEFAULT_RESOURCE_RULES]
+
+
 class HARAnalyzerConfig(BaseModel):
     """Main configuration for HAR Analyzer."""
 
@@ -43,6 +64,83 @@ class HARAnalyzerConfig(BaseModel):
     report: ReportConfig = Field(default_factory=ReportConfig)
     debug: bool = Field(default=False, description="Enable debug logging")
     max_memory_mb: int = Field(default=1024, description="Maximum memory usage in MB")
+    parse_workers: int = Field(
+        default=1, description="Processes used to parse large HAR files"
+    )
+    min_shard_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        gt=0,
+        description="Smallest share of a HAR file given to a parse worker",
+    )
+    cache_dir: Optional[str] = Field(
+        default=None, description="Directory caching parsed HAR data (None = off)"
+    )
+    cache_max_mb: int = Field(
+        default=1024, description="Maximum size of the parse cache in MB"
+    )
+    percentile_mode: Literal["auto", "exact", "sketch"] = Field(
+        default="auto",
+        description="Exact percentiles, mergeable sketches, or auto by input size",
+    )
+    percentile_relative_accuracy: float = Field(
+        default=0.01, gt=0, lt=1, description="Relative error of sketch percentiles"
+    )
+    analysis_sections: Optional[list[str]] = Field(
+        default=None,
+        description="Analysis sections to compute, by name or alias (None = all)",
+    )
+    extended_fields: bool = Field(
+        default=False,
+        description="Also extract server IP, connection, transfer and header "
+        "sizes, cache-control and content-encoding",
+    )
+    filter_expr: Optional[str] = Field(
+        default=None,
+        description="Keep only entries matching this expression, e.g. "
+        "'type in (API, JS) and status_code >= 400' (None = all)",
+    )
+    sample_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Analyze a uniform reservoir sample of this many entries "
+        "(None = all)",
+    )
+    sample_fraction: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=1,
+        description="Analyze each entry with this probability, unless "
+        "sample_size is set (None = all)",
+    )
+    sample_seed: int = Field(default=0, description="Random seed of the sample")
+    sample_confidence: float = Field(
+        default=0.95,
+        gt=0,
+        lt=1,
+        description="Confidence level of intervals estimated from a sample",
+    )
+    out_of_core: bool = Field(
+        default=False,
+        description="Spill parsed rows to disk instead of exceeding "
+        "max_memory_mb, and aggregate them chunk by chunk",
+    )
+    spill_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for spill files (None = system temporary directory)",
+    )
+    entry_fields: Optional[list[str]] = Field(
+        default=None,
+        description="Entry fields decoded while parsing, as dotted paths "
+        "(None = those the analysis reads)",
+    )
+    profile: bool = Field(
+        default=False,
+        description="Sample peak memory and per-entry timings of each stage",
+    )
+    resource_types: list[ResourceTypeRule] = Field(
+        default_factory=_default_resource_types,
+        description="Resource type rules, tried in order",
+    )
 
     @classmethod
     def from_file(cls, config_path: Path) -> "HARAnalyzerConfig":
@@ -1,7 +1,44 @@
 """Core modules package."""
 
-from har_analyzer.core.analyzer import HARAnalyzer
-from har_analyzer.core.metrics import PerformanceMetrics
-from har_analyzer.core.parser import HARParser
+import importlib
+from typing import Any
 
-__all__ = ["HARAnalyzer", "HARParser", "PerformanceMetrics"]
+# Classes are imported on first access, so importing a light submodule
+# such as har_analyzer.core.formats does not load pandas
+_LAZY_ATTRIBUTES = {
+    "BatchAnalyzer": "har_analyzer.core.batch",
+    "HARAnalyzer": "har_analyzer.core.analyzer",
+    "HARParser": "har_analyzer.core.parser",
+    "IncrementalAnalyzer": "har_analyzer.core.incremental",
+    "PerformanceMetrics": "har_analyzer.core.metrics",
+    "ReservoirSampler": "har_analyzer.core.sampling",
+    "QuantileSketch": "har_analyzer.core.sketch",
+    "RowFilter": "har_analyzer.core.filters",
+    "SpilledFrame": "har_analyzer.core.spill",
+    "TopKTracker": "har_analyzer.core.topk",
+}
+
+__all__ = [
+    "BatchAnalyzer",
+    "HARAnalyzer",
+    "HARParser",
+    "IncrementalAnalyzer",
+    "PerformanceMetrics",
+    "QuantileSketch",
+    "ReservoirSampler",
+    "RowFilter",
+    "SpilledFrame",
+    "TopKTracker",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -0,0 +1,617 @@
+"""Single-pass aggregation of parsed HAR data."""
+
+from collections import Counter
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import Any, Optional, Protocol
+
+import numpy as np
+import pandas as pd
+
+from har_analyzer.core.sketch import DEFAULT_RELATIVE_ACCURACY, QuantileSketch
+
+PERCENTILES = (50, 75, 90, 95, 99)
+
+TIMING_COLUMNS = (
+    "timing_blocked",
+    "timing_dns",
+    "timing_connect",
+    "timing_send",
+    "timing_wait",
+    "timing_receive",
+)
+
+# Resources above these limits are reported as performance issues
+SLOW_RESOURCE_MS = 2000
+LARGE_RESOURCE_KB = 1024
+
+# Right-closed response time bins of the time distribution
+TIME_BIN_EDGES = (0, 100, 500, 1000, 2000, float("inf"))
+TIME_BIN_LABELS = ("<100ms", "100-500ms", "500ms-1s", "1s-2s", ">2s")
+
+PERCENTILE_MODES = ("auto", "exact", "sketch")
+
+# In "auto" mode, inputs with more rows than this use sketches
+EXACT_PERCENTILE_MAX_ROWS = 1_000_000
+
+SUMMARY_COLUMNS = [
+    "requests_count",
+    "avg_response_time_ms",
+    "max_response_time_ms",
+    "min_response_time_ms",
+    "std_response_time_ms",
+    "p90_response_time_ms",
+    "p95_response_time_ms",
+    "total_size_kb",
+    "avg_size_kb",
+    "max_size_kb",
+    "min_size_kb",
+    "success_rate_percent",
+]
+
+
+def quantiles(values: np.ndarray, qs: Sequence[float]) -> np.ndarray:
+    """Linearly interpolated quantiles from a single partition.
+
+    Matches pandas' default ``linear`` interpolation and skips NaN values,
+    but only partially orders the data around the needed ranks instead of
+    sorting it.
+
+    Args:
+        values: Values to summarize
+        qs: Quantiles in [0, 1]
+
+    Returns:
+        Quantile values (NaN when there are no valid values)
+    """
+    q = np.asarray(qs, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return np.full(q.shape, np.nan)
+    position = q * (len(values) - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, len(values) - 1)
+    ranked = np.partition(values, np.unique(np.r_[lower, upper]))
+    low = ranked[lower].astype(np.float64)
+    high = ranked[upper].astype(np.float64)
+    return np.asarray(low + (high - low) * (position - lower))
+
+
+def resolve_percentile_mode(mode: str, rows: int) -> str:
+    """Resolve a configured percentile mode for an input size.
+
+    Args:
+        mode: "auto", "exact" or "sketch"
+        rows: Number of rows to aggregate
+
+    Returns:
+        "exact" or "sketch"
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode not in PERCENTILE_MODES:
+        raise ValueError(f"Unknown percentile mode: {mode}")
+    if mode == "auto":
+        return "sketch" if rows > EXACT_PERCENTILE_MAX_ROWS else "exact"
+    return mode
+
+
+def time_bin_counts(response: np.ndarray) -> np.ndarray:
+    """Count response times per ``TIME_BIN_LABELS`` bin, skipping NaN.
+
+    Args:
+        response: Response times in milliseconds
+
+    Returns:
+        Count per bin, in label order
+    """
+    bins = np.searchsorted(TIME_BIN_EDGES, response, side="left") - 1
+    binned = bins[(bins >= 0) & (bins < len(TIME_BIN_LABELS))]
+    return np.bincount(binned, minlength=len(TIME_BIN_LABELS))
+
+
+def _value_counts(series: pd.Series) -> dict[Any, int]:
+    """Count values like ``Series.value_counts`` with one bincount."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series, sort=False)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    order = np.argsort(-counts, kind="stable")
+    # Python scalars, so results can be serialized as JSON
+    keys = uniques.tolist()
+    return {keys[i]: int(counts[i]) for i in order.tolist()}
+
+
+# Attributes computed on first access, by the method that computes them
+_LAZY_ATTRIBUTES = {
+    **dict.fromkeys(
+        (
+            "summary_by_type",
+            "type_sizes",
+            "type_sketches",
+            "html_min_response_ms",
+            "largest_image_response_ms",
+        ),
+        "_aggregate_types",
+    ),
+    **dict.fromkeys(("timing_breakdown", "timing_sketches"), "_aggregate_timings"),
+    **dict.fromkeys(
+        ("type_counts", "status_counts", "method_counts", "time_distribution"),
+        "_aggregate_counts",
+    ),
+}
+
+
+class Aggregates(Protocol):
+    """Aggregates of parsed HAR data, as read by ``PerformanceMetrics``.
+
+    Implemented by ``FrameAggregates``, the snapshots of
+    ``RunningAggregates`` and ``SampledAggregates``.
+    """
+
+    percentile_mode: str
+    total_requests: int
+    total_time_ms: float
+    total_size_kb: float
+    avg_response_time_ms: float
+    percentiles: dict[str, float]
+    slow_count: int
+    large_count: int
+    failed_count: int
+    summary_by_type: pd.DataFrame
+    type_sizes: dict[Any, float]
+    html_min_response_ms: Optional[float]
+    largest_image_response_ms: Optional[float]
+    timing_breakdown: dict[str, dict[str, float]]
+    type_counts: dict[Any, int]
+    status_counts: dict[Any, int]
+    method_counts: dict[Any, int]
+    time_distribution: dict[str, int]
+
+
+class FrameAggregates:
+    """Everything the analysis needs from the parsed rows, computed once.
+
+    Totals, overall percentiles and issue counts are computed up front.
+    The per-type summary, the timing breakdown and the value counts are
+    each computed on first access to one of their attributes, so callers
+    that only need a grade do not pay for the rest.
+
+    Rows are grouped by resource type with one stable integer sort of the
+    group codes, so every group is a contiguous segment in document order:
+    per-type sums, extremes and counts come from ``np.*.reduceat`` and all
+    quantiles of a group come from a single partition of its segment. NaN
+    values are skipped like pandas does.
+
+    In sketch mode, percentiles are instead read from mergeable
+    ``QuantileSketch`` objects (overall, per type and per timing phase),
+    which are kept on the instance so partial results can be combined.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        percentile_mode: str = "exact",
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """Aggregate a parsed HAR DataFrame.
+
+        Args:
+            df: DataFrame with HAR data
+            percentile_mode: "exact", "sketch" or "auto" (exact unless the
+                frame has more than ``EXACT_PERCENTILE_MAX_ROWS`` rows)
+            relative_accuracy: Relative error bound of sketch percentiles
+        """
+        self.percentile_mode = resolve_percentile_mode(percentile_mode, len(df))
+        self.relative_accuracy = relative_accuracy
+        self.response_sketch: Optional[QuantileSketch] = None
+
+        self._df = df
+        self.total_requests = len(df)
+        response = df["response_time_ms"].to_numpy(dtype=np.float64, na_value=np.nan)
+        size = df["size_kb"].to_numpy(dtype=np.float64, na_value=np.nan)
+        status = df["status_code"].to_numpy()
+        self._response, self._size, self._status = response, size, status
+
+        valid_response = int((~np.isnan(response)).sum())
+        self.total_time_ms = float(np.nansum(response))
+        self.total_size_kb = float(np.nansum(size))
+        self.avg_response_time_ms = (
+            self.total_time_ms / valid_response if valid_response else np.nan
+        )
+
+        values, self.response_sketch = self._quantiles(
+            response, [p / 100 for p in PERCENTILES]
+        )
+        self.percentiles = {f"p{p}": float(v) for p, v in zip(PERCENTILES, values)}
+
+        self.slow_count = int((response > SLOW_RESOURCE_MS).sum())
+        self.large_count = int((size > LARGE_RESOURCE_KB).sum())
+        self.failed_count = int((status >= 400).sum())
+
+    def __getattr__(self, name: str) -> Any:
+        method = _LAZY_ATTRIBUTES.get(name)
+        if method is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        getattr(self, method)()
+        return self.__dict__[name]
+
+    def _quantiles(
+        self, values: np.ndarray, qs: Sequence[float]
+    ) -> tuple[np.ndarray, Optional[QuantileSketch]]:
+        """Compute quantiles in the configured mode.
+
+        Returns:
+            Tuple of (quantile values, sketch or None in exact mode)
+        """
+        if self.percentile_mode == "exact":
+            return quantiles(values, qs), None
+        sketch = QuantileSketch(self.relative_accuracy).add(values)
+        return np.array(sketch.quantiles(qs)), sketch
+
+    def _aggregate_types(self) -> None:
+        """Compute per resource type statistics."""
+        df, response, size, status = self._df, self._response, self._size, self._status
+        self.html_min_response_ms: Optional[float] = None
+        self.largest_image_response_ms: Optional[float] = None
+        self.type_sizes: dict[Any, float] = {}
+        self.type_sketches: dict[Any, QuantileSketch] = {}
+        if not len(df):
+            self.summary_by_type = pd.DataFrame(columns=["type", *SUMMARY_COLUMNS])
+            return
+
+        codes, uniques = pd.factorize(df["type"], sort=True)
+        # Small integer keys make the stable sort a linear-time radix sort
+        key_type = np.int16 if len(uniques) < np.iinfo(np.int16).max else np.int64
+        order = np.argsort(codes.astype(key_type), kind="stable")
+        codes = codes[order]
+        response = response[order]
+        size = size[order]
+
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        ends = np.append(starts[1:], len(codes))
+        types = uniques.take(codes[starts])
+        counts = ends - starts
+
+        response_nan = np.isnan(response)
+        response_valid = np.add.reduceat((~response_nan).astype(np.int64), starts)
+        response_sum = np.add.reduceat(np.where(response_nan, 0, response), starts)
+        size_nan = np.isnan(size)
+        size_valid = np.add.reduceat((~size_nan).astype(np.int64), starts)
+        size_sum = np.add.reduceat(np.where(size_nan, 0, size), starts)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            response_mean = response_sum / response_valid
+            deviation = np.where(
+                response_nan, 0, response - np.repeat(response_mean, counts)
+            )
+            response_std = np.sqrt(
+                np.add.reduceat(deviation * deviation, starts) / (response_valid - 1)
+            )
+            size_mean = size_sum / size_valid
+        response_std[response_valid < 2] = np.nan
+
+        tail = np.empty((len(starts), 2))
+        for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            tail[i], sketch = self._quantiles(response[start:end], [0.90, 0.95])
+            if sketch is not None:
+                self.type_sketches[types[i]] = sketch
+        success = np.add.reduceat((status[order] == 200).astype(np.int64), starts)
+
+        summary = pd.DataFrame(
+            {
+                "requests_count": counts,
+                "avg_response_time_ms": response_mean,
+                "max_response_time_ms": np.fmax.reduceat(response, starts),
+                "min_response_time_ms": np.fmin.reduceat(response, starts),
+                "std_response_time_ms": response_std,
+                "p90_response_time_ms": tail[:, 0],
+                "p95_response_time_ms": tail[:, 1],
+                "total_size_kb": size_sum,
+                "avg_size_kb": size_mean,
+                "max_size_kb": np.fmax.reduceat(size, starts),
+                "min_size_kb": np.fmin.reduceat(size, starts),
+                "success_rate_percent": success / counts * 100,
+            },
+            columns=SUMMARY_COLUMNS,
+            index=pd.Index(types, name="type"),
+        )
+        self.summary_by_type = summary.round(2).reset_index()
+        self.type_sizes = dict(zip(types, size_sum.tolist()))
+
+        # Core Web Vitals approximations
+        segment_of = dict(zip(types, zip(starts.tolist(), ends.tolist())))
+        if "HTML" in segment_of:
+            start, end = segment_of["HTML"]
+            self.html_min_response_ms = float(np.fmin.reduce(response[start:end]))
+        if "Image" in segment_of:
+            start, end = segment_of["Image"]
+            image_size = size[start:end]
+            if not size_nan[start:end].all():
+                # Segments keep document order, so this is the first largest
+                largest = int(np.nanargmax(image_size))
+                self.largest_image_response_ms = float(response[start + largest])
+
+    def _aggregate_counts(self) -> None:
+        """Count requests per type, status code, method and time bin."""
+        df = self._df
+        self.type_counts = _value_counts(df["type"])
+        self.status_counts = _value_counts(df["status_code"])
+        self.method_counts = _value_counts(df["method"])
+
+        counts = time_bin_counts(self._response)
+        order = np.argsort(-counts, kind="stable")
+        self.time_distribution = {TIME_BIN_LABELS[i]: int(counts[i]) for i in order}
+
+    def _aggregate_timings(self) -> None:
+        """Compute timing phase statistics, one partition per phase."""
+        df = self._df
+        self.timing_sketches: dict[str, QuantileSketch] = {}
+        self.timing_breakdown: dict[str, dict[str, float]] = {
+            "averages": {},
+            "medians": {},
+            "p95": {},
+            "totals": {},
+        }
+        for column in TIMING_COLUMNS:
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            # Negative values mean "not applicable" in HAR timings
+            values = np.where(values < 0, 0, values)
+            valid = int((~np.isnan(values)).sum())
+            (median, p95), sketch = self._quantiles(values, [0.5, 0.95])
+            if sketch is not None:
+                self.timing_sketches[column] = sketch
+            total = float(np.nansum(values))
+            self.timing_breakdown["averages"][column] = (
+                total / valid if valid else np.nan
+            )
+            self.timing_breakdown["medians"][column] = float(median)
+            self.timing_breakdown["p95"][column] = float(p95)
+            self.timing_breakdown["totals"][column] = total
+
+
+def _ordered_counts(counts: Counter[Any]) -> dict[Any, int]:
+    """Order counts descending, ties in order of first appearance."""
+    return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+
+class _TypeStats:
+    """Running statistics of one resource type."""
+
+    def __init__(self, relative_accuracy: float, track_quantiles: bool = True):
+        self.track_quantiles = track_quantiles
+        self.count = 0
+        self.success = 0
+        # Response times: valid count, mean and sum of squared deviations
+        self.response_valid = 0
+        self.response_mean = 0.0
+        self.response_m2 = 0.0
+        self.response_max = np.nan
+        self.response_min = np.nan
+        self.response_sketch = QuantileSketch(relative_accuracy)
+        self.size_valid = 0
+        self.size_sum = 0.0
+        self.size_max = np.nan
+        self.size_min = np.nan
+        # Response time of the first of the largest resources
+        self.largest_size = -np.inf
+        self.largest_size_response = np.nan
+
+    def update(
+        self, response: np.ndarray, size: np.ndarray, status: np.ndarray
+    ) -> None:
+        self.count += len(response)
+        self.success += int((status == 200).sum())
+
+        valid = response[~np.isnan(response)]
+        if len(valid):
+            # Chan et al. pairwise update, stable for long-running totals
+            mean = float(valid.mean())
+            m2 = float(((valid - mean) ** 2).sum())
+            total = self.response_valid + len(valid)
+            delta = mean - self.response_mean
+            self.response_m2 += (
+                m2 + delta * delta * self.response_valid * len(valid) / total
+            )
+            self.response_mean += delta * len(valid) / total
+            self.response_valid = total
+            self.response_max = float(np.fmax(self.response_max, valid.max()))
+            self.response_min = float(np.fmin(self.response_min, valid.min()))
+            if self.track_quantiles:
+                self.response_sketch.add(valid)
+
+        size_nan = np.isnan(size)
+        if not size_nan.all():
+            valid = size[~size_nan]
+            self.size_valid += len(valid)
+            self.size_sum += float(valid.sum())
+            self.size_max = float(np.fmax(self.size_max, valid.max()))
+            self.size_min = float(np.fmin(self.size_min, valid.min()))
+            largest = int(np.nanargmax(size))
+            if size[largest] > self.largest_size:
+                self.largest_size = float(size[largest])
+                self.largest_size_response = float(response[largest])
+
+    def summary(self) -> list[float]:
+        """Row of ``SUMMARY_COLUMNS`` values."""
+        p90, p95 = self.response_sketch.quantiles([0.90, 0.95])
+        valid = self.response_valid
+        return [
+            self.count,
+            self.response_mean if valid else np.nan,
+            self.response_max,
+            self.response_min,
+            np.sqrt(self.response_m2 / (valid - 1)) if valid > 1 else np.nan,
+            p90,
+            p95,
+            self.size_sum,
+            self.size_sum / self.size_valid if self.size_valid else np.nan,
+            self.size_max,
+            self.size_min,
+            self.success / self.count * 100,
+        ]
+
+
+class RunningAggregates:
+    """Aggregates of parsed HAR rows, updated one chunk at a time.
+
+    Keeps counts, sums, extremes and quantile sketches instead of the rows,
+    so an update costs time proportional to the chunk and a snapshot costs
+    time proportional to the number of resource types. Percentiles come
+    from mergeable sketches, as in the "sketch" mode of ``FrameAggregates``.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        track_quantiles: bool = True,
+    ):
+        """Initialize empty aggregates.
+
+        Args:
+            relative_accuracy: Relative error bound of sketch percentiles
+            track_quantiles: Update the quantile sketches; without them
+                every percentile of a snapshot is NaN
+        """
+        self.relative_accuracy = relative_accuracy
+        self.track_quantiles = track_quantiles
+        self.total_requests = 0
+        self.total_time_ms = 0.0
+        self.total_size_kb = 0.0
+        self.slow_count = 0
+        self.large_count = 0
+        self.failed_count = 0
+        self._response_valid = 0
+        self.response_sketch = QuantileSketch(relative_accuracy)
+        self._types: dict[Any, _TypeStats] = {}
+        self._type_counts: Counter[Any] = Counter()
+        self._status_counts: Counter[Any] = Counter()
+        self._method_counts: Counter[Any] = Counter()
+        self._time_bins = np.zeros(len(TIME_BIN_LABELS), dtype=np.int64)
+        self._timing_totals = dict.fromkeys(TIMING_COLUMNS, 0.0)
+        self._timing_valid = dict.fromkeys(TIMING_COLUMNS, 0)
+        self.timing_sketches = {
+            column: QuantileSketch(relative_accuracy) for column in TIMING_COLUMNS
+        }
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Add a chunk of parsed rows.
+
+        Args:
+            df: DataFrame chunk with HAR data
+        """
+        if not len(df):
+            return
+
+        response = df["response_time_ms"].to_numpy(dtype=np.float64, na_value=np.nan)
+        size = df["size_kb"].to_numpy(dtype=np.float64, na_value=np.nan)
+        status = df["status_code"].to_numpy()
+
+        self.total_requests += len(df)
+        self._response_valid += int((~np.isnan(response)).sum())
+        self.total_time_ms += float(np.nansum(response))
+        self.total_size_kb += float(np.nansum(size))
+        if self.track_quantiles:
+            self.response_sketch.add(response)
+        self.slow_count += int((response > SLOW_RESOURCE_MS).sum())
+        self.large_count += int((size > LARGE_RESOURCE_KB).sum())
+        self.failed_count += int((status >= 400).sum())
+
+        self._type_counts.update(_value_counts(df["type"]))
+        self._status_counts.update(_value_counts(df["status_code"]))
+        self._method_counts.update(_value_counts(df["method"]))
+        self._time_bins += time_bin_counts(response)
+
+        codes, uniques = pd.factorize(df["type"])
+        for code, resource_type in enumerate(uniques):
+            mask = codes == code
+            stats = self._types.get(resource_type)
+            if stats is None:
+                stats = self._types[resource_type] = _TypeStats(
+                    self.relative_accuracy, self.track_quantiles
+                )
+            stats.update(response[mask], size[mask], status[mask])
+
+        for column in TIMING_COLUMNS:
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            # Negative values mean "not applicable" in HAR timings
+            values = np.where(values < 0, 0, values)
+            self._timing_totals[column] += float(np.nansum(values))
+            self._timing_valid[column] += int((~np.isnan(values)).sum())
+            if self.track_quantiles:
+                self.timing_sketches[column].add(values)
+
+    def snapshot(self) -> SimpleNamespace:
+        """Freeze the current state.
+
+        Returns:
+            Object with the attributes of ``FrameAggregates`` used by
+            ``PerformanceMetrics``, unaffected by later updates
+        """
+        types = sorted(self._types)
+        stats = [self._types[resource_type] for resource_type in types]
+        summary = pd.DataFrame(
+            [row.summary() for row in stats],
+            columns=SUMMARY_COLUMNS,
+            index=pd.Index(types, name="type"),
+        )
+        summary["requests_count"] = summary["requests_count"].astype(np.int64)
+
+        html = self._types.get("HTML")
+        image = self._types.get("Image")
+
+        timing_breakdown: dict[str, dict[str, float]] = {
+            "averages": {},
+            "medians": {},
+            "p95": {},
+            "totals": {},
+        }
+        for column in TIMING_COLUMNS:
+            valid, total = self._timing_valid[column], self._timing_totals[column]
+            median, p95 = self.timing_sketches[column].quantiles([0.5, 0.95])
+            timing_breakdown["averages"][column] = total / valid if valid else np.nan
+            timing_breakdown["medians"][column] = median
+            timing_breakdown["p95"][column] = p95
+            timing_breakdown["totals"][column] = total
+
+        time_order = np.argsort(-self._time_bins, kind="stable")
+        values = self.response_sketch.quantiles([p / 100 for p in PERCENTILES])
+        return SimpleNamespace(
+            percentile_mode="sketch",
+            total_requests=self.total_requests,
+            total_time_ms=self.total_time_ms,
+            total_size_kb=self.total_size_kb,
+            avg_response_time_ms=(
+                self.total_time_ms / self._response_valid
+                if self._response_valid
+                else np.nan
+            ),
+            percentiles={f"p{p}": v for p, v in zip(PERCENTILES, values)},
+            slow_count=self.slow_count,
+            large_count=self.large_count,
+            failed_count=self.failed_count,
+            summary_by_type=summary.round(2).reset_index(),
+            type_sizes={t: row.size_sum for t, row in zip(types, stats)},
+            html_min_response_ms=(
+                html.response_min
+                if html is not None and not np.isnan(html.response_min)
+                else None
+            ),
+            largest_image_response_ms=(
+                image.largest_size_response
+                if image is not None and image.size_valid
+                else None
+            ),
+            timing_breakdown=timing_breakdown,
+            type_counts=_ordered_counts(self._type_counts),
+            status_counts=_ordered_counts(self._status_counts),
+            method_counts=_ordered_counts(self._method_counts),
+            time_distribution={
+                TIME_BIN_LABELS[i]: int(self._time_bins[i]) for i in time_order
+            },
+        )
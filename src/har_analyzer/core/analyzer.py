@@ -1,15 +1,29 @@
 """Main HAR analyzer module."""
 
+import functools
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import pandas as pd
 
 from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.aggregates import Aggregates, RunningAggregates
+from har_analyzer.core.cache import ParseCache
+from har_analyzer.core.export import (
+    write_columnar,
+    write_columnar_chunks,
+    write_csv_frames,
+    write_ndjson,
+    write_ndjson_frames,
+)
 from har_analyzer.core.metrics import PerformanceMetrics
 from har_analyzer.core.parser import HARParser
+from har_analyzer.core.results import AnalysisResults, resolve_sections
+from har_analyzer.core.spill import SpilledFrame
+from har_analyzer.core.topk import TopKTracker
 from har_analyzer.utils import (
     HARAnalyzerError,
+    StageProfiler,
     get_logger,
     get_memory_usage,
 )
@@ -23,42 +37,103 @@ class HARAnalyzer:
 
         Args:
             config: Configuration object, uses default if None
+
+        Raises:
+            ConfigurationError: If an analysis section is unknown or the
+                filter expression is invalid
         """
         self.config = config or HARAnalyzerConfig()
         self.logger = get_logger(__name__)
+        self.sections = resolve_sections(self.config.analysis_sections)
+        self.profiler = StageProfiler(self.config.profile)
 
         # Initialize components
-        self.parser = HARParser(memory_limit_mb=self.config.max_memory_mb)
-        self.metrics = PerformanceMetrics(self.config.thresholds)
+        self.parser = HARParser(
+            memory_limit_mb=self.config.max_memory_mb,
+            resource_rules=self.config.resource_types,
+            workers=self.config.parse_workers,
+            min_shard_bytes=self.config.min_shard_bytes,
+            cache=(
+                ParseCache(Path(self.config.cache_dir), self.config.cache_max_mb)
+                if self.config.cache_dir
+                else None
+            ),
+            profiler=self.profiler,
+            entry_fields=self.config.entry_fields,
+            extended=self.config.extended_fields,
+            filter_expr=self.config.filter_expr,
+            sample_size=self.config.sample_size,
+            sample_fraction=self.config.sample_fraction,
+            sample_seed=self.config.sample_seed,
+            spill_dir=Path(self.config.spill_dir) if self.config.spill_dir else None,
+        )
+        self.metrics = PerformanceMetrics(
+            self.config.thresholds,
+            percentile_mode=self.config.percentile_mode,
+            relative_accuracy=self.config.percentile_relative_accuracy,
+        )
 
         # Analysis results
         self.data: Optional[pd.DataFrame] = None
+        # Rows of an out-of-core analysis that did not fit in memory
+        self.spilled: Optional[SpilledFrame] = None
         self.metadata: Optional[dict[str, Any]] = None
-        self.analysis_results: Optional[dict[str, Any]] = None
+        self.analysis_results: Optional[AnalysisResults] = None
 
-    def analyze_file(self, har_file_path: Path) -> dict[str, Any]:
+    def analyze_file(
+        self, har_file_path: Path, filter_expr: Optional[str] = None
+    ) -> AnalysisResults:
         """Analyze a HAR file and generate comprehensive results.
 
+        With ``config.out_of_core``, rows are spilled to disk rather than
+        exceeding ``config.max_memory_mb``; if any were, the aggregates are
+        computed chunk by chunk, with sketch percentiles, and ``data`` is
+        None while ``spilled`` holds the rows.
+
         Args:
             har_file_path: Path to HAR file
+            filter_expr: Analyze only entries matching this expression,
+                e.g. ``'type in (API, JS) and status_code >= 400'``;
+                defaults to ``config.filter_expr``
 
         Returns:
-            Dictionary with analysis results
+            Mapping with analysis results; each section is computed when it
+            is first accessed
 
         Raises:
             HARAnalyzerError: If analysis fails
         """
         self.logger.info(f"Starting analysis of HAR file: {har_file_path}")
+        # Earlier results keep the profile of their own analysis
+        self.profiler = self.parser.profiler = StageProfiler(self.config.profile)
 
         try:
+            self.parser.set_filter(
+                filter_expr if filter_expr is not None else self.config.filter_expr
+            )
+
             # Parse HAR file
             self.logger.info("Parsing HAR file...")
-            self.data = self.parser.parse_file(har_file_path)
+            if self.spilled is not None:
+                self.spilled.close()
+                self.spilled = None
+            if self.config.out_of_core and not self.parser.sampling:
+                frames = self.parser.parse_chunks(har_file_path)
+                if frames.spilled:
+                    self.data, self.spilled = None, frames
+                else:
+                    self.data = frames.tail
+                    frames.close()
+            else:
+                self.data = self.parser.parse_file(har_file_path)
             self.metadata = self.parser.get_metadata()
 
             # Perform analysis
             self.logger.info("Calculating performance metrics...")
-            results = self._perform_analysis()
+            if self.spilled is not None:
+                results = self._perform_chunked_analysis(self.spilled)
+            else:
+                results = self._perform_analysis()
 
             self.logger.info("Analysis completed successfully")
             self.analysis_results = results
@@ -68,135 +143,236 @@ class HARAnalyzer:
             self.logger.error(f"Analysis failed: {e}")
             raise HARAnalyzerError(f"Analysis failed: {e}")
 
-    def _perform_analysis(self) -> dict[str, Any]:
-        """Perform comprehensive performance analysis.
+    def _perform_analysis(self) -> AnalysisResults:
+        """Prepare the analysis results for the current data.
+
+        Sections are computed on first access, and only the sections selected
+        by ``config.analysis_sections`` are available.
 
         Returns:
-            Dictionary with analysis results
+            Mapping of section name to analysis results
         """
         if self.data is None:
             raise HARAnalyzerError("No data available for analysis")
 
-        # Basic statistics
-        total_requests = len(self.data)
-        total_time = self.data["response_time_ms"].sum()
-        total_size = self.data["size_kb"].sum()
-        avg_response = self.data["response_time_ms"].mean()
-
-        self.logger.debug(
-            f"Basic stats: {total_requests} requests, "
-            f"{total_time/1000:.1f}s total time, "
-            f"{total_size/1024:.1f}MB total size"
+        # Bind the current data so results stay valid after another analysis
+        data, metrics, profiler = self.data, self.metrics, self.profiler
+        totals = self.parser.sample_totals
+        top_n = self.config.report.top_n_resources
+
+        # Aggregates are shared by all sections and computed at most once
+        @functools.cache
+        def aggregates() -> Aggregates:
+            with profiler.stage("metrics.aggregate", rows=len(data)):
+                return metrics.aggregate(data, totals)
+
+        return self._build_results(
+            data,
+            self.metadata,
+            aggregates,
+            lambda: metrics.get_top_resources_by_metric(
+                data, ["response_time_ms", "size_kb"], top_n
+            ),
         )
 
-        # Performance metrics
-        summary_by_type = self.metrics.calculate_summary_by_type(self.data)
-        percentiles = self.metrics.calculate_percentiles(self.data)
-        grade, emoji, explanation = self.metrics.calculate_performance_grade(self.data)
+    def _perform_chunked_analysis(self, frames: SpilledFrame) -> AnalysisResults:
+        """Prepare the analysis results for spilled data, one chunk at a time.
+
+        Chunks are memory-mapped in turn and folded into running aggregates
+        and top-K heaps in a single sequential pass.
 
-        # Top resources
-        top_slow = self.metrics.get_top_resources(
-            self.data, "response_time_ms", self.config.report.top_n_resources
+        Args:
+            frames: Parsed rows, partly spilled to disk
+
+        Returns:
+            Mapping of section name to analysis results
+        """
+        running = RunningAggregates(self.config.percentile_relative_accuracy)
+        tracker = TopKTracker(
+            ("response_time_ms", "size_kb"), self.config.report.top_n_resources
         )
-        top_large = self.metrics.get_top_resources(
-            self.data, "size_kb", self.config.report.top_n_resources
+        with self.profiler.stage("metrics.aggregate", rows=len(frames)):
+            for chunk in frames.chunks():
+                running.update(chunk)
+                tracker.add_frame(chunk)
+            aggregates = running.snapshot()
+            top_resources = tracker.result()
+
+        return self._build_results(
+            frames.columns,
+            self.metadata,
+            lambda: aggregates,
+            lambda: top_resources,
         )
 
-        # Advanced analysis
-        core_web_vitals = self.metrics.calculate_core_web_vitals(self.data)
-        timing_breakdown = self.metrics.analyze_timing_breakdown(self.data)
-        performance_issues = self.metrics.detect_performance_issues(self.data)
+    def _build_results(
+        self,
+        data: pd.DataFrame,
+        metadata: Optional[dict[str, Any]],
+        aggregates: Callable[[], Aggregates],
+        top_resources: Callable[[], dict[str, dict[Any, pd.DataFrame]]],
+    ) -> AnalysisResults:
+        """Assemble the result sections from aggregates of the data.
 
-        # Memory usage tracking
-        memory_usage = get_memory_usage()
+        Args:
+            data: DataFrame the aggregates describe
+            metadata: HAR metadata
+            aggregates: Returns the aggregates of the data
+            top_resources: Returns the top resources per type, keyed by
+                "response_time_ms" and "size_kb"
 
-        return {
-            "metadata": self.metadata,
-            "basic_stats": {
-                "total_requests": total_requests,
-                "total_time_ms": total_time,
-                "total_size_kb": total_size,
-                "avg_response_time_ms": avg_response,
-                "memory_usage_mb": memory_usage,
-            },
-            "performance_grade": {
-                "grade": grade,
-                "emoji": emoji,
-                "explanation": explanation,
-            },
-            "summary_by_type": summary_by_type,
-            "percentiles": percentiles,
-            "top_resources": {
-                "slowest": top_slow,
-                "largest": top_large,
-            },
-            "core_web_vitals": core_web_vitals,
-            "timing_breakdown": timing_breakdown,
-            "performance_issues": performance_issues,
-            "resource_breakdown": self._calculate_resource_breakdown(),
+        Returns:
+            Mapping of section name to analysis results
+        """
+        metrics, profiler = self.metrics, self.profiler
+
+        def basic_stats() -> dict[str, Any]:
+            stats = aggregates()
+            self.logger.debug(
+                f"Basic stats: {stats.total_requests} requests, "
+                f"{stats.total_time_ms/1000:.1f}s total time, "
+                f"{stats.total_size_kb/1024:.1f}MB total size"
+            )
+            return {
+                "total_requests": stats.total_requests,
+                "total_time_ms": stats.total_time_ms,
+                "total_size_kb": stats.total_size_kb,
+                "avg_response_time_ms": stats.avg_response_time_ms,
+                "percentile_mode": stats.percentile_mode,
+                "memory_usage_mb": get_memory_usage(),
+            }
+
+        def performance_grade() -> dict[str, str]:
+            grade, emoji, explanation = metrics.calculate_performance_grade(
+                data, aggregates()
+            )
+            return {"grade": grade, "emoji": emoji, "explanation": explanation}
+
+        def slowest_and_largest() -> dict[str, dict[Any, pd.DataFrame]]:
+            top = top_resources()
+            return {"slowest": top["response_time_ms"], "largest": top["size_kb"]}
+
+        def sampling() -> Optional[dict[str, Any]]:
+            info = (metadata or {}).get("sampling")
+            if info is None:
+                return None
+            intervals = metrics.calculate_confidence_intervals(
+                data, aggregates(), self.config.sample_confidence
+            )
+            return {**info, "confidence_intervals": intervals}
+
+        def timed(section: str, build: Callable[[], Any]) -> Callable[[], Any]:
+            def run() -> Any:
+                with profiler.stage(f"metrics.{section}"):
+                    return build()
+
+            return run
+
+        builders: dict[str, Callable[[], Any]] = {
+            "metadata": lambda: metadata,
+            "basic_stats": basic_stats,
+            "performance_grade": performance_grade,
+            "summary_by_type": lambda: metrics.calculate_summary_by_type(
+                data, aggregates()
+            ),
+            "percentiles": lambda: metrics.calculate_percentiles(data, aggregates()),
+            "top_resources": slowest_and_largest,
+            "core_web_vitals": lambda: metrics.calculate_core_web_vitals(
+                data, aggregates()
+            ),
+            "timing_breakdown": lambda: metrics.analyze_timing_breakdown(
+                data, aggregates()
+            ),
+            "performance_issues": lambda: metrics.detect_performance_issues(
+                data, aggregates()
+            ),
+            "resource_breakdown": lambda: self._calculate_resource_breakdown(
+                aggregates()
+            ),
+            "sampling": sampling,
+        }
+        builders = {
+            section: timed(section, build) for section, build in builders.items()
         }
+        # Stages recorded so far; to_dict() builds this section last
+        builders["profile"] = profiler.summary
+        return AnalysisResults(builders, self.sections)
 
-    def _calculate_resource_breakdown(self) -> dict[str, Any]:
+    def _calculate_resource_breakdown(
+        self, aggregates: Optional[Aggregates] = None
+    ) -> dict[str, Any]:
         """Calculate detailed resource breakdown.
 
+        Args:
+            aggregates: Precomputed aggregates of the analyzed data
+
         Returns:
             Dictionary with resource breakdown data
         """
-        if self.data is None:
-            return {}
-
-        # By resource type
-        type_counts = self.data["type"].value_counts().to_dict()
-        type_sizes = self.data.groupby("type")["size_kb"].sum().to_dict()
-
-        # By status code
-        status_counts = self.data["status_code"].value_counts().to_dict()
-
-        # By method
-        method_counts = self.data["method"].value_counts().to_dict()
-
-        # Time distribution
-        time_bins = pd.cut(
-            self.data["response_time_ms"],
-            bins=[0, 100, 500, 1000, 2000, float("inf")],
-            labels=["<100ms", "100-500ms", "500ms-1s", "1s-2s", ">2s"],
-        )
-        time_distribution = time_bins.value_counts().to_dict()
-
+        if aggregates is None:
+            if self.data is None:
+                return {}
+            aggregates = self.metrics.aggregate(self.data)
         return {
             "by_type": {
-                "counts": type_counts,
-                "sizes_kb": type_sizes,
+                "counts": aggregates.type_counts,
+                "sizes_kb": aggregates.type_sizes,
             },
-            "by_status": status_counts,
-            "by_method": method_counts,
-            "time_distribution": time_distribution,
+            "by_status": aggregates.status_counts,
+            "by_method": aggregates.method_counts,
+            "time_distribution": aggregates.time_distribution,
         }
 
     def export_data(self, output_file: Path, format: str = "csv") -> None:
         """Export analyzed data to file.
 
+        Spilled data is written chunk by chunk in the 'csv', 'ndjson' and
+        'columnar' formats; the other formats load all rows into memory first.
+
         Args:
             output_file: Output file path
-            format: Export format ('csv', 'json', 'excel')
+            format: Export format ('csv', 'json', 'excel', 'ndjson' for JSON
+                Lines written in chunks, 'columnar' for the binary format
+                read by ``read_columnar``)
 
         Raises:
             HARAnalyzerError: If export fails
         """
-        if self.data is None:
+        spilled = self.spilled
+        if self.data is None and spilled is None:
             raise HARAnalyzerError("No data available for export")
 
         try:
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            if format.lower() == "csv":
-                self.data.to_csv(output_file, index=False)
-            elif format.lower() == "json":
-                self.data.to_json(output_file, orient="records", indent=2)
-            elif format.lower() == "excel":
-                self.data.to_excel(output_file, index=False)
+            if spilled is not None and format.lower() == "csv":
+                write_csv_frames(spilled.chunks(), output_file)
+            elif spilled is not None and format.lower() == "ndjson":
+                write_ndjson_frames(spilled.chunks(), output_file)
+            elif spilled is not None and format.lower() == "columnar":
+                write_columnar_chunks(
+                    list(spilled.columns.columns),
+                    spilled.column_chunks,
+                    len(spilled),
+                    output_file,
+                    self.metadata,
+                )
             else:
-                raise ValueError(f"Unsupported export format: {format}")
+                data = self.data if spilled is None else spilled.to_frame()
+                if data is None:
+                    raise HARAnalyzerError("No data available for export")
+                if format.lower() == "csv":
+                    data.to_csv(output_file, index=False)
+                elif format.lower() == "json":
+                    data.to_json(output_file, orient="records", indent=2)
+                elif format.lower() == "excel":
+                    data.to_excel(output_file, index=False)
+                elif format.lower() == "ndjson":
+                    write_ndjson(data, output_file)
+                elif format.lower() == "columnar":
+                    write_columnar(data, output_file, self.metadata)
+                else:
+                    raise ValueError(f"Unsupported export format: {format}")
 
             self.logger.info(f"Data exported to: {output_file}")
 
@@ -213,8 +389,10 @@ class HARAnalyzer:
             return "No analysis results available"
 
         basic = self.analysis_results["basic_stats"]
-        grade = self.analysis_results["performance_grade"]
-        issues = self.analysis_results["performance_issues"]
+        sampling = (self.metadata or {}).get("sampling")
+        spill = (self.metadata or {}).get("spill")
+        grade = self.analysis_results.get("performance_grade")
+        issues = self.analysis_results.get("performance_issues")
 
         summary = f"""
 HAR Analysis Summary
@@ -225,7 +403,22 @@ HAR Analysis Summary
 📦 Total Data Size: {basic['total_size_kb']/1024:.1f} MB
 🎯 Average Response: {basic['avg_response_time_ms']:.0f}ms
 
-{grade['emoji']} Overall Grade: {grade['grade']}
+"""
+
+        if sampling:
+            summary += (
+                f"🎲 Percentiles and grade estimated from a sample of "
+                f"{sampling['sampled_requests']:,} of "
+                f"{sampling['population']:,} requests\n\n"
+            )
+        if spill:
+            summary += (
+                f"💾 {spill['spilled_requests']:,} requests spilled to disk in "
+                f"{spill['chunks']} chunks to stay within the memory limit\n\n"
+            )
+
+        if grade:
+            summary += f"""{grade['emoji']} Overall Grade: {grade['grade']}
 {grade['explanation']}
 
 """
@@ -0,0 +1,206 @@
+"""Batch analysis of many HAR files."""
+
+import glob
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.formats import export_filename
+from har_analyzer.utils import ValidationError, get_logger, has_har_extension
+
+# Columns of the consolidated batch summary, in display order
+SUMMARY_COLUMNS = [
+    "file",
+    "status",
+    "grade",
+    "requests",
+    "avg_response_time_ms",
+    "p50",
+    "p90",
+    "p95",
+    "p99",
+    "total_size_kb",
+    "issues",
+    "artifacts",
+    "error",
+]
+
+
+def available_cpus() -> int:
+    """Get the number of CPUs this process may run on.
+
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def discover_har_files(target: str) -> list[Path]:
+    """Resolve a directory or glob pattern to a sorted list of HAR files.
+
+    Args:
+        target: Directory (searched for ``*.har`` files, plain or
+            compressed) or glob pattern
+
+    Returns:
+        Sorted list of matching files
+
+    Raises:
+        ValidationError: If nothing matches
+    """
+    path = Path(target)
+    if path.is_dir():
+        files = sorted(
+            p for p in path.glob("*.har*") if p.is_file() and has_har_extension(p)
+        )
+    else:
+        files = sorted(Path(p) for p in glob.glob(target, recursive=True))
+        files = [p for p in files if p.is_file()]
+
+    if not files:
+        raise ValidationError(f"No HAR files found for: {target}")
+    return files
+
+
+def _artifact_dirs(files: Sequence[Path], output_dir: Path) -> list[Path]:
+    """Assign each file its own artifact directory, avoiding name clashes."""
+    seen: dict[str, int] = {}
+    dirs = []
+    for file in files:
+        name = file.name.split(".")[0] or file.name
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        dirs.append(output_dir / (name if count == 0 else f"{name}_{count}"))
+    return dirs
+
+
+def _analyze_one(
+    har_file: Path,
+    config: HARAnalyzerConfig,
+    artifact_dir: Path,
+    export_format: Optional[str],
+) -> dict[str, Any]:
+    """Analyze a single HAR file and write its artifacts.
+
+    Runs inside a worker process, so every failure is reported in the
+    returned row instead of being raised.
+    """
+    from har_analyzer.core.analyzer import HARAnalyzer
+
+    row: dict[str, Any] = {"file": str(har_file), "status": "ok"}
+    try:
+        analyzer = HARAnalyzer(config)
+        results = analyzer.analyze_file(har_file)
+
+        artifact_dir.mkdir(parents=True, exist_ok=True)
+        (artifact_dir / "summary.txt").write_text(
+            analyzer.get_summary_text(), encoding="utf-8"
+        )
+        if export_format:
+            analyzer.export_data(
+                artifact_dir / export_filename(export_format), export_format
+            )
+
+        basic = results["basic_stats"]
+        percentiles = results["percentiles"]
+        row.update(
+            {
+                "grade": results["performance_grade"]["grade"],
+                "requests": basic["total_requests"],
+                "avg_response_time_ms": round(float(basic["avg_response_time_ms"]), 2),
+                "total_size_kb": round(float(basic["total_size_kb"]), 2),
+                "issues": ", ".join(i["type"] for i in results["performance_issues"]),
+                "artifacts": str(artifact_dir),
+            }
+        )
+        for key in ("p50", "p90", "p95", "p99"):
+            row[key] = round(float(percentiles[key]), 2)
+    except Exception as e:
+        row.update({"status": "error", "error": str(e)})
+
+    return row
+
+
+class BatchAnalyzer:
+    """Analyze many HAR files in parallel worker processes."""
+
+    def __init__(
+        self, config: Optional[HARAnalyzerConfig] = None, workers: Optional[int] = None
+    ):
+        """Initialize batch analyzer.
+
+        Args:
+            config: Configuration object, uses default if None
+            workers: Number of worker processes, defaults to the usable CPUs
+        """
+        self.config = config or HARAnalyzerConfig()
+        self.workers = workers or available_cpus()
+        self.logger = get_logger(__name__)
+
+    def analyze(
+        self,
+        files: Sequence[Path],
+        output_dir: Path,
+        export_format: Optional[str] = "csv",
+        progress: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> pd.DataFrame:
+        """Analyze files and write a consolidated summary.
+
+        Each file is analyzed in isolation; a file that fails is reported
+        with status ``error`` and does not stop the rest of the batch.
+
+        Args:
+            files: HAR files to analyze
+            output_dir: Directory for the summary and per-file artifacts
+            export_format: Per-file data export format, or None to skip
+            progress: Optional callback invoked with each finished row
+
+        Returns:
+            Summary DataFrame with one row per file, in input order
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        artifact_dirs = _artifact_dirs(files, output_dir)
+        workers = max(1, min(self.workers, len(files)))
+        self.logger.info(f"Analyzing {len(files)} HAR files with {workers} workers")
+
+        rows: list[Optional[dict[str, Any]]] = [None] * len(files)
+        if workers == 1:
+            for i, (file, artifact_dir) in enumerate(zip(files, artifact_dirs)):
+                rows[i] = _analyze_one(file, self.config, artifact_dir, export_format)
+                if progress:
+                    progress(rows[i])  # type: ignore[arg-type]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(
+                        _analyze_one, file, self.config, artifact_dir, export_format
+                    ): i
+                    for i, (file, artifact_dir) in enumerate(zip(files, artifact_dirs))
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        rows[i] = future.result()
+                    except Exception as e:
+                        # The worker itself died (e.g. killed by the OS)
+                        rows[i] = {
+                            "file": str(files[i]),
+                            "status": "error",
+                            "error": f"Worker failed: {e}",
+                        }
+                    if progress:
+                        progress(rows[i])  # type: ignore[arg-type]
+
+        summary: pd.DataFrame = pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+        summary["requests"] = summary["requests"].astype("Int64")
+        summary_file = output_dir / "batch_summary.csv"
+        summary.to_csv(summary_file, index=False)
+        self.logger.info(f"Batch summary written to: {summary_file}")
+        return summary
@@ -0,0 +1,451 @@
+"""Content-addressed on-disk cache of parsed HAR data.
+
+Entries are keyed by the SHA-256 of the HAR file's bytes combined with a
+salt describing everything else that shapes the parsed output (parser
+version, resource rules). Each entry is a single file in a simple binary
+columnar format that is memory-mapped on load::
+
+    b"HARC" | format version (u32) | header offset (u64)
+    | column buffers, each aligned to 64 bytes | JSON header
+
+The JSON header lists the row count, the metadata and, per column, its
+kind, dtype and the sizes of its buffers. It comes last so columns can be
+streamed to disk one at a time. Numeric, timestamp and category code
+buffers are used in place; string columns are stored as one UTF-8 blob
+followed by int64 end offsets into it.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+import numpy as np
+import pandas as pd
+
+from har_analyzer.utils import get_logger
+
+MAGIC = b"HARC"
+FORMAT_VERSION = 2
+CACHE_SUFFIX = ".harc"
+
+_PREAMBLE = struct.Struct("<4sIQ")
+_ALIGNMENT = 64
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Strings are encoded this many rows at a time
+_STRING_CHUNK_ROWS = 65536
+
+
+def _pad(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def file_digest(file_path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_column(
+    chunks: Callable[[], Iterator[pd.Series]],
+) -> tuple[dict[str, Any], list[Iterable[bytes]]]:
+    """Encode a column, given as consecutive chunks, into header fields and buffers.
+
+    ``chunks`` is called for every pass over the column: one to read its
+    dtype, then one per buffer, plus one to collect the categories of a
+    category column split into several chunks.
+
+    Returns:
+        Tuple of (header fields, buffers), each buffer given as the chunks
+        of bytes it is written in
+    """
+    dtype = next(chunks()).dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _encode_categories(chunks)
+
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        unit = dtype.unit
+
+        def timestamps() -> Iterator[bytes]:
+            for series in chunks():
+                values = series.dt.tz_convert("UTC").dt.tz_localize(None)
+                yield values.to_numpy(f"datetime64[{unit}]").view(np.int64).tobytes()
+
+        info = {"kind": "datetime", "unit": unit, "tz": str(dtype.tz)}
+        return info, [timestamps()]
+
+    if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype):
+        return {"kind": "string", "dtype": str(dtype)}, _encode_strings(chunks)
+
+    numeric = next(chunks()).to_numpy().dtype
+    if numeric.kind == "O":
+        raise TypeError(f"Unsupported column type: {dtype}")
+
+    def values() -> Iterator[bytes]:
+        for series in chunks():
+            yield np.ascontiguousarray(series.to_numpy(), dtype=numeric).tobytes()
+
+    return {"kind": "numeric", "dtype": numeric.str}, [values()]
+
+
+def _encode_categories(
+    chunks: Callable[[], Iterator[pd.Series]],
+) -> tuple[dict[str, Any], list[Iterable[bytes]]]:
+    """Encode category codes against the categories of all chunks.
+
+    Categories keep the order in which they first appear across chunks,
+    as with ``union_categoricals``; codes of later chunks are remapped.
+    """
+    first, *rest = [series.cat.categories for series in chunks()]
+    categories = first
+    for other in rest:
+        if not other.equals(categories):
+            categories = categories.append(other.difference(categories, sort=False))
+
+    def codes() -> Iterator[bytes]:
+        for series in chunks():
+            codes = series.cat.codes.to_numpy()
+            own = series.cat.categories
+            if not own.equals(categories):
+                # The trailing -1 keeps missing values (code -1) missing
+                remap = np.append(categories.get_indexer(own), -1)
+                codes = remap[codes]
+            yield np.ascontiguousarray(codes, dtype=np.int32).tobytes()
+
+    info = {"kind": "category", "categories": categories.tolist()}
+    return info, [codes()]
+
+
+def _encode_strings(chunks: Callable[[], Iterator[pd.Series]]) -> list[Iterable[bytes]]:
+    """Encode strings as a UTF-8 blob, in chunks, followed by end offsets."""
+    ends: list[np.ndarray] = []
+
+    def blob() -> Iterator[bytes]:
+        position = 0
+        for series in chunks():
+            values = series.tolist()
+            for start in range(0, len(values), _STRING_CHUNK_ROWS):
+                chunk = values[start : start + _STRING_CHUNK_ROWS]
+                encoded = [value.encode("utf-8") for value in chunk]
+                lengths = np.fromiter(map(len, encoded), np.int64, len(encoded))
+                ends.append(position + np.cumsum(lengths))
+                position += int(lengths.sum())
+                yield b"".join(encoded)
+
+    def offsets() -> Iterator[bytes]:
+        # Filled in while the blob was written
+        for chunk_ends in ends:
+            yield chunk_ends.tobytes()
+
+    return [blob(), offsets()]
+
+
+def _decode_column(info: dict[str, Any], buffers: list[np.ndarray]) -> Any:
+    """Rebuild a column from its header fields and mapped buffers."""
+    kind = info["kind"]
+    if kind == "category":
+        codes = buffers[0].view(np.int32)
+        return pd.Categorical.from_codes(codes, categories=info["categories"])
+
+    if kind == "datetime":
+        values = pd.DatetimeIndex(buffers[0].view(f"datetime64[{info['unit']}]"))
+        return values.tz_localize("UTC").tz_convert(info["tz"])
+
+    if kind == "string":
+        blob = buffers[0].tobytes()
+        ends = buffers[1].view(np.int64).tolist()
+        starts = [0] + ends[:-1]
+        text = blob.decode("utf-8")
+        if len(text) == len(blob):
+            # Pure ASCII: character offsets equal byte offsets
+            values = [text[a:b] for a, b in zip(starts, ends)]
+        else:
+            values = [blob[a:b].decode("utf-8") for a, b in zip(starts, ends)]
+        return pd.array(values, dtype=info["dtype"])
+
+    return buffers[0].view(np.dtype(info["dtype"]))
+
+
+def write_frame(f: BinaryIO, df: pd.DataFrame, metadata: dict[str, Any]) -> None:
+    """Write a DataFrame and its metadata in the columnar format.
+
+    Columns are encoded and written one at a time, so memory use beyond
+    the DataFrame is bounded by its largest numeric column.
+
+    Args:
+        f: Seekable binary stream to write to
+        df: DataFrame to store
+        metadata: JSON-serializable metadata stored alongside the frame
+
+    Raises:
+        TypeError: If a column cannot be stored
+    """
+    write_chunks(f, list(df.columns), lambda name: iter([df[name]]), len(df), metadata)
+
+
+def write_chunks(
+    f: BinaryIO,
+    columns: Sequence[str],
+    chunks: Callable[[str], Iterator[pd.Series]],
+    rows: int,
+    metadata: dict[str, Any],
+) -> None:
+    """Write consecutive chunks of rows as one frame in the columnar format.
+
+    Each column is written by passing over its chunks, so only one chunk
+    of one column has to be in memory at a time.
+
+    Args:
+        f: Seekable binary stream to write to
+        columns: Column names
+        chunks: Returns the chunks of a column in row order; called once
+            per pass over the column
+        rows: Total number of rows of the chunks
+        metadata: JSON-serializable metadata stored alongside the frame
+
+    Raises:
+        TypeError: If a column cannot be stored
+    """
+    start = f.tell()
+    f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0))
+    offset = _PREAMBLE.size
+
+    header_columns = []
+    for name in columns:
+        info, buffers = _encode_column(functools.partial(chunks, name))
+        sizes = []
+        for buffer in buffers:
+            f.write(b"\0" * _pad(offset))
+            offset += _pad(offset)
+            size = 0
+            for chunk in buffer:
+                f.write(chunk)
+                size += len(chunk)
+            offset += size
+            sizes.append(size)
+        header_columns.append({**info, "name": str(name), "buffers": sizes})
+
+    header = json.dumps(
+        {"rows": rows, "columns": header_columns, "metadata": metadata},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    f.write(header)
+    end = f.tell()
+    f.seek(start)
+    f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, offset))
+    f.seek(end)
+
+
+def _header_offset(preamble: bytes, size: int) -> int:
+    """Check the preamble of a columnar file of ``size`` bytes.
+
+    Returns:
+        Offset of the JSON header
+
+    Raises:
+        ValueError: If the file is not in the columnar format
+    """
+    if len(preamble) < _PREAMBLE.size:
+        raise ValueError("Columnar file is truncated")
+    magic, version, header_offset = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a supported columnar file")
+    if not _PREAMBLE.size <= header_offset < size:
+        raise ValueError("Columnar file is truncated")
+    return int(header_offset)
+
+
+def read_schema(file_path: Path) -> pd.DataFrame:
+    """Read the columns of a file written by ``write_frame`` without its rows.
+
+    Only the preamble and the JSON header at the end of the file are read.
+
+    Args:
+        file_path: Path to a file in the columnar format
+
+    Returns:
+        Empty DataFrame with the columns and dtypes of the file
+
+    Raises:
+        ValueError: If the file is not in the columnar format
+    """
+    with open(file_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        header_offset = _header_offset(f.read(_PREAMBLE.size), size)
+        f.seek(header_offset)
+        header = json.loads(f.read())
+
+    empty = np.empty(0, dtype=np.uint8)
+    data = {
+        info["name"]: _decode_column(info, [empty] * len(info["buffers"]))
+        for info in header["columns"]
+    }
+    df: pd.DataFrame = pd.DataFrame(data)
+    return df
+
+
+def read_frame(
+    file_path: Path, columns: Optional[Sequence[str]] = None
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Memory-map a file written by ``write_frame``.
+
+    Args:
+        file_path: Path to a file in the columnar format
+        columns: Names of the columns to decode, all columns if None; the
+            others are skipped without being read
+
+    Returns:
+        Tuple of (DataFrame, metadata)
+
+    Raises:
+        ValueError: If the file is not in the columnar format
+    """
+    mapped = np.memmap(file_path, dtype=np.uint8, mode="r")
+    header_offset = _header_offset(mapped[: _PREAMBLE.size].tobytes(), len(mapped))
+    header = json.loads(mapped[header_offset:].tobytes())
+
+    offset = _PREAMBLE.size
+    data: dict[str, Any] = {}
+    for info in header["columns"]:
+        buffers = []
+        for size in info["buffers"]:
+            offset += _pad(offset)
+            if offset + size > header_offset:
+                raise ValueError("Columnar file is truncated")
+            buffers.append(np.frombuffer(mapped, np.uint8, size, offset))
+            offset += size
+        if columns is None or info["name"] in columns:
+            data[info["name"]] = _decode_column(info, buffers)
+
+    return pd.DataFrame(data, copy=False), header["metadata"]
+
+
+class ParseCache:
+    """Size-bounded cache of parsed HAR data, evicting least recently used."""
+
+    def __init__(self, cache_dir: Path, max_mb: int = 1024):
+        """Initialize parse cache.
+
+        Args:
+            cache_dir: Directory holding cache files, created on first store
+            max_mb: Maximum total size of cache files in megabytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_mb * 1024 * 1024
+        self.logger = get_logger(__name__)
+
+    def key(self, file_path: Path, salt: str) -> str:
+        """Compute the cache key of a HAR file.
+
+        Args:
+            file_path: Path to HAR file
+            salt: Description of everything besides the file that shapes
+                the parsed output
+
+        Returns:
+            Hex cache key
+        """
+        content = file_digest(file_path)
+        return hashlib.sha256(f"{content}:{salt}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def load(self, key: str) -> Optional[tuple[pd.DataFrame, dict[str, Any]]]:
+        """Load a cached entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (DataFrame, metadata), or None on a miss
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            result = read_frame(path)
+            os.utime(path)  # Mark as recently used
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache file {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        self.logger.debug(f"Cache hit: {path}")
+        return result
+
+    def store(self, key: str, df: pd.DataFrame, metadata: dict[str, Any]) -> None:
+        """Store an entry, then evict old entries beyond the size limit.
+
+        Failures are logged and otherwise ignored.
+
+        Args:
+            key: Cache key
+            df: Parsed DataFrame
+            metadata: JSON-serializable parser metadata
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                write_frame(f, df, metadata)
+            if tmp_path.stat().st_size > self.max_bytes:
+                self.logger.info("Parsed data exceeds the cache size limit")
+                tmp_path.unlink()
+                return
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Could not write cache file {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.logger.debug(f"Cached parsed data: {path}")
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until under the size limit.
+
+        Returns:
+            Number of removed entries
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            self.logger.info(f"Evicted {removed} cache entries")
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,277 @@
+"""Columnar builder for parsed HAR entries."""
+
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any, Callable, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnSpec(NamedTuple):
+    """Name and storage kind of a parsed column."""
+
+    name: str
+    kind: str
+
+
+# Stored columns in the order rows are appended. Kinds map to compact
+# storage: "category" is dictionary encoded, "timestamp" keeps the raw
+# ISO 8601 strings until they are converted in one pass on build.
+ENTRY_SCHEMA: tuple[ColumnSpec, ...] = (
+    ColumnSpec("url", "object"),
+    ColumnSpec("method", "category"),
+    ColumnSpec("status_code", "int16"),
+    ColumnSpec("mime_type", "category"),
+    ColumnSpec("response_time_ms", "float32"),
+    ColumnSpec("size_bytes", "int64"),
+    ColumnSpec("start_time", "timestamp"),
+    ColumnSpec("timing_blocked", "float32"),
+    ColumnSpec("timing_dns", "float32"),
+    ColumnSpec("timing_connect", "float32"),
+    ColumnSpec("timing_send", "float32"),
+    ColumnSpec("timing_wait", "float32"),
+    ColumnSpec("timing_receive", "float32"),
+)
+
+# Columns added by HARParser(extended=True), after ENTRY_SCHEMA. Sizes are
+# -1 where the HAR does not record them; headers are joined when repeated.
+EXTENDED_SCHEMA: tuple[ColumnSpec, ...] = (
+    ColumnSpec("server_ip", "category"),
+    ColumnSpec("connection_id", "category"),
+    ColumnSpec("transfer_size", "int64"),
+    ColumnSpec("request_headers_size", "int32"),
+    ColumnSpec("response_headers_size", "int32"),
+    ColumnSpec("cache_control", "category"),
+    ColumnSpec("content_encoding", "category"),
+)
+
+_TYPECODES = {"int16": "h", "int32": "i", "int64": "q", "float32": "f"}
+
+# Formats tried, in order, for startedDateTime values
+TIMESTAMP_FORMATS = ("ISO8601", "%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _to_float(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _to_int16(value: Any) -> int:
+    result = 0 if value is None else int(value)
+    if not -32768 <= result <= 32767:
+        raise ValueError(f"Value out of int16 range: {result}")
+    return result
+
+
+def _to_int32(value: Any) -> int:
+    result = 0 if value is None else int(value)
+    if not -(2**31) <= result < 2**31:
+        raise ValueError(f"Value out of int32 range: {result}")
+    return result
+
+
+def _to_int(value: Any) -> int:
+    return 0 if value is None else int(value)
+
+
+def _to_str(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "object": _identity,
+    "category": _to_str,
+    "int16": _to_int16,
+    "int32": _to_int32,
+    "int64": _to_int,
+    "float32": _to_float,
+    "timestamp": _identity,
+}
+
+
+class _CategoryColumn:
+    """Dictionary-encoded string column."""
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.categories: dict[str, int] = {}
+
+    def append(self, value: str) -> None:
+        code = self.categories.get(value)
+        if code is None:
+            code = self.categories[value] = len(self.categories)
+        self.codes.append(code)
+
+    def extend(self, other: "_CategoryColumn") -> None:
+        remap = np.array(
+            [
+                self.categories.setdefault(v, len(self.categories))
+                for v in other.categories
+            ],
+            dtype=np.int32,
+        )
+        if len(other.codes):
+            codes = remap[np.frombuffer(other.codes, dtype=np.int32)]
+            self.codes.frombytes(codes.tobytes())
+
+    def finalize(self) -> pd.Categorical:
+        # Sorted categories keep groupby output in alphabetical order
+        labels = np.array(list(self.categories), dtype=object)
+        order = np.argsort(labels, kind="stable")
+        remap = np.empty(len(order), dtype=np.int32)
+        remap[order] = np.arange(len(order), dtype=np.int32)
+        codes = remap[np.frombuffer(self.codes, dtype=np.int32)]
+        return pd.Categorical.from_codes(codes, categories=pd.Index(labels[order]))
+
+
+_Column = Union[list[Any], "array[Any]", _CategoryColumn]
+
+
+class ColumnarBuilder:
+    """Append parsed rows straight into typed column buffers.
+
+    Rows are stored column-wise in ``array.array`` buffers (or dictionary
+    encoded for categorical columns) and exposed to pandas without copying
+    when the frame is built. Derived columns such as ``size_kb`` are not
+    stored per row; they are computed from their source column on build
+    rather than lazily, since a DataFrame cannot defer a column.
+    """
+
+    def __init__(self, schema: Sequence[ColumnSpec] = ENTRY_SCHEMA):
+        """Initialize columnar builder.
+
+        Args:
+            schema: Column specifications in row order
+        """
+        self.schema = tuple(schema)
+        self._coercers = [_COERCERS[spec.kind] for spec in self.schema]
+        self._columns: list[_Column] = [self._new_column(s) for s in self.schema]
+        self._appenders = [column.append for column in self._columns]
+        self._rows = 0
+        self.unparsed_timestamps = 0
+
+    @staticmethod
+    def _new_column(spec: ColumnSpec) -> _Column:
+        if spec.kind in ("object", "timestamp"):
+            return []
+        if spec.kind == "category":
+            return _CategoryColumn()
+        return array(_TYPECODES[spec.kind])
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Append one row of values in schema order.
+
+        Args:
+            row: Values for each column in the schema
+
+        Raises:
+            ValueError: If a value cannot be stored in its column
+            TypeError: If a value has an unsupported type
+        """
+        # Coerce the whole row first so a bad value never leaves columns ragged
+        values = [coerce(value) for coerce, value in zip(self._coercers, row)]
+        for append, value in zip(self._appenders, values):
+            append(value)
+        self._rows += 1
+
+    def extend(self, other: "ColumnarBuilder") -> None:
+        """Append all rows of another builder with the same schema.
+
+        Args:
+            other: Builder whose rows are appended after this builder's rows
+
+        Raises:
+            ValueError: If the schemas differ
+        """
+        if other.schema != self.schema:
+            raise ValueError("Cannot merge builders with different schemas")
+        for column, other_column in zip(self._columns, other._columns):
+            column.extend(other_column)  # type: ignore[arg-type]
+        self._rows += other._rows
+
+    def _finalize(self, spec: ColumnSpec, column: _Column) -> Any:
+        if isinstance(column, _CategoryColumn):
+            return column.finalize()
+        if spec.kind == "timestamp":
+            timestamps, unparsed = parse_timestamps(column)
+            self.unparsed_timestamps += unparsed
+            return timestamps
+        if isinstance(column, list):
+            return np.array(column, dtype=object)
+        return np.frombuffer(column, dtype=np.dtype(spec.kind))
+
+    def build(self) -> pd.DataFrame:
+        """Build a DataFrame over the collected columns.
+
+        Numeric buffers are wrapped without copying, so the builder must not
+        be appended to afterwards.
+
+        Returns:
+            DataFrame with one column per schema entry plus derived columns
+        """
+        self.unparsed_timestamps = 0
+        data: dict[str, Any] = {}
+        for spec, column in zip(self.schema, self._columns):
+            data[spec.name] = self._finalize(spec, column)
+            if spec.name == "size_bytes":
+                # Aggregates, top-K, filters and exports index it like any
+                # stored column, so it is materialized here in one pass
+                data["size_kb"] = _size_kb(data["size_bytes"])
+
+        df: pd.DataFrame = pd.DataFrame(data, copy=False)
+        return df
+
+
+def _size_kb(size_bytes: np.ndarray) -> np.ndarray:
+    """Derive ``size_kb`` from ``size_bytes``, treating unknown sizes as 0."""
+    return np.where(size_bytes > 0, size_bytes / 1024, 0).astype(np.float32)
+
+
+def parse_timestamps(values: Sequence[Any]) -> tuple[pd.DatetimeIndex, int]:
+    """Convert raw ``startedDateTime`` strings to UTC timestamps in one pass.
+
+    UTC values ending in ``Z`` go through numpy's datetime parser; anything
+    else is tried against each format in ``TIMESTAMP_FORMATS`` in turn.
+    Naive results are taken as UTC.
+
+    Args:
+        values: Raw timestamp strings (None or empty for missing values)
+
+    Returns:
+        Tuple of (datetime64[ns, UTC] index, number of unparseable values)
+    """
+    # Fast path: strip the "Z" and let numpy's C parser read naive UTC values
+    stripped = [
+        value[:-1] if isinstance(value, str) and value.endswith("Z") else "NaT"
+        for value in values
+    ]
+    try:
+        result = np.array(stripped, dtype="datetime64[ns]")
+    except ValueError:
+        result = np.full(len(stripped), np.datetime64("NaT"), dtype="datetime64[ns]")
+    del stripped
+
+    missing = np.flatnonzero(np.isnat(result))
+    pending = [i for i in missing.tolist() if values[i]]
+
+    for fmt in TIMESTAMP_FORMATS:
+        if not pending:
+            break
+        parsed = pd.to_datetime(
+            pd.Series([values[i] for i in pending], dtype=object),
+            format=fmt,
+            errors="coerce",
+            utc=True,
+        )
+        result[pending] = parsed.dt.tz_localize(None).to_numpy("datetime64[ns]")
+        pending = [i for i in pending if np.isnat(result[i])]
+
+    return pd.DatetimeIndex(result).tz_localize("UTC"), len(pending)
@@ -0,0 +1,138 @@
+"""Streaming export of parsed HAR data."""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from har_analyzer.core.cache import read_frame, write_chunks, write_frame
+
+# Rows serialized at a time when writing JSON Lines
+NDJSON_CHUNK_ROWS = 50_000
+
+
+def write_ndjson(
+    df: pd.DataFrame, output_file: Path, chunk_rows: int = NDJSON_CHUNK_ROWS
+) -> None:
+    """Write one JSON object per row, serializing a chunk of rows at a time.
+
+    Timestamps are written as ISO 8601 strings and missing values as null.
+
+    Args:
+        df: DataFrame to export
+        output_file: Output file path
+        chunk_rows: Rows serialized at a time, bounding the text in memory
+    """
+    write_ndjson_frames([df], output_file, chunk_rows)
+
+
+def write_ndjson_frames(
+    frames: Iterable[pd.DataFrame],
+    output_file: Path,
+    chunk_rows: int = NDJSON_CHUNK_ROWS,
+) -> None:
+    """Write the rows of consecutive DataFrames as JSON Lines.
+
+    Args:
+        frames: DataFrames with the same columns, such as spilled chunks
+        output_file: Output file path
+        chunk_rows: Rows serialized at a time, bounding the text in memory
+    """
+    with open(output_file, "w", encoding="utf-8", newline="\n") as f:
+        for df in frames:
+            timestamps = [
+                str(name)
+                for name, dtype in df.dtypes.items()
+                if isinstance(dtype, pd.DatetimeTZDtype)
+            ]
+            for start in range(0, len(df), chunk_rows):
+                chunk = df.iloc[start : start + chunk_rows]
+                if timestamps:
+                    chunk = chunk.assign(
+                        **{name: _iso_strings(chunk[name]) for name in timestamps}
+                    )
+                text = chunk.to_json(orient="records", lines=True, date_format="iso")
+                f.write(text if text.endswith("\n") else text + "\n")
+
+
+def write_csv_frames(frames: Iterable[pd.DataFrame], output_file: Path) -> None:
+    """Write the rows of consecutive DataFrames as one CSV file.
+
+    Args:
+        frames: DataFrames with the same columns, such as spilled chunks
+        output_file: Output file path
+    """
+    with open(output_file, "w", encoding="utf-8", newline="") as f:
+        for i, df in enumerate(frames):
+            df.to_csv(f, header=i == 0, index=False)
+
+
+def _iso_strings(series: pd.Series) -> pd.Series:
+    """Format timezone-aware timestamps like ``to_json(date_format="iso")``.
+
+    Formatting with numpy first is several times faster than letting the
+    JSON writer convert each timestamp.
+    """
+    values = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+    text = np.char.add(np.datetime_as_string(values, unit="ms"), "Z")
+    strings: pd.Series = pd.Series(text, index=series.index, dtype=object)
+    masked: pd.Series = strings.where(series.notna())
+    return masked
+
+
+def write_columnar(
+    df: pd.DataFrame, output_file: Path, metadata: Optional[dict[str, Any]] = None
+) -> None:
+    """Write the binary columnar format, one column at a time.
+
+    The format is the one used by the parse cache: typed column buffers
+    that ``read_columnar`` memory-maps without parsing any text.
+
+    Args:
+        df: DataFrame to export
+        output_file: Output file path
+        metadata: JSON-serializable metadata stored with the data
+    """
+    with open(output_file, "wb") as f:
+        write_frame(f, df, metadata or {})
+
+
+def write_columnar_chunks(
+    columns: Sequence[str],
+    chunks: Callable[[str], Iterator[pd.Series]],
+    rows: int,
+    output_file: Path,
+    metadata: Optional[dict[str, Any]] = None,
+) -> None:
+    """Write the binary columnar format from consecutive chunks of rows.
+
+    Each column is written by a pass over its chunks, so only one chunk
+    of one column is held in memory at a time.
+
+    Args:
+        columns: Column names in output order
+        chunks: Function returning an iterator over the chunks of a column,
+            such as ``SpilledFrame.column_chunks``
+        rows: Total number of rows in the chunks
+        output_file: Output file path
+        metadata: JSON-serializable metadata stored with the data
+    """
+    with open(output_file, "wb") as f:
+        write_chunks(f, columns, chunks, rows, metadata or {})
+
+
+def read_columnar(input_file: Path) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Load a file written by ``write_columnar``.
+
+    Args:
+        input_file: Path to a columnar export
+
+    Returns:
+        Tuple of (DataFrame with the exported dtypes, metadata)
+
+    Raises:
+        ValueError: If the file is not a columnar export
+    """
+    return read_frame(input_file)
@@ -0,0 +1,346 @@
+"""Filter expressions evaluated on entries while they are extracted.
+
+An expression compares fields of the parsed row with literals and combines
+the comparisons with ``and``, ``or``, ``not`` and parentheses::
+
+    type in (API, JS) and status_code >= 400 and host == "cdn.example.com"
+
+Fields are the parsed columns plus ``type`` (the resource type), ``host``
+(the lowercase URL host name) and ``size_kb``. Operators are ``==``,
+``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in (...)``, ``not in (...)`` and
+``contains``. Literals are numbers, quoted strings, or bare words such as
+``API`` or ``GET``. ``start_time`` is compared with ISO 8601 timestamps,
+taken as UTC when they carry no offset. A row whose field is missing or
+cannot be converted never matches a comparison.
+"""
+
+import operator
+import re
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from har_analyzer.core.columns import ColumnSpec
+from har_analyzer.utils.exceptions import ConfigurationError
+from har_analyzer.utils.helpers import ResourceClassifier
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(?![\w.\-]))
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<symbol>==|!=|<=|>=|<|>|\(|\)|,)
+      | (?P<word>[\w.\-/+*:]+)
+    )""",
+    re.VERBOSE,
+)
+_ESCAPE = re.compile(r"\\(.)")
+
+_KEYWORDS = frozenset(["and", "or", "not", "in", "contains"])
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# Fields computed from the parsed columns rather than stored in the row
+DERIVED_FIELDS = ("type", "host", "size_kb")
+
+_NUMERIC_KINDS = frozenset(["int16", "int32", "int64", "float32"])
+
+Predicate = Callable[[Sequence[Any]], bool]
+
+# Parsed expression: an operator name followed by its operands
+Node = tuple[Any, ...]
+
+
+class _Parser:
+    """Recursive descent parser producing nested tuples."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: list[tuple[str, str]] = []
+        pos = 0
+        while pos < len(text):
+            match = _TOKEN.match(text, pos)
+            if match is None or match.end() == pos:
+                if not text[pos:].strip():
+                    break
+                raise ConfigurationError(
+                    f"Invalid filter expression at {text[pos:].strip()[:20]!r}"
+                )
+            kind = match.lastgroup or ""
+            self.tokens.append((kind, match.group(kind)))
+            pos = match.end()
+        self.index = 0
+
+    def peek(self) -> tuple[str, str]:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return ("end", "")
+
+    def next(self) -> tuple[str, str]:
+        token = self.peek()
+        self.index += 1
+        return token
+
+    def keyword(self, word: str) -> bool:
+        kind, value = self.peek()
+        if kind == "word" and value.lower() == word:
+            self.index += 1
+            return True
+        return False
+
+    def expect(self, symbol: str) -> None:
+        kind, value = self.next()
+        if kind != "symbol" or value != symbol:
+            raise ConfigurationError(
+                f"Invalid filter expression: expected {symbol!r}, "
+                f"found {value or 'end of expression'!r}"
+            )
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise ConfigurationError("Filter expression is empty")
+        node = self.parse_or()
+        if self.peek()[0] != "end":
+            raise ConfigurationError(
+                f"Invalid filter expression: unexpected {self.peek()[1]!r}"
+            )
+        return node
+
+    def parse_or(self) -> Node:
+        nodes = [self.parse_and()]
+        while self.keyword("or"):
+            nodes.append(self.parse_and())
+        return nodes[0] if len(nodes) == 1 else ("or", *nodes)
+
+    def parse_and(self) -> Node:
+        nodes = [self.parse_not()]
+        while self.keyword("and"):
+            nodes.append(self.parse_not())
+        return nodes[0] if len(nodes) == 1 else ("and", *nodes)
+
+    def parse_not(self) -> Node:
+        if self.keyword("not"):
+            return ("not", self.parse_not())
+        if self.peek() == ("symbol", "("):
+            self.next()
+            node = self.parse_or()
+            self.expect(")")
+            return node
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> Node:
+        kind, field = self.next()
+        if kind != "word" or field.lower() in _KEYWORDS:
+            raise ConfigurationError(
+                f"Invalid filter expression: expected a field name, "
+                f"found {field or 'end of expression'!r}"
+            )
+        if self.keyword("in"):
+            return ("in", field, self.parse_list())
+        if self.keyword("not"):
+            if not self.keyword("in"):
+                raise ConfigurationError("Invalid filter expression: expected 'in'")
+            return ("not", ("in", field, self.parse_list()))
+        if self.keyword("contains"):
+            return ("contains", field, self.parse_literal())
+        kind, symbol = self.next()
+        if kind != "symbol" or symbol not in _COMPARISONS:
+            raise ConfigurationError(
+                f"Invalid filter expression: expected an operator after {field!r}"
+            )
+        return ("compare", field, symbol, self.parse_literal())
+
+    def parse_list(self) -> tuple[str, ...]:
+        self.expect("(")
+        values = [self.parse_literal()]
+        while self.peek() == ("symbol", ","):
+            self.next()
+            values.append(self.parse_literal())
+        self.expect(")")
+        return tuple(values)
+
+    def parse_literal(self) -> str:
+        kind, value = self.next()
+        if kind == "number":
+            return value
+        if kind == "string":
+            return _ESCAPE.sub(r"\1", value[1:-1])
+        if kind == "word" and value.lower() not in _KEYWORDS:
+            return value
+        raise ConfigurationError(
+            f"Invalid filter expression: expected a value, "
+            f"found {value or 'end of expression'!r}"
+        )
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, taking naive values as UTC.
+
+    ``datetime.fromisoformat`` is tried first as it is much faster per row;
+    before Python 3.11 it rejects forms such as offsets without a colon or
+    more than six fractional digits, which ``pd.Timestamp`` parses.
+    """
+    if not isinstance(value, str):
+        return None
+    parsed: datetime
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            timestamp = pd.Timestamp(value)
+        except ValueError:
+            return None
+        if pd.isna(timestamp):
+            return None
+        parsed = timestamp
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _to_number(value: Any) -> Optional[float]:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _host(url: Any) -> str:
+    try:
+        return urlsplit(str(url)).hostname or ""
+    except ValueError:
+        return ""
+
+
+class RowFilter:
+    """Predicate over parsed rows, compiled from a filter expression.
+
+    Calling the filter with a row in schema order returns whether the entry
+    is kept. Filters are rebuilt from their expression when pickled, so
+    they can be sent to parser worker processes.
+    """
+
+    def __init__(
+        self,
+        expression: str,
+        schema: Sequence[ColumnSpec],
+        classifier: Optional[ResourceClassifier] = None,
+    ):
+        """Compile a filter expression.
+
+        Args:
+            expression: Filter expression, see the module documentation
+            schema: Column specifications of the rows to filter
+            classifier: Classifier deriving the ``type`` field
+
+        Raises:
+            ConfigurationError: If the expression is invalid or uses an
+                unknown field
+        """
+        self.expression = expression
+        self.schema = tuple(schema)
+        self.classifier = classifier or ResourceClassifier()
+        self._kinds = {spec.name: spec.kind for spec in self.schema}
+        self._index = {spec.name: i for i, spec in enumerate(self.schema)}
+        self.tree = _Parser(expression).parse()
+        self._predicate = self._compile(self.tree)
+
+    def __call__(self, row: Sequence[Any]) -> bool:
+        return self._predicate(row)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (RowFilter, (self.expression, self.schema, self.classifier))
+
+    def __repr__(self) -> str:
+        return f"RowFilter({self.expression!r})"
+
+    def _compile(self, node: Node) -> Predicate:
+        """Turn a parsed node into a predicate over rows."""
+        op = node[0]
+        if op in ("and", "or"):
+            parts = [self._compile(child) for child in node[1:]]
+            if op == "and":
+                return lambda row: all(part(row) for part in parts)
+            return lambda row: any(part(row) for part in parts)
+        if op == "not":
+            inner = self._compile(node[1])
+            return lambda row: not inner(row)
+
+        field = node[1]
+        getter, kind = self._field(field)
+        if op == "in":
+            values = frozenset(self._literal(field, kind, value) for value in node[2])
+            return lambda row: getter(row) in values
+        if op == "contains":
+            if kind not in ("string", "host"):
+                raise ConfigurationError(f"Filter field {field!r} is not text")
+            needle = self._literal(field, kind, node[2])
+            return lambda row: needle in getter(row)
+
+        compare = _COMPARISONS[node[2]]
+        literal = self._literal(field, kind, node[3])
+
+        def predicate(row: Sequence[Any]) -> bool:
+            value = getter(row)
+            return value is not None and compare(value, literal)
+
+        return predicate
+
+    def _field(self, name: str) -> tuple[Callable[[Sequence[Any]], Any], str]:
+        """Get a row accessor for a field and the kind of its values."""
+        index = self._index
+        if name == "type" and "type" not in index:
+            url, mime = index["url"], index["mime_type"]
+            classify = self.classifier.classify
+
+            def resource_type(row: Sequence[Any]) -> str:
+                return classify(str(row[mime] or ""), str(row[url] or ""))
+
+            return resource_type, "string"
+        if name == "host" and "host" not in index:
+            url = index["url"]
+            return lambda row: _host(row[url]), "host"
+        if name == "size_kb" and "size_kb" not in index:
+            size = index["size_bytes"]
+
+            def size_kb(row: Sequence[Any]) -> Optional[float]:
+                value = _to_number(row[size])
+                return None if value is None else max(value, 0) / 1024
+
+            return size_kb, "number"
+        if name not in index:
+            fields = ", ".join([*index, *DERIVED_FIELDS])
+            raise ConfigurationError(
+                f"Unknown filter field: {name} (choose from {fields})"
+            )
+
+        i = index[name]
+        kind = self._kinds[name]
+        if kind in _NUMERIC_KINDS:
+            return lambda row: _to_number(row[i]), "number"
+        if kind == "timestamp":
+            return lambda row: _parse_time(row[i]), "timestamp"
+        return lambda row: "" if row[i] is None else str(row[i]), "string"
+
+    def _literal(self, field: str, kind: str, value: str) -> Any:
+        """Convert a literal to the kind of values it is compared with."""
+        if kind == "number":
+            number = _to_number(value)
+            if number is None:
+                raise ConfigurationError(f"Filter field {field!r} needs a number")
+            return number
+        if kind == "timestamp":
+            timestamp = _parse_time(value)
+            if timestamp is None:
+                raise ConfigurationError(
+                    f"Filter field {field!r} needs an ISO 8601 timestamp"
+                )
+            return timestamp
+        return value.lower() if kind == "host" else value
@@ -0,0 +1,30 @@
+"""Names and file suffixes of the data export formats.
+
+Kept free of heavy imports so the command line can list the formats
+without loading pandas.
+"""
+
+# File suffix of each export format
+EXPORT_SUFFIXES = {
+    "csv": ".csv",
+    "json": ".json",
+    "excel": ".xlsx",
+    "ndjson": ".ndjson",
+    "columnar": ".harc",
+}
+
+# Formats offered on the command line; Excel also needs openpyxl
+EXPORT_FORMATS = ("csv", "json", "ndjson", "columnar")
+
+
+def export_filename(format: str, stem: str = "har_analysis") -> str:
+    """Get the file name of an export.
+
+    Args:
+        format: Export format
+        stem: File name without suffix
+
+    Returns:
+        File name with the format's suffix
+    """
+    return stem + EXPORT_SUFFIXES.get(format.lower(), f".{format.lower()}")
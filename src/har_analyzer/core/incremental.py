@@ -0,0 +1,106 @@
+"""Incremental analysis of HAR entries as they are captured."""
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+import pandas as pd
+
+from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.aggregates import RunningAggregates
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.core.results import AnalysisResults
+from har_analyzer.core.topk import TopKTracker
+from har_analyzer.utils import HARAnalyzerError
+
+
+class IncrementalAnalyzer(HARAnalyzer):
+    """Analyzer that keeps metrics up to date as entries are appended.
+
+    Entries are parsed and folded into running aggregates and top-K heaps
+    as they arrive, so ``snapshot`` never revisits earlier entries. Results
+    have the same sections as ``HARAnalyzer.analyze_file``; percentiles are
+    sketch estimates within ``config.percentile_relative_accuracy``.
+    """
+
+    def __init__(self, config: Optional[HARAnalyzerConfig] = None):
+        """Initialize incremental analyzer.
+
+        Args:
+            config: Configuration object, uses default if None
+        """
+        super().__init__(config)
+        self.running = RunningAggregates(self.config.percentile_relative_accuracy)
+        self.top_resources = TopKTracker(
+            ("response_time_ms", "size_kb"), self.config.report.top_n_resources
+        )
+        self.entries_count = 0
+        self.unparsed_timestamps = 0
+        self._columns: Optional[pd.DataFrame] = None
+
+    def add_entries(self, entries: Iterable[dict[str, Any]]) -> int:
+        """Parse HAR entries and add them to the running metrics.
+
+        Entries that cannot be processed are skipped, as when parsing files.
+
+        Args:
+            entries: Decoded HAR entries (items of ``log.entries``)
+
+        Returns:
+            Number of entries added
+        """
+
+        def counted(items: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+            for item in items:
+                self.entries_count += 1
+                yield item
+
+        df = self.parser.parse_entries(counted(entries))
+        self.unparsed_timestamps += self.parser.unparsed_timestamps
+        if not len(df):
+            return 0
+        self.add_frame(df)
+        return len(df)
+
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """Add already parsed rows to the running metrics.
+
+        Args:
+            df: DataFrame chunk with HAR data, as returned by ``HARParser``
+        """
+        self.running.update(df)
+        self.top_resources.add_frame(df)
+        if self._columns is None:
+            self._columns = df.iloc[:0]
+        self.logger.debug(
+            f"Added {len(df)} requests ({self.running.total_requests} in total)"
+        )
+
+    def snapshot(self) -> AnalysisResults:
+        """Get analysis results for every entry added so far.
+
+        Aggregates and top resources are frozen when this is called; the
+        sections are formatted on first access.
+
+        Returns:
+            Mapping of section name to analysis results
+
+        Raises:
+            HARAnalyzerError: If no entries were added yet
+        """
+        if self._columns is None or not self.running.total_requests:
+            raise HARAnalyzerError("No data available for analysis")
+
+        aggregates = self.running.snapshot()
+        top_resources = self.top_resources.result()
+        metadata: dict[str, Any] = {
+            "version": None,
+            "creator": None,
+            "browser": None,
+            "pages": [],
+            "entries_count": self.entries_count,
+            "unparsed_timestamps": self.unparsed_timestamps,
+        }
+        self.analysis_results = self._build_results(
+            self._columns, metadata, lambda: aggregates, lambda: top_resources
+        )
+        return self.analysis_results
@@ -1,94 +1,105 @@
 """Performance metrics calculation module."""
 
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Optional
 
 import pandas as pd
 
 from har_analyzer.config import PerformanceThresholds
+from har_analyzer.core.aggregates import (
+    LARGE_RESOURCE_KB,
+    SLOW_RESOURCE_MS,
+    Aggregates,
+    FrameAggregates,
+    RunningAggregates,
+)
+from har_analyzer.core.sampling import DEFAULT_CONFIDENCE, SampledAggregates
+from har_analyzer.core.sketch import DEFAULT_RELATIVE_ACCURACY
+from har_analyzer.core.topk import grouped_top_k
 from har_analyzer.utils import get_logger
 
 
 class PerformanceMetrics:
     """Calculator for performance metrics and analysis."""
 
-    def __init__(self, thresholds: PerformanceThresholds):
+    def __init__(
+        self,
+        thresholds: PerformanceThresholds,
+        percentile_mode: str = "exact",
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
         """Initialize metrics calculator.
 
         Args:
             thresholds: Performance thresholds for grading
+            percentile_mode: "exact", "sketch" or "auto"
+            relative_accuracy: Relative error bound of sketch percentiles
         """
         self.logger = get_logger(__name__)
         self.thresholds = thresholds
+        self.percentile_mode = percentile_mode
+        self.relative_accuracy = relative_accuracy
 
-    def calculate_summary_by_type(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate performance summary by resource type.
+    def aggregate(
+        self, df: pd.DataFrame, totals: Optional[RunningAggregates] = None
+    ) -> Aggregates:
+        """Compute all aggregates used by the metrics in a single pass.
+
+        The result can be passed to the other methods to avoid rescanning
+        the data for every metric.
 
         Args:
             df: DataFrame with HAR data
+            totals: Exact aggregates of all entries when ``df`` is a sample
+                of them, as kept by a sampled parse
 
         Returns:
-            Summary DataFrame grouped by resource type
+            Aggregates of the DataFrame, or ``SampledAggregates`` with the
+            exact totals and percentiles estimated from the sample
         """
-        self.logger.debug("Calculating performance summary by type")
-
-        summary = (
-            df.groupby("type")
-            .agg(
-                {
-                    "url": "count",
-                    "response_time_ms": [
-                        "mean",
-                        "max",
-                        "min",
-                        "std",
-                        lambda x: x.quantile(0.90),
-                        lambda x: x.quantile(0.95),
-                    ],
-                    "size_kb": ["sum", "mean", "max", "min"],
-                    "status_code": lambda x: (x == 200).sum()
-                    / len(x)
-                    * 100,  # Success rate
-                }
+        if totals is not None:
+            self.logger.debug(
+                f"Aggregated a sample of {len(df)} of "
+                f"{totals.total_requests} requests"
             )
-            .round(2)
+            return SampledAggregates(df, totals, self.relative_accuracy)
+        aggregates = FrameAggregates(df, self.percentile_mode, self.relative_accuracy)
+        self.logger.debug(
+            f"Aggregated {len(df)} requests ({aggregates.percentile_mode} percentiles)"
         )
+        return aggregates
 
-        # Flatten column names
-        summary.columns = pd.Index(
-            [
-                "requests_count",
-                "avg_response_time_ms",
-                "max_response_time_ms",
-                "min_response_time_ms",
-                "std_response_time_ms",
-                "p90_response_time_ms",
-                "p95_response_time_ms",
-                "total_size_kb",
-                "avg_size_kb",
-                "max_size_kb",
-                "min_size_kb",
-                "success_rate_percent",
-            ]
-        )
+    def calculate_summary_by_type(
+        self, df: pd.DataFrame, aggregates: Optional[Aggregates] = None
+    ) -> pd.DataFrame:
+        """Calculate performance summary by resource type.
 
-        return summary.reset_index()
+        Args:
+            df: DataFrame with HAR data
+            aggregates: Precomputed aggregates of ``df``
 
-    def calculate_percentiles(self, df: pd.DataFrame) -> dict[str, float]:
+        Returns:
+            Summary DataFrame grouped by resource type
+        """
+        self.logger.debug("Calculating performance summary by type")
+        summary: pd.DataFrame = (
+            aggregates or self.aggregate(df)
+        ).summary_by_type.copy()
+        return summary
+
+    def calculate_percentiles(
+        self, df: pd.DataFrame, aggregates: Optional[Aggregates] = None
+    ) -> dict[str, float]:
         """Calculate response time percentiles.
 
         Args:
             df: DataFrame with HAR data
+            aggregates: Precomputed aggregates of ``df``
 
         Returns:
             Dictionary with percentile values
         """
-        percentiles = [50, 75, 90, 95, 99]
-        result = {}
-
-        for p in percentiles:
-            result[f"p{p}"] = df["response_time_ms"].quantile(p / 100)
-
-        return result
+        return dict((aggregates or self.aggregate(df)).percentiles)
 
     def get_top_resources(
         self, df: pd.DataFrame, metric: str, n: int = 5
@@ -103,30 +114,42 @@ class PerformanceMetrics:
         Returns:
             Dictionary mapping resource type to top resources DataFrame
         """
-        top_resources = {}
+        return grouped_top_k(df, [metric], n)[metric]
+
+    def get_top_resources_by_metric(
+        self, df: pd.DataFrame, metrics: Sequence[str], n: int = 5
+    ) -> dict[str, dict[str, pd.DataFrame]]:
+        """Get top N resources per resource type for several metrics at once.
 
-        for resource_type in df["type"].unique():
-            type_df = df[df["type"] == resource_type]
-            if len(type_df) > 0:
-                top_n = type_df.nlargest(min(n, len(type_df)), metric)[
-                    ["url", metric, "type", "method", "status_code"]
-                ]
-                top_resources[resource_type] = top_n
+        Args:
+            df: DataFrame with HAR data
+            metrics: Metrics to sort by
+            n: Number of top resources to return
 
-        return top_resources
+        Returns:
+            Dictionary mapping each metric to the ``get_top_resources`` result
+        """
+        return grouped_top_k(df, metrics, n)
 
-    def calculate_performance_grade(self, df: pd.DataFrame) -> tuple[str, str, str]:
+    def calculate_performance_grade(
+        self, df: pd.DataFrame, aggregates: Optional[Aggregates] = None
+    ) -> tuple[str, str, str]:
         """Calculate overall performance grade.
 
         Args:
             df: DataFrame with HAR data
+            aggregates: Precomputed aggregates of ``df``
 
         Returns:
             Tuple of (grade, emoji, explanation)
         """
-        avg_response = df["response_time_ms"].mean()
-        p95_response = df["response_time_ms"].quantile(0.95)
+        aggregates = aggregates or self.aggregate(df)
+        return self._grade(
+            aggregates.avg_response_time_ms, aggregates.percentiles["p95"]
+        )
 
+    def _grade(self, avg_response: float, p95_response: float) -> tuple[str, str, str]:
+        """Grade an average and p95 response time against the thresholds."""
         if (
             avg_response < self.thresholds.a_plus
             and p95_response < self.thresholds.p95_a_plus
@@ -155,30 +178,65 @@ class PerformanceMetrics:
                 "Poor performance affecting user experience. Immediate optimization required.",
             )
 
-    def calculate_core_web_vitals(self, df: pd.DataFrame) -> dict[str, Any]:
+    def calculate_confidence_intervals(
+        self,
+        df: pd.DataFrame,
+        aggregates: Optional[Aggregates] = None,
+        level: float = DEFAULT_CONFIDENCE,
+    ) -> Optional[dict[str, Any]]:
+        """Calculate confidence intervals of statistics estimated from a sample.
+
+        Args:
+            df: DataFrame with HAR data
+            aggregates: Precomputed aggregates of ``df``
+            level: Confidence level
+
+        Returns:
+            Dictionary with ``(low, high)`` bounds of the percentiles, the
+            per-type p90/p95 and the timing medians/p95, and the best and
+            worst grade within the bounds of p95; None unless the
+            aggregates come from a sample
+        """
+        aggregates = aggregates or self.aggregate(df)
+        if not isinstance(aggregates, SampledAggregates):
+            return None
+
+        intervals = aggregates.confidence_intervals(level)
+        low, high = intervals["percentiles"]["p95"]
+        avg_response = aggregates.avg_response_time_ms
+        return {
+            "level": level,
+            **intervals,
+            "grade": {
+                "best": self._grade(avg_response, low)[0],
+                "worst": self._grade(avg_response, high)[0],
+            },
+        }
+
+    def calculate_core_web_vitals(
+        self, df: pd.DataFrame, aggregates: Optional[Aggregates] = None
+    ) -> dict[str, Any]:
         """Calculate Core Web Vitals metrics approximation.
 
         Args:
             df: DataFrame with HAR data
+            aggregates: Precomputed aggregates of ``df``
 
         Returns:
             Dictionary with Core Web Vitals metrics
         """
         # Note: These are approximations based on HAR data
         # Real Core Web Vitals require browser performance APIs
+        aggregates = aggregates or self.aggregate(df)
 
         # First Contentful Paint approximation (first HTML response)
-        html_requests = df[df["type"] == "HTML"]
-        fcp_approx = (
-            html_requests["response_time_ms"].min() if len(html_requests) > 0 else 0
-        )
+        fcp_approx = aggregates.html_min_response_ms
+        if fcp_approx is None:
+            fcp_approx = 0
 
         # Largest Contentful Paint approximation (largest image + time)
-        image_requests = df[df["type"] == "Image"]
-        if len(image_requests) > 0:
-            largest_image = image_requests.loc[image_requests["size_kb"].idxmax()]
-            lcp_approx = largest_image["response_time_ms"]
-        else:
+        lcp_approx = aggregates.largest_image_response_ms
+        if lcp_approx is None:
             lcp_approx = fcp_approx
 
         # Cumulative Layout Shift (cannot be calculated from HAR)
@@ -191,76 +249,68 @@ class PerformanceMetrics:
             "note": "These are approximations based on HAR data. Real Core Web Vitals require browser performance APIs.",
         }
 
-    def analyze_timing_breakdown(self, df: pd.DataFrame) -> dict[str, dict[str, float]]:
+    def analyze_timing_breakdown(
+        self, df: pd.DataFrame, aggregates: Optional[Aggregates] = None
+    ) -> dict[str, dict[str, float]]:
         """Analyze timing breakdown by phase.
 
+        Negative timings (a HAR convention for "not applicable") count as 0.
+
         Args:
             df: DataFrame with HAR data
+            aggregates: Precomputed aggregates of ``df``
 
         Returns:
             Dictionary with timing analysis
         """
-        timing_columns = [
-            "timing_blocked",
-            "timing_dns",
-            "timing_connect",
-            "timing_send",
-            "timing_wait",
-            "timing_receive",
-        ]
-
-        # Filter out negative values (HAR format quirk)
-        timing_df = df[timing_columns].copy()
-        timing_df[timing_df < 0] = 0
-
-        return {
-            "averages": timing_df.mean().to_dict(),
-            "medians": timing_df.median().to_dict(),
-            "p95": timing_df.quantile(0.95).to_dict(),
-            "totals": timing_df.sum().to_dict(),
-        }
+        breakdown = (aggregates or self.aggregate(df)).timing_breakdown
+        return {key: dict(values) for key, values in breakdown.items()}
 
-    def detect_performance_issues(self, df: pd.DataFrame) -> list[dict[str, Any]]:
+    def detect_performance_issues(
+        self, df: pd.DataFrame, aggregates: Optional[Aggregates] = None
+    ) -> list[dict[str, Any]]:
         """Detect common performance issues.
 
         Args:
             df: DataFrame with HAR data
+            aggregates: Precomputed aggregates of ``df``
 
         Returns:
             List of detected issues with recommendations
         """
+        aggregates = aggregates or self.aggregate(df)
         issues = []
 
         # Slow resources
-        slow_threshold = 2000  # 2 seconds
-        slow_resources = df[df["response_time_ms"] > slow_threshold]
-        if len(slow_resources) > 0:
+        slow_threshold = SLOW_RESOURCE_MS
+        slow_count = aggregates.slow_count
+        if slow_count > 0:
             issues.append(
                 {
                     "type": "slow_resources",
                     "severity": "high",
-                    "count": len(slow_resources),
-                    "description": f"{len(slow_resources)} resources taking over {slow_threshold}ms",
+                    "count": slow_count,
+                    "description": f"{slow_count} resources taking over {slow_threshold}ms",
                     "recommendation": "Optimize slow-loading resources, consider CDN, compression",
                 }
             )
 
         # Large resources
-        large_threshold = 1024  # 1MB
-        large_resources = df[df["size_kb"] > large_threshold]
-        if len(large_resources) > 0:
+        large_threshold = LARGE_RESOURCE_KB
+        large_count = aggregates.large_count
+        if large_count > 0:
             issues.append(
                 {
                     "type": "large_resources",
                     "severity": "medium",
-                    "count": len(large_resources),
-                    "description": f"{len(large_resources)} resources over {large_threshold}KB",
+                    "count": large_count,
+                    "description": f"{large_count} resources over {large_threshold}KB",
                     "recommendation": "Optimize file sizes, use compression, lazy loading",
                 }
             )
 
         # Too many requests
-        total_requests = len(df)
+        total_requests = aggregates.total_requests
         if total_requests > 100:
             issues.append(
                 {
@@ -273,14 +323,14 @@ class PerformanceMetrics:
             )
 
         # Failed requests
-        failed_requests = df[df["status_code"] >= 400]
-        if len(failed_requests) > 0:
+        failed_count = aggregates.failed_count
+        if failed_count > 0:
             issues.append(
                 {
                     "type": "failed_requests",
                     "severity": "high",
-                    "count": len(failed_requests),
-                    "description": f"{len(failed_requests)} failed requests (4xx/5xx status)",
+                    "count": failed_count,
+                    "description": f"{failed_count} failed requests (4xx/5xx status)",
                     "recommendation": "Fix broken links and server errors",
                 }
             )
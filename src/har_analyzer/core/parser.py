@@ -1,35 +1,189 @@
 """HAR file parser module."""
 
-import json
-from datetime import datetime
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import pandas as pd
 
+from har_analyzer import __version__
+from har_analyzer.core.aggregates import RunningAggregates
+from har_analyzer.core.cache import ParseCache
+from har_analyzer.core.columns import ENTRY_SCHEMA, EXTENDED_SCHEMA, ColumnarBuilder
+from har_analyzer.core.filters import RowFilter
+from har_analyzer.core.sampling import BernoulliSampler, ReservoirSampler
+from har_analyzer.core.sharding import (
+    ByteRange,
+    ShardMismatchError,
+    iter_shard_entries,
+    plan_shards,
+)
+from har_analyzer.core.spill import SpilledFrame
 from har_analyzer.utils import (
+    ConfigurationError,
     HARParsingError,
-    categorize_resource_type,
+    InvalidHARFileError,
+    MemoryGuard,
+    MemoryLimitExceededError,
+    StageProfiler,
+    ValidationError,
+    detect_compression,
     get_logger,
+    get_memory_usage,
+    open_har,
     safe_get,
-    validate_har_file,
-    validate_memory_usage,
+    validate_har_path,
+)
+from har_analyzer.utils.helpers import ResourceClassifier
+from har_analyzer.utils.streaming import HARStream, build_projection
+
+# Bump whenever a change alters the parsed output, to invalidate cached data
+PARSER_VERSION = 1
+
+# Entry members read by _process_entry; everything else, such as response
+# bodies, headers and cookies, is skipped without being decoded
+ENTRY_FIELDS = (
+    "startedDateTime",
+    "time",
+    "request.method",
+    "request.url",
+    "response.status",
+    "response.bodySize",
+    "response.encodedBodySize",
+    "response.content.size",
+    "response.content.mimeType",
+    "timings",
+)
+
+# Entry members read by _extended_values
+EXTENDED_ENTRY_FIELDS = (
+    "serverIPAddress",
+    "connection",
+    "request.headersSize",
+    "response.headersSize",
+    "response._transferSize",
+    "response.headers",
 )
 
+# Response headers kept by the extended schema, by lowercase name
+EXTENDED_HEADERS = ("cache-control", "content-encoding")
+
+# Rows aggregated at a time for the exact totals of a sampled parse
+SAMPLE_CHUNK_ROWS = 10_000
+
+# Share of the headroom below the memory limit an out-of-core parse fills
+# before spilling; building and encoding a chunk needs about as much again
+SPILL_FRACTION = 0.4
+
 
 class HARParser:
     """Parser for Chrome HAR files."""
 
-    def __init__(self, memory_limit_mb: int = 1024):
+    def __init__(
+        self,
+        memory_limit_mb: int = 1024,
+        resource_rules: Optional[Iterable[Any]] = None,
+        workers: int = 1,
+        min_shard_bytes: int = 16 * 1024 * 1024,
+        cache: Optional[ParseCache] = None,
+        profiler: Optional[StageProfiler] = None,
+        entry_fields: Optional[Iterable[str]] = None,
+        extended: bool = False,
+        filter_expr: Optional[str] = None,
+        sample_size: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        sample_seed: int = 0,
+        spill_dir: Optional[Path] = None,
+    ):
         """Initialize HAR parser.
 
         Args:
             memory_limit_mb: Memory limit in megabytes
+            resource_rules: Resource type rules, defaults to the built-in set
+            workers: Number of processes used to parse large files
+            min_shard_bytes: Smallest share of a file given to a worker
+            cache: Cache of parsed data, or None to always parse
+            profiler: Records the time and memory of each parsing stage
+            entry_fields: Dotted paths of the entry members to decode,
+                defaults to ``ENTRY_FIELDS`` (plus ``EXTENDED_ENTRY_FIELDS``)
+            extended: Also extract the ``EXTENDED_SCHEMA`` columns
+            filter_expr: Keep only entries matching this expression, see
+                ``har_analyzer.core.filters``
+            sample_size: Keep a uniform reservoir sample of this many entries
+            sample_fraction: Keep each entry with this probability; ignored
+                when ``sample_size`` is set
+            sample_seed: Random seed of the sample
+            spill_dir: Directory of the spill files of ``parse_chunks``, the
+                system temporary directory if None
+
+        Raises:
+            ConfigurationError: If the filter expression is invalid
+            ValueError: If the sample size or fraction is out of range
         """
         self.logger = get_logger(__name__)
         self.memory_limit_mb = memory_limit_mb
-        self._data: Optional[dict[str, Any]] = None
-        self._entries: Optional[list[dict[str, Any]]] = None
+        self.workers = max(1, workers)
+        self.min_shard_bytes = min_shard_bytes
+        self.cache = cache
+        self.profiler = profiler or StageProfiler()
+        self.extended = extended
+        self.schema = ENTRY_SCHEMA + EXTENDED_SCHEMA if extended else ENTRY_SCHEMA
+        if entry_fields is None:
+            entry_fields = (
+                ENTRY_FIELDS + EXTENDED_ENTRY_FIELDS if extended else ENTRY_FIELDS
+            )
+        self.entry_fields = tuple(entry_fields)
+        self.projection = build_projection(self.entry_fields)
+        self.classifier = (
+            ResourceClassifier(resource_rules)
+            if resource_rules is not None
+            else ResourceClassifier()
+        )
+        self.row_filter: Optional[RowFilter] = None
+        self.set_filter(filter_expr)
+        if sample_size is not None and sample_size < 1:
+            raise ValueError(f"Sample size must be positive, got {sample_size}")
+        if sample_fraction is not None and not 0 < sample_fraction <= 1:
+            raise ValueError(
+                f"Sample fraction must be in (0, 1], got {sample_fraction}"
+            )
+        self.sample_size = sample_size
+        self.sample_fraction = None if sample_size is not None else sample_fraction
+        self.sample_seed = sample_seed
+        # Exact aggregates of every kept entry, set by a sampled parse
+        self.sample_totals: Optional[RunningAggregates] = None
+        self.spill_dir = spill_dir
+        self._spill_target: Optional[SpilledFrame] = None
+        self._spill_metadata: dict[str, Any] = {}
+        self._log: Optional[dict[str, Any]] = None
+        self._entries_count = 0
+        self._unparsed_timestamps = 0
+        self._sampled_requests = 0
+
+    def set_filter(self, filter_expr: Optional[str]) -> None:
+        """Set the expression entries must match to be kept.
+
+        The filter is applied to each row as it is extracted, so rejected
+        entries never reach the column buffers.
+
+        Args:
+            filter_expr: Filter expression, or None to keep every entry
+
+        Raises:
+            ConfigurationError: If the expression is invalid
+        """
+        self.row_filter = (
+            RowFilter(filter_expr, self.schema, self.classifier)
+            if filter_expr
+            else None
+        )
+
+    @property
+    def sampling(self) -> bool:
+        """Whether parsing keeps a sample of the entries."""
+        return self.sample_size is not None or self.sample_fraction is not None
 
     def parse_file(self, file_path: Path) -> pd.DataFrame:
         """Parse HAR file and return structured data.
@@ -41,74 +195,414 @@ class HARParser:
             DataFrame with parsed HAR data
 
         Raises:
+            InvalidHARFileError: If file is missing or not valid JSON
+            ValidationError: If file structure is invalid
+            MemoryLimitExceededError: If parsing would exceed the memory limit
             HARParsingError: If parsing fails
         """
         self.logger.info(f"Parsing HAR file: {file_path}")
 
-        # Validate file
-        validate_har_file(file_path)
+        # Structure is validated while streaming, so only check the path here
+        validate_har_path(file_path)
 
         try:
-            # Load HAR data
-            with open(file_path, encoding="utf-8") as f:
-                self._data = json.load(f)
+            with self.profiler.stage("parse", file_bytes=file_path.stat().st_size):
+                return self._parse(file_path)
+
+        except (InvalidHARFileError, ValidationError, MemoryLimitExceededError):
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to parse HAR file: {e}")
+            raise HARParsingError(f"Failed to parse HAR file: {e}")
+
+    def parse_chunks(self, file_path: Path) -> SpilledFrame:
+        """Parse a HAR file, spilling rows to disk instead of exceeding memory.
 
-            self._entries = self._data["log"]["entries"]
-            self.logger.info(f"Found {len(self._entries)} entries in HAR file")
+        Whenever memory usage passes ``SPILL_FRACTION`` of the headroom below
+        ``memory_limit_mb``, the rows parsed so far are written to a spill
+        file and parsing continues with empty buffers. The file is streamed
+        in this process and the result is not cached. Sampled parses only
+        hold the sample, so they are never spilled.
 
-            # Convert to DataFrame
-            df = self._convert_to_dataframe()
+        Args:
+            file_path: Path to HAR file
 
-            self.logger.info(f"Successfully parsed {len(df)} requests")
-            return df
+        Returns:
+            Frame with the spilled chunks, and the rows parsed after the
+            last spill as its tail
 
+        Raises:
+            InvalidHARFileError: If file is missing or not valid JSON
+            ValidationError: If file structure is invalid
+            MemoryLimitExceededError: If usage exceeds the limit even though
+                rows are spilled
+            ConfigurationError: If the limit is below the memory in use
+                before parsing starts
+            HARParsingError: If parsing fails
+        """
+        self.logger.info(f"Parsing HAR file out of core: {file_path}")
+        validate_har_path(file_path)
+
+        frames = SpilledFrame(self.spill_dir)
+        self._spill_target = frames
+        self._spill_metadata = {}
+        self._unparsed_timestamps = 0
+        self.sample_totals = None
+        profiler = self.profiler
+        try:
+            with profiler.stage("parse", file_bytes=file_path.stat().st_size):
+                with profiler.stage("parse.stream"):
+                    builder = self._parse_sequential(file_path)
+                self.logger.info(f"Found {self._entries_count} entries in HAR file")
+                spilled_timestamps = self._unparsed_timestamps
+                self._unparsed_timestamps = 0
+                if len(builder) or not frames.spilled:
+                    with profiler.stage("parse.dataframe", rows=len(builder)):
+                        frames.tail = self._build_dataframe(builder)
+                self._unparsed_timestamps += spilled_timestamps
+
+        except (
+            InvalidHARFileError,
+            ValidationError,
+            MemoryLimitExceededError,
+            ConfigurationError,
+        ):
+            frames.close()
+            raise
         except Exception as e:
+            frames.close()
             self.logger.error(f"Failed to parse HAR file: {e}")
             raise HARParsingError(f"Failed to parse HAR file: {e}")
+        finally:
+            self._spill_target = None
+
+        if frames.spilled:
+            self._spill_metadata = {
+                "spill": {
+                    "chunks": len(frames.paths),
+                    "spilled_requests": frames.spilled_rows,
+                    "spilled_bytes": frames.spilled_bytes,
+                }
+            }
+        self.logger.info(
+            f"Successfully parsed {len(frames)} requests, "
+            f"{frames.spilled_rows} spilled to disk"
+        )
+        return frames
+
+    def parse_entries(self, entries: Iterable[Any]) -> pd.DataFrame:
+        """Parse already decoded HAR entries, such as a live capture's.
+
+        Entries that cannot be processed or do not match the filter are
+        skipped, as when parsing files. ``unparsed_timestamps`` counts the
+        start times of these entries that could not be parsed.
 
-    def _convert_to_dataframe(self) -> pd.DataFrame:
-        """Convert HAR entries to pandas DataFrame.
+        Args:
+            entries: Decoded HAR entries (items of ``log.entries``)
 
         Returns:
-            DataFrame with processed HAR data
+            DataFrame with the parsed entries, empty if none was kept
+
+        Raises:
+            MemoryLimitExceededError: If usage exceeds the memory limit
+        """
+        builder = self._collect_entries(entries)
+        df = self._frame(builder)
+        self._unparsed_timestamps = builder.unparsed_timestamps
+        return df
+
+    @property
+    def unparsed_timestamps(self) -> int:
+        """Number of start times the last parse could not read."""
+        return self._unparsed_timestamps
+
+    def _parse(self, file_path: Path) -> pd.DataFrame:
+        """Parse a HAR file, loading it from the cache when possible.
+
+        Sampled parses always stream the file in this process, since both
+        the sample and the exact totals depend on seeing every entry in
+        document order, and are never cached.
+
+        Args:
+            file_path: Path to HAR file
+
+        Returns:
+            DataFrame with parsed HAR data
+        """
+        profiler = self.profiler
+        cache_key = None
+        self.sample_totals = None
+        self._spill_metadata = {}
+        if self.cache is not None and not self.sampling:
+            with profiler.stage("parse.cache_load") as record:
+                cache_key = self.cache.key(file_path, self._cache_salt())
+                cached = self.cache.load(cache_key)
+                record["hit"] = cached is not None
+            if cached is not None:
+                df, metadata = cached
+                self._restore_metadata(metadata)
+                self.logger.info(f"Loaded {len(df)} parsed requests from cache")
+                return df
+
+        builder = None
+        if self.workers > 1 and not self.sampling:
+            with profiler.stage("parse.parallel", workers=self.workers):
+                builder = self._parse_parallel(file_path)
+        if builder is None:
+            with profiler.stage("parse.stream"):
+                builder = self._parse_sequential(file_path)
+        self.logger.info(f"Found {self._entries_count} entries in HAR file")
+
+        with profiler.stage("parse.dataframe", rows=len(builder)):
+            df = self._build_dataframe(builder)
+
+        self.logger.info(f"Successfully parsed {len(df)} requests")
+        if self.cache is not None and cache_key is not None:
+            with profiler.stage("parse.cache_store"):
+                self.cache.store(cache_key, df, self._cache_metadata())
+        return df
+
+    def _parse_sequential(self, file_path: Path) -> ColumnarBuilder:
+        """Stream all entries of a HAR file in the current process.
+
+        Args:
+            file_path: Path to HAR file
+
+        Returns:
+            Builder holding the processed entries
+        """
+        # Stream entries straight from disk instead of loading the document
+        compressed = detect_compression(file_path) is not None
+        with open_har(file_path) as f:
+            stream = HARStream(f)
+            # The uncompressed size is unknown, so compressed input is only
+            # checked against the limit, without projecting the peak
+            guard = MemoryGuard(
+                self.memory_limit_mb,
+                total_bytes=None if compressed else file_path.stat().st_size,
+                bytes_read=None if compressed else f.tell,
+                spill_fraction=(
+                    SPILL_FRACTION if self._spill_target is not None else None
+                ),
+            )
+            # JSON decoding happens inside the stream, between the entries
+            # timed by _collect_entries
+            timers = self.profiler.timers
+            extraction = timers.get("parse.entry_extraction", 0.0)
+            started = time.perf_counter()
+            builder = self._collect_entries(
+                stream.iter_entries(projection=self.projection), guard
+            )
+            if self.profiler.detailed:
+                extraction = timers["parse.entry_extraction"] - extraction
+                self.profiler.add_time(
+                    "parse.json_decode", time.perf_counter() - started - extraction
+                )
+
+        self._log = stream.log
+        self._entries_count = stream.entries_count
+        return builder
+
+    def _parse_parallel(self, file_path: Path) -> Optional[ColumnarBuilder]:
+        """Parse byte-range shards of the entries array in worker processes.
+
+        Args:
+            file_path: Path to HAR file
+
+        Returns:
+            Builder holding the processed entries in document order, or None
+            if the file is compressed or too small to split, the shards did
+            not line up, or a worker ran out of its share of the memory limit
         """
-        data: list[dict[str, Any]] = []
-        if self._entries is None:
-            return pd.DataFrame(data)
+        # Compressed streams cannot be entered at arbitrary byte offsets
+        if detect_compression(file_path) is not None:
+            self.logger.debug("Compressed HAR file, parsing sequentially")
+            return None
+
+        with open(file_path, "rb") as f:
+            stream = HARStream(f)
+            entries_offset = stream.locate_entries()
+        head = stream.log
+
+        shards = plan_shards(
+            file_path, entries_offset, self.workers, self.min_shard_bytes
+        )
+        if len(shards) < 2:
+            return None
 
-        total_entries = len(self._entries)
+        # Workers start from about this process's usage and run at the same
+        # time, so each gets a share of the headroom above it
+        baseline_mb = get_memory_usage()
+        limit_mb = baseline_mb + (self.memory_limit_mb - baseline_mb) / len(shards)
+        self.logger.info(
+            f"Parsing {len(shards)} shards in parallel ({limit_mb:.0f}MB each)"
+        )
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(
+                    _parse_shard,
+                    self,
+                    file_path,
+                    start,
+                    length,
+                    length is None,
+                    limit_mb,
+                )
+                for start, length in shards
+            ]
+            try:
+                results = [future.result() for future in futures]
+            except (ShardMismatchError, MemoryLimitExceededError) as e:
+                pool.shutdown(cancel_futures=True)
+                self.logger.warning(f"{e}; falling back to sequential parsing")
+                return None
+
+        builder, entries_count, tail = results[0]
+        for shard_builder, shard_count, shard_tail in results[1:]:
+            builder.extend(shard_builder)
+            entries_count += shard_count
+            tail.update(shard_tail)
+
+        self._log = {**head, **tail}
+        self._entries_count = entries_count
+        return builder
+
+    def _collect_entries(
+        self, entries: Iterable[Any], guard: Optional[MemoryGuard] = None
+    ) -> ColumnarBuilder:
+        """Process HAR entries into a columnar builder.
+
+        When sampling, only the sampled rows reach the returned builder;
+        every row is also buffered in chunks of ``SAMPLE_CHUNK_ROWS`` that
+        are folded into ``sample_totals``. During ``parse_chunks``, rows are
+        spilled whenever the guard reports usage above its spill threshold,
+        and the builder only holds the rows after the last spill.
 
-        for i, entry in enumerate(self._entries):
-            if i % 100 == 0:  # Progress logging
-                self.logger.debug(f"Processing entry {i+1}/{total_entries}")
+        Args:
+            entries: Iterable of decoded HAR entries
+            guard: Memory guard tracking the input, defaults to one that
+                only checks current usage
 
-                # Check memory usage
-                from har_analyzer.utils.helpers import get_memory_usage
+        Returns:
+            Builder holding the processed entries
 
-                current_memory = get_memory_usage()
-                validate_memory_usage(current_memory, self.memory_limit_mb)
+        Raises:
+            MemoryLimitExceededError: If usage or projected peak usage
+                exceeds the memory limit
+        """
+        builder = ColumnarBuilder(self.schema)
+        guard = guard or MemoryGuard(self.memory_limit_mb)
+        row_filter = self.row_filter
+        sampler = self._new_sampler()
+        spill = self._spill_target if sampler is None else None
+        if sampler is not None:
+            chunk = ColumnarBuilder(self.schema)
+            totals = RunningAggregates(track_quantiles=False)
+        # Per-entry timing costs two clock reads, so only when asked for
+        clock = time.perf_counter if self.profiler.detailed else None
+        extraction = 0.0
+
+        for i, entry in enumerate(entries):
+            rows = len(builder) if sampler is None else len(builder) + len(chunk)
+            if guard.check(rows) and spill is not None and len(builder):
+                self._spill(builder, spill)
+                builder = ColumnarBuilder(self.schema)
+            if clock:
+                started = clock()
 
             try:
-                processed_entry = self._process_entry(entry)
-                if processed_entry:
-                    data.append(processed_entry)
+                row = self._process_entry(entry)
+                if row and (row_filter is None or row_filter(row)):
+                    if sampler is None:
+                        builder.append(row)
+                    else:
+                        chunk.append(row)
+                        if sampler.offer(row):
+                            builder.append(row)
             except Exception as e:
                 self.logger.warning(f"Failed to process entry {i}: {e}")
-                continue
 
-        if not data:
+            if clock:
+                extraction += clock() - started
+            if sampler is not None and len(chunk) >= SAMPLE_CHUNK_ROWS:
+                totals.update(self._frame(chunk))
+                chunk = ColumnarBuilder(self.schema)
+
+        if clock:
+            self.profiler.add_time("parse.entry_extraction", extraction)
+        if sampler is not None:
+            totals.update(self._frame(chunk))
+            for row in sampler.items():
+                builder.append(row)
+            self.sample_totals = totals
+            self._sampled_requests = len(builder)
+        return builder
+
+    def _spill(self, builder: ColumnarBuilder, frames: SpilledFrame) -> None:
+        """Write the rows of a builder to a spill file."""
+        with self.profiler.stage("parse.spill", rows=len(builder)):
+            df = self._frame(builder)
+            # Added to the tail's count by parse_chunks
+            self._unparsed_timestamps += builder.unparsed_timestamps
+            frames.spill(df)
+
+    def _new_sampler(self) -> Union[ReservoirSampler, BernoulliSampler, None]:
+        """Create the sampler of a parse, or None when keeping every entry."""
+        if self.sample_size is not None:
+            return ReservoirSampler(self.sample_size, self.sample_seed)
+        if self.sample_fraction is not None:
+            return BernoulliSampler(self.sample_fraction, self.sample_seed)
+        return None
+
+    def _frame(self, builder: ColumnarBuilder) -> pd.DataFrame:
+        """Build a DataFrame from a builder and add the resource type."""
+        df = builder.build()
+        types = self.classifier.classify_many(df["mime_type"], df["url"])
+        position = list(df.columns).index("status_code") + 1
+        df.insert(position, "type", pd.Series(types, index=df.index))
+        return df
+
+    def _build_dataframe(self, builder: ColumnarBuilder) -> pd.DataFrame:
+        """Build the parsed DataFrame, adding derived columns.
+
+        Args:
+            builder: Builder holding the processed entries
+
+        Returns:
+            DataFrame with processed HAR data
+
+        Raises:
+            HARParsingError: If no entry could be processed
+        """
+        if not len(builder):
+            if self.sample_totals is not None and self.sample_totals.total_requests:
+                raise HARParsingError(
+                    f"No entries were sampled out of "
+                    f"{self.sample_totals.total_requests}; "
+                    f"increase the sample fraction"
+                )
+            if self.row_filter is not None:
+                raise HARParsingError(
+                    f"No entries match the filter: {self.row_filter.expression}"
+                )
             raise HARParsingError("No valid entries found in HAR file")
 
-        return pd.DataFrame(data)
+        df = self._frame(builder)
+        self._unparsed_timestamps = builder.unparsed_timestamps
+        if self._unparsed_timestamps:
+            self.logger.warning(
+                f"Could not parse start time of {self._unparsed_timestamps} entries"
+            )
+        return df
 
-    def _process_entry(self, entry: dict[str, Any]) -> Optional[dict[str, Any]]:
+    def _process_entry(self, entry: dict[str, Any]) -> Optional[tuple[Any, ...]]:
         """Process a single HAR entry.
 
         Args:
             entry: HAR entry dictionary
 
         Returns:
-            Processed entry data or None if invalid
+            Row values in ``schema`` order or None if invalid
         """
         try:
             # Extract basic information
@@ -133,24 +627,8 @@ class HARParser:
             elif safe_get(entry, "response", "encodedBodySize", default=0) > 0:
                 size_bytes = entry["response"]["encodedBodySize"]
 
-            # Parse start time
-            start_time_str = safe_get(entry, "startedDateTime")
-            start_time = None
-            if start_time_str:
-                try:
-                    start_time = datetime.fromisoformat(
-                        start_time_str.replace("Z", "+00:00")
-                    )
-                except ValueError:
-                    # Fallback for different datetime formats
-                    try:
-                        start_time = datetime.strptime(
-                            start_time_str, "%Y-%m-%dT%H:%M:%S.%fZ"
-                        )
-                    except ValueError:
-                        self.logger.warning(
-                            f"Could not parse start time: {start_time_str}"
-                        )
+            # Start time is kept raw and converted per column on build
+            start_time = safe_get(entry, "startedDateTime")
 
             # Status code
             status_code = safe_get(entry, "response", "status", default=0)
@@ -167,42 +645,170 @@ class HARParser:
             wait = safe_get(timings, "wait", default=0)
             receive = safe_get(timings, "receive", default=0)
 
-            return {
-                "url": url,
-                "method": method,
-                "status_code": status_code,
-                "type": categorize_resource_type(mime_type, url),
-                "mime_type": mime_type,
-                "response_time_ms": response_time_ms,
-                "size_bytes": size_bytes,
-                "size_kb": size_bytes / 1024 if size_bytes > 0 else 0,
-                "start_time": start_time,
-                "timing_blocked": blocked,
-                "timing_dns": dns,
-                "timing_connect": connect,
-                "timing_send": send,
-                "timing_wait": wait,
-                "timing_receive": receive,
-            }
+            row: tuple[Any, ...] = (
+                url,
+                method,
+                status_code,
+                mime_type,
+                response_time_ms,
+                size_bytes,
+                start_time,
+                blocked,
+                dns,
+                connect,
+                send,
+                wait,
+                receive,
+            )
+            if self.extended:
+                row += self._extended_values(entry)
+            return row
 
         except Exception as e:
             self.logger.warning(f"Error processing entry: {e}")
             return None
 
+    def _extended_values(self, entry: dict[str, Any]) -> tuple[Any, ...]:
+        """Extract the ``EXTENDED_SCHEMA`` values of a HAR entry.
+
+        Args:
+            entry: HAR entry dictionary
+
+        Returns:
+            Values in ``EXTENDED_SCHEMA`` order
+        """
+        headers: dict[str, str] = {}
+        for header in safe_get(entry, "response", "headers", default=None) or ():
+            name = str(safe_get(header, "name", default="")).lower()
+            if name in EXTENDED_HEADERS:
+                value = str(safe_get(header, "value", default="")).strip()
+                headers[name] = (
+                    f"{headers[name]}, {value}" if name in headers else value
+                )
+
+        return (
+            safe_get(entry, "serverIPAddress", default=""),
+            safe_get(entry, "connection", default=""),
+            safe_get(entry, "response", "_transferSize", default=-1),
+            safe_get(entry, "request", "headersSize", default=-1),
+            safe_get(entry, "response", "headersSize", default=-1),
+            headers.get("cache-control", ""),
+            headers.get("content-encoding", ""),
+        )
+
+    def _cache_salt(self) -> str:
+        """Describe everything besides the file content that shapes the output."""
+        schema = [tuple(spec) for spec in self.schema]
+        return (
+            f"{__version__}:{PARSER_VERSION}:{schema}:"
+            f"{self.classifier.signature}:{sorted(self.entry_fields)}:"
+            f"{self.row_filter.tree if self.row_filter else None}"
+        )
+
+    def _cache_metadata(self) -> dict[str, Any]:
+        """Collect the parser state stored alongside cached data."""
+        return {
+            "log": self._log,
+            "entries_count": self._entries_count,
+            "unparsed_timestamps": self._unparsed_timestamps,
+        }
+
+    def _restore_metadata(self, metadata: dict[str, Any]) -> None:
+        """Restore parser state from cached metadata."""
+        self._log = metadata["log"]
+        self._entries_count = metadata["entries_count"]
+        self._unparsed_timestamps = metadata["unparsed_timestamps"]
+
     def get_metadata(self) -> dict[str, Any]:
         """Get HAR file metadata.
 
         Returns:
             Dictionary with HAR metadata
         """
-        if not self._data:
+        if self._log is None:
             return {}
 
-        log = self._data.get("log", {})
+        log = self._log
         return {
             "version": safe_get(log, "version"),
             "creator": safe_get(log, "creator"),
             "browser": safe_get(log, "browser"),
             "pages": safe_get(log, "pages", default=[]),
-            "entries_count": len(self._entries) if self._entries else 0,
+            "entries_count": self._entries_count,
+            "unparsed_timestamps": self._unparsed_timestamps,
+            **self._sampling_metadata(),
+            **self._spill_metadata,
+        }
+
+    def _sampling_metadata(self) -> dict[str, Any]:
+        """Describe the sample of the last parse, empty if not sampled."""
+        totals = self.sample_totals
+        if totals is None:
+            return {}
+        if self.sample_size is not None:
+            method = {"method": "reservoir", "sample_size": self.sample_size}
+        else:
+            method = {"method": "bernoulli", "sample_fraction": self.sample_fraction}
+        return {
+            "sampling": {
+                **method,
+                "seed": self.sample_seed,
+                "sampled_requests": self._sampled_requests,
+                "population": totals.total_requests,
+            }
         }
+
+
+def _parse_shard(
+    parser: HARParser,
+    file_path: Path,
+    start: int,
+    length: Optional[int],
+    is_last: bool,
+    limit_mb: float,
+) -> tuple[ColumnarBuilder, int, dict[str, Any]]:
+    """Parse one byte-range shard of a HAR file in a worker process.
+
+    Args:
+        parser: Parser whose settings are used
+        file_path: Path to HAR file
+        start: Byte offset of the shard's first entry
+        length: Number of bytes in the shard, None for the rest of the file
+        is_last: Whether this is the final shard of the file
+        limit_mb: Memory limit of this worker in megabytes
+
+    Returns:
+        Tuple of (builder, number of entries, log members after the entries)
+    """
+    tail: dict[str, Any] = {}
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        entries = iter_shard_entries(
+            ByteRange(f, length), is_last, tail, parser.projection  # type: ignore[arg-type]
+        )
+        counted = _CountingIterator(entries)
+        guard = MemoryGuard(
+            limit_mb,
+            total_bytes=(
+                length if length is not None else file_path.stat().st_size - start
+            ),
+            bytes_read=lambda: f.tell() - start,
+        )
+        builder = parser._collect_entries(counted, guard)
+    return builder, counted.count, tail
+
+
+class _CountingIterator:
+    """Iterator wrapper counting the items it has produced."""
+
+    def __init__(self, items: Iterator[Any]):
+        self._items = items
+        self.count = 0
+
+    def __iter__(self) -> "_CountingIterator":
+        return self
+
+    def __next__(self) -> Any:
+        item = next(self._items)
+        self.count += 1
+        return item
@@ -0,0 +1,128 @@
+"""Lazily computed analysis results."""
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Callable, Optional
+
+from har_analyzer.utils import ConfigurationError, HARAnalyzerError
+
+# Sections of the analysis results, in report order
+SECTIONS = (
+    "metadata",
+    "basic_stats",
+    "performance_grade",
+    "summary_by_type",
+    "percentiles",
+    "top_resources",
+    "core_web_vitals",
+    "timing_breakdown",
+    "performance_issues",
+    "resource_breakdown",
+    "sampling",
+    "profile",
+)
+
+# Cheap sections that are always available
+REQUIRED_SECTIONS = ("metadata", "basic_stats")
+
+SECTION_ALIASES = {
+    "stats": "basic_stats",
+    "grade": "performance_grade",
+    "summary": "summary_by_type",
+    "top": "top_resources",
+    "vitals": "core_web_vitals",
+    "timings": "timing_breakdown",
+    "issues": "performance_issues",
+    "breakdown": "resource_breakdown",
+}
+
+
+def resolve_sections(names: Optional[Iterable[str]]) -> tuple[str, ...]:
+    """Resolve section names and aliases to the sections to compute.
+
+    Args:
+        names: Section names or aliases, None for all sections
+
+    Returns:
+        Sections in report order, always including ``REQUIRED_SECTIONS``
+
+    Raises:
+        ConfigurationError: If a name is not a known section or alias
+    """
+    if names is None:
+        return SECTIONS
+
+    wanted = set(REQUIRED_SECTIONS)
+    for name in names:
+        name = name.strip().lower()
+        if not name:
+            continue
+        section = SECTION_ALIASES.get(name, name)
+        if section not in SECTIONS:
+            choices = ", ".join([*SECTIONS, *SECTION_ALIASES])
+            raise ConfigurationError(
+                f"Unknown analysis section: {name} (choose from {choices})"
+            )
+        wanted.add(section)
+    return tuple(section for section in SECTIONS if section in wanted)
+
+
+class AnalysisResults(Mapping[str, Any]):
+    """Read-only mapping of analysis sections computed on first access.
+
+    Each section is built by a callable the first time it is looked up and
+    cached afterwards. Sections that were not selected are absent, so
+    ``"top_resources" in results`` and ``results.get("top_resources")``
+    behave like on a dict without that key.
+    """
+
+    def __init__(
+        self,
+        builders: Mapping[str, Callable[[], Any]],
+        sections: Optional[Iterable[str]] = None,
+    ):
+        """Initialize results.
+
+        Args:
+            builders: Callable computing each section, keyed by section name
+            sections: Sections to expose, defaults to all builders
+        """
+        names = list(builders) if sections is None else list(sections)
+        self._builders = {name: builders[name] for name in names}
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, section: str) -> Any:
+        if section not in self._values:
+            builder = self._builders[section]
+            try:
+                self._values[section] = builder()
+            except HARAnalyzerError:
+                raise
+            except Exception as e:
+                raise HARAnalyzerError(f"Failed to compute {section}: {e}")
+        return self._values[section]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def __contains__(self, section: object) -> bool:
+        return section in self._builders
+
+    @property
+    def computed(self) -> list[str]:
+        """Sections that have been computed so far."""
+        return [name for name in self._builders if name in self._values]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Compute every remaining section.
+
+        Returns:
+            Plain dictionary with all exposed sections
+        """
+        return {name: self[name] for name in self._builders}
+
+    def __repr__(self) -> str:
+        pending = [name for name in self._builders if name not in self._values]
+        return f"{type(self).__name__}(computed={self.computed}, pending={pending})"
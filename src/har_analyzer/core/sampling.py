@@ -0,0 +1,258 @@
+"""Uniform sampling of HAR entries for approximate analysis.
+
+A sampled parse keeps either a fixed-size reservoir or a Bernoulli sample
+of the entries, while counts, sums and extremes of every entry are kept
+exactly by ``RunningAggregates`` in the same pass. Percentiles and other
+quantiles are then estimated from the sample, with confidence intervals
+from order statistics.
+"""
+
+import math
+import random
+from collections.abc import Sequence
+from statistics import NormalDist
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from har_analyzer.core.aggregates import (
+    PERCENTILES,
+    TIMING_COLUMNS,
+    Aggregates,
+    FrameAggregates,
+    RunningAggregates,
+)
+
+SAMPLING_METHODS = ("reservoir", "bernoulli")
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+class ReservoirSampler:
+    """Uniform sample of a fixed number of items from a stream.
+
+    Uses Li's Algorithm L: once the reservoir is full, the number of items
+    to skip before the next replacement is drawn directly, so the random
+    number generator is called only O(k log(n/k)) times for n items.
+    """
+
+    def __init__(self, size: int, seed: int = 0):
+        """Initialize reservoir.
+
+        Args:
+            size: Number of items to keep
+            seed: Random seed
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size < 1:
+            raise ValueError(f"Reservoir size must be positive, got {size}")
+        self.size = size
+        self.seen = 0
+        self._rng = random.Random(seed)
+        self._items: list[tuple[int, Any]] = []
+        self._weight = 1.0
+        self._next = size
+
+    def _uniform(self) -> float:
+        """Draw from the open interval (0, 1)."""
+        while True:
+            value = self._rng.random()
+            if value > 0:
+                return value
+
+    def _schedule(self) -> None:
+        """Draw the next weight and the index of the next kept item."""
+        self._weight *= math.exp(math.log(self._uniform()) / self.size)
+        skip = math.log(self._uniform()) / math.log1p(-self._weight)
+        self._next = self.seen + int(min(skip, 2**62))
+
+    def offer(self, item: Any) -> bool:
+        """Offer the next item of the stream.
+
+        Returns:
+            Always False: kept items are held until ``items`` is called
+        """
+        index = self.seen
+        self.seen += 1
+        if index < self.size:
+            self._items.append((index, item))
+            if self.seen == self.size:
+                self._schedule()
+        elif index == self._next:
+            self._items[self._rng.randrange(self.size)] = (index, item)
+            self._schedule()
+        return False
+
+    def items(self) -> list[Any]:
+        """Get the sampled items in stream order."""
+        return [item for _, item in sorted(self._items, key=lambda pair: pair[0])]
+
+
+class BernoulliSampler:
+    """Keep each item of a stream independently with a fixed probability."""
+
+    def __init__(self, fraction: float, seed: int = 0):
+        """Initialize sampler.
+
+        Args:
+            fraction: Probability of keeping an item, in (0, 1]
+            seed: Random seed
+
+        Raises:
+            ValueError: If fraction is outside (0, 1]
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError(f"Sample fraction must be in (0, 1], got {fraction}")
+        self.fraction = fraction
+        self.seen = 0
+        self._random = random.Random(seed).random
+
+    def offer(self, item: Any) -> bool:
+        """Offer the next item of the stream.
+
+        Returns:
+            Whether the caller should keep the item
+        """
+        self.seen += 1
+        return self._random() < self.fraction
+
+    def items(self) -> list[Any]:
+        """Get held items; kept items are never held, so this is empty."""
+        return []
+
+
+def _z(level: float) -> float:
+    """Two-sided standard normal quantile of a confidence level."""
+    return NormalDist().inv_cdf((1 + level) / 2)
+
+
+def quantile_intervals(
+    values: np.ndarray,
+    qs: Sequence[float],
+    population: int,
+    level: float = DEFAULT_CONFIDENCE,
+) -> list[tuple[float, float]]:
+    """Distribution-free confidence intervals of quantiles from a sample.
+
+    The number of sample values below a quantile is binomial, so its
+    interval is a pair of order statistics around the quantile's rank,
+    narrowed by the finite population correction. A sample holding the
+    whole population gives the interval around the interpolated quantile.
+
+    Args:
+        values: Sampled values; NaN values are skipped
+        qs: Quantiles in [0, 1]
+        population: Number of values the sample was drawn from
+        level: Confidence level, e.g. 0.95
+
+    Returns:
+        (low, high) bounds per quantile; NaN for an empty sample
+    """
+    ordered = np.sort(values[~np.isnan(values)])
+    n = len(ordered)
+    if not n:
+        return [(math.nan, math.nan)] * len(qs)
+    fpc = math.sqrt((population - n) / (population - 1)) if population > n else 0.0
+    z = _z(level)
+    bounds = []
+    for q in qs:
+        position = q * (n - 1)
+        half = z * math.sqrt(n * q * (1 - q)) * fpc
+        low = min(max(math.floor(position - half), 0), n - 1)
+        high = min(max(math.ceil(position + half), 0), n - 1)
+        bounds.append((float(ordered[low]), float(ordered[high])))
+    return bounds
+
+
+class SampledAggregates(SimpleNamespace):
+    """Aggregates of a sampled parse.
+
+    Counts, totals, averages, extremes and value counts come from the exact
+    ``RunningAggregates`` of every entry; percentiles, per-type p90/p95 and
+    timing medians and p95 are estimated from the sample. The attributes
+    are those of the ``Aggregates`` protocol read by ``PerformanceMetrics``.
+    """
+
+    def __init__(
+        self,
+        sample: pd.DataFrame,
+        totals: RunningAggregates,
+        relative_accuracy: float,
+    ):
+        """Combine sample estimates with exact totals.
+
+        Args:
+            sample: DataFrame of the sampled entries
+            totals: Exact aggregates of all entries
+            relative_accuracy: Passed on to the sample aggregates
+        """
+        estimates = FrameAggregates(sample, "exact", relative_accuracy)
+        exact: Aggregates = totals.snapshot()
+        super().__init__(**vars(exact))
+        self.percentile_mode = "sample"
+        self.sample = sample
+        self.sample_aggregates = estimates
+        self.population = totals.total_requests
+        self.percentiles = dict(estimates.percentiles)
+
+        summary = exact.summary_by_type.set_index("type")
+        sampled = estimates.summary_by_type.set_index("type")
+        for column in ("p90_response_time_ms", "p95_response_time_ms"):
+            summary[column] = sampled[column].reindex(summary.index)
+        self.summary_by_type: pd.DataFrame = summary.reset_index()
+
+        breakdown = {
+            key: dict(values) for key, values in exact.timing_breakdown.items()
+        }
+        for key in ("medians", "p95"):
+            breakdown[key] = dict(estimates.timing_breakdown[key])
+        self.timing_breakdown: dict[str, dict[str, float]] = breakdown
+
+    def confidence_intervals(self, level: float = DEFAULT_CONFIDENCE) -> dict[str, Any]:
+        """Confidence intervals of the estimated statistics.
+
+        Args:
+            level: Confidence level
+
+        Returns:
+            Dictionary with ``(low, high)`` bounds of the overall
+            percentiles, the per-type p90/p95 and the timing medians/p95
+        """
+        sample = self.sample
+        response = sample["response_time_ms"].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        overall = quantile_intervals(
+            response, [p / 100 for p in PERCENTILES], self.population, level
+        )
+
+        by_type: dict[Any, dict[str, tuple[float, float]]] = {}
+        codes, uniques = pd.factorize(sample["type"], sort=True)
+        for code, resource_type in enumerate(uniques):
+            population = self.type_counts.get(resource_type, 0)
+            p90, p95 = quantile_intervals(
+                response[codes == code], [0.90, 0.95], population, level
+            )
+            by_type[resource_type] = {
+                "p90_response_time_ms": p90,
+                "p95_response_time_ms": p95,
+            }
+
+        timings: dict[str, dict[str, tuple[float, float]]] = {"medians": {}, "p95": {}}
+        for column in TIMING_COLUMNS:
+            values = sample[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            median, p95 = quantile_intervals(
+                np.where(values < 0, 0, values), [0.5, 0.95], self.population, level
+            )
+            timings["medians"][column] = median
+            timings["p95"][column] = p95
+
+        return {
+            "percentiles": {f"p{p}": bounds for p, bounds in zip(PERCENTILES, overall)},
+            "summary_by_type": by_type,
+            "timing_breakdown": timings,
+        }
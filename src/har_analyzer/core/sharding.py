@@ -0,0 +1,195 @@
+"""Split a HAR file's entries into byte-range shards for parallel parsing.
+
+Shard boundaries are found speculatively: each split point is moved forward
+to the next ``},{"key":`` sequence, which is how consecutive entries look but
+also how consecutive elements of ``headers``, ``cookies`` and other arrays
+of objects inside an entry look. Each candidate is therefore checked by
+scanning the object that starts there: it must have the members of an
+entry and be followed by ``,`` or ``]``. The check can still be fooled by
+a nested array of entry-like objects, so every worker has to consume its
+byte range exactly, as a sequence of complete entries, and the first shard
+starts at the verified first entry. If all shards succeed, every boundary
+is proven to be a real entry boundary; otherwise the caller falls back to
+a sequential parse.
+"""
+
+import io
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from har_analyzer.utils import HARParsingError, InvalidHARFileError
+from har_analyzer.utils.streaming import JSONStreamReader, Projection
+
+# Candidate boundary between two entries: the end of one object, a comma and
+# the start of the next one up to its first key. Requiring the key makes
+# matches inside string values (where quotes are escaped) very unlikely.
+_BOUNDARY = re.compile(rb'\}\s*,\s*(\{)\s*"(?:[^"\\]|\\.)*"\s*:')
+
+# Bytes read around a split point when looking for a boundary
+_SEARCH_WINDOW = 1024 * 1024
+
+# Members an object must have to be taken for an entry
+_ENTRY_MEMBERS = frozenset({"request", "response"})
+
+# Read buffer used when scanning a candidate entry
+_CHECK_CHUNK_SIZE = 64 * 1024
+
+# Largest distance a boundary is searched for past its split point
+_MAX_SEARCH = 64 * 1024 * 1024
+
+
+class ShardMismatchError(HARParsingError):
+    """Raised when a shard does not line up with entry boundaries."""
+
+    pass
+
+
+class ByteRange(io.RawIOBase):
+    """Read-only view of ``length`` bytes of a binary file."""
+
+    def __init__(self, stream: BinaryIO, length: Optional[int]):
+        """Initialize byte range.
+
+        Args:
+            stream: Binary stream positioned at the start of the range
+            length: Number of bytes in the range, None for the rest of the file
+        """
+        super().__init__()
+        self._stream = stream
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if self._remaining is None:
+            return self._stream.read(-1 if size is None else size)
+        if self._remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._stream.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+def _is_entry_start(f: BinaryIO, offset: int) -> bool:
+    """Check that an entry-like object followed by ``,`` or ``]`` starts here.
+
+    Member values are skipped without being decoded, so only the object's
+    keys are kept.
+    """
+    f.seek(offset)
+    reader = JSONStreamReader(f, _CHECK_CHUNK_SIZE)
+    members: set[str] = set()
+    try:
+        for key in reader.iter_object():
+            members.add(key)
+            reader.skip_value()
+        return _ENTRY_MEMBERS <= members and reader.peek() in (",", "]")
+    except (InvalidHARFileError, ValueError):
+        return False
+
+
+def _find_boundary(f: BinaryIO, position: int, limit: int) -> Optional[int]:
+    """Find the first entry start at or after ``position``."""
+    searched = 0
+    while searched < _MAX_SEARCH and position < limit:
+        f.seek(position)
+        window = f.read(min(_SEARCH_WINDOW, limit - position))
+        for match in _BOUNDARY.finditer(window):
+            if _is_entry_start(f, position + match.start(1)):
+                return position + match.start(1)
+        # Keep an overlap so a boundary split across windows is found
+        step = max(len(window) - 4096, 1)
+        position += step
+        searched += step
+    return None
+
+
+def plan_shards(
+    file_path: Path, entries_offset: int, shards: int, min_shard_bytes: int
+) -> list[tuple[int, Optional[int]]]:
+    """Split the bytes from the first entry to the end of file into shards.
+
+    Args:
+        file_path: Path to HAR file
+        entries_offset: Byte offset of the first entry
+        shards: Desired number of shards
+        min_shard_bytes: Minimum size of a shard in bytes
+
+    Returns:
+        List of (start offset, length) pairs in file order; the last shard
+        has length None and runs to the end of the file
+    """
+    size = file_path.stat().st_size
+    span = size - entries_offset
+    shards = max(1, min(shards, span // max(min_shard_bytes, 1)))
+
+    starts = [entries_offset]
+    with open(file_path, "rb") as f:
+        for i in range(1, shards):
+            split = entries_offset + span * i // shards
+            boundary = _find_boundary(f, max(split, starts[-1] + 1), size)
+            if boundary is not None and boundary > starts[-1]:
+                starts.append(boundary)
+
+    ends: list[Optional[int]] = [b - a for a, b in zip(starts, starts[1:])]
+    return list(zip(starts, ends + [None]))
+
+
+def iter_shard_entries(
+    stream: BinaryIO,
+    is_last: bool,
+    tail: dict[str, Any],
+    projection: Optional[Projection] = None,
+) -> Iterator[Any]:
+    """Iterate over the entries in one shard of the entries array.
+
+    A shard must consist of complete entries, each followed by a comma.
+    The last shard instead ends with the closing bracket of the array and
+    the rest of the document, whose log members are stored in ``tail``.
+
+    Args:
+        stream: Binary stream limited to the shard's byte range
+        is_last: Whether this is the final shard of the file
+        tail: Dictionary receiving log members after the entries array
+        projection: Entry members to decode, see ``build_projection``;
+            None decodes whole entries
+
+    Yields:
+        Decoded entry objects
+
+    Raises:
+        ShardMismatchError: If the shard does not line up with entries
+    """
+    reader = JSONStreamReader(stream)
+    try:
+        while True:
+            if reader.peek() != "{":
+                raise ShardMismatchError("Shard does not start at an entry")
+            if projection is not None:
+                yield reader.read_projected(projection)
+            else:
+                yield reader.read_value()
+
+            char = reader.peek()
+            if char == "]" and is_last:
+                reader.expect("]")
+                break
+            reader.expect(",")
+            if not is_last and reader.at_end():
+                return
+
+        for key in reader.iter_remaining():
+            tail[key] = reader.read_value()
+        for _ in reader.iter_remaining():
+            reader.skip_value()
+        if not reader.at_end():
+            raise reader.error("extra data after HAR document")
+    except ShardMismatchError:
+        raise
+    except Exception as e:
+        raise ShardMismatchError(f"Shard does not line up with entries: {e}")
@@ -0,0 +1,139 @@
+"""Parsed HAR data spilled to disk in memory-mapped column chunks.
+
+An out-of-core parse writes each chunk of parsed rows to its own file in
+the columnar format of the parse cache once the memory budget is reached.
+Chunks are memory-mapped back one at a time, so aggregating them reads
+the files sequentially while only one chunk is resident.
+"""
+
+import shutil
+import tempfile
+import weakref
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from har_analyzer.core.cache import (
+    CACHE_SUFFIX,
+    read_frame,
+    read_schema,
+    write_frame,
+)
+from har_analyzer.utils import get_logger
+
+
+class SpilledFrame:
+    """Rows of one parse, as chunks on disk followed by an in-memory tail.
+
+    Spill files live in a private temporary directory that is removed by
+    ``close``, or when the object is garbage collected.
+    """
+
+    def __init__(self, spill_dir: Optional[Path] = None):
+        """Initialize an empty frame.
+
+        Args:
+            spill_dir: Directory in which the temporary directory of the
+                spill files is created, the system default if None
+        """
+        self.logger = get_logger(__name__)
+        if spill_dir is not None:
+            Path(spill_dir).mkdir(parents=True, exist_ok=True)
+        self.directory = Path(tempfile.mkdtemp(prefix="har-spill-", dir=spill_dir))
+        self._cleanup = weakref.finalize(
+            self, shutil.rmtree, self.directory, ignore_errors=True
+        )
+        self.paths: list[Path] = []
+        self.spilled_rows = 0
+        self.spilled_bytes = 0
+        self.tail: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        return self.spilled_rows + (len(self.tail) if self.tail is not None else 0)
+
+    @property
+    def spilled(self) -> bool:
+        """Whether any rows were written to disk."""
+        return bool(self.paths)
+
+    @property
+    def columns(self) -> pd.DataFrame:
+        """Empty DataFrame with the columns and dtypes of the first chunk.
+
+        Only the header of the first spill file is read.
+
+        Raises:
+            ValueError: If the frame holds no chunks
+        """
+        if self.paths:
+            return read_schema(self.paths[0])
+        if self.tail is None:
+            raise ValueError("No rows have been added to the frame")
+        df: pd.DataFrame = self.tail.iloc[:0]
+        return df
+
+    def spill(self, df: pd.DataFrame) -> None:
+        """Write a chunk of rows to a new spill file.
+
+        Args:
+            df: Parsed rows following those already held
+        """
+        path = self.directory / f"chunk-{len(self.paths):06d}{CACHE_SUFFIX}"
+        with open(path, "wb") as f:
+            write_frame(f, df, {})
+        self.paths.append(path)
+        self.spilled_rows += len(df)
+        self.spilled_bytes += path.stat().st_size
+        self.logger.debug(
+            f"Spilled {len(df)} rows to {path} ({self.spilled_rows} in total)"
+        )
+
+    def chunks(self) -> Iterator[pd.DataFrame]:
+        """Iterate over the chunks in row order, memory-mapping spilled ones.
+
+        Yields:
+            DataFrame of each chunk, then the in-memory tail
+        """
+        for path in self.paths:
+            yield read_frame(path)[0]
+        if self.tail is not None:
+            yield self.tail
+
+    def column_chunks(self, name: str) -> Iterator[pd.Series]:
+        """Iterate over one column of the chunks, decoding only that column.
+
+        Args:
+            name: Column name
+
+        Yields:
+            Series of the column in each chunk, then in the in-memory tail
+        """
+        for path in self.paths:
+            yield read_frame(path, [name])[0][name]
+        if self.tail is not None:
+            yield self.tail[name]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Concatenate all chunks, loading every row into memory.
+
+        Returns:
+            DataFrame with all rows, category columns widened to the union
+            of their chunks' categories
+        """
+        chunks = list(self.chunks())
+        if len(chunks) == 1:
+            return chunks[0]
+        df = pd.concat(chunks, ignore_index=True)
+        for name, dtype in chunks[0].dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                df[name] = union_categoricals([chunk[name] for chunk in chunks])
+        return df
+
+    def close(self) -> None:
+        """Remove the spill files."""
+        self.paths = []
+        self.tail = None
+        self._cleanup()
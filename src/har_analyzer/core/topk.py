@@ -0,0 +1,194 @@
+"""Top-N resources per resource type."""
+
+import heapq
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Columns shown for each top resource, with the metric inserted after "url"
+TOP_RESOURCE_COLUMNS = ("url", "type", "method", "status_code")
+
+
+def _columns(metric: str) -> list[str]:
+    return [TOP_RESOURCE_COLUMNS[0], metric, *TOP_RESOURCE_COLUMNS[1:]]
+
+
+def _segment_top(values: np.ndarray, n: int) -> np.ndarray:
+    """Positions of the ``n`` largest values, like ``nlargest(keep="first")``.
+
+    Returns positions ordered by descending value, ties in position order.
+    As with ``nlargest``, NaN positions fill up groups with fewer than ``n``
+    values.
+    """
+    missing = np.isnan(values)
+    valid = np.flatnonzero(~missing)
+    if len(valid) > n:
+        threshold = np.partition(values[valid], len(valid) - n)[len(valid) - n]
+        above = valid[values[valid] > threshold]
+        tied = valid[values[valid] == threshold][: n - len(above)]
+        valid = np.concatenate([above, tied])
+    top = valid[np.lexsort((valid, -values[valid]))]
+    if len(top) < n:
+        top = np.concatenate([top, np.flatnonzero(missing)[: n - len(top)]])
+    return top
+
+
+def grouped_top_k(
+    df: pd.DataFrame, metrics: Sequence[str], n: int = 5
+) -> dict[str, dict[Any, pd.DataFrame]]:
+    """Find the N largest rows per resource type for several metrics.
+
+    Rows are grouped once with a stable sort of the type codes; each
+    group's top rows are then selected with a partition per metric instead
+    of a boolean mask and ``nlargest`` call per type and metric.
+
+    Args:
+        df: DataFrame with HAR data
+        metrics: Columns to rank by
+        n: Number of rows per type
+
+    Returns:
+        Mapping of metric to a mapping of resource type (in order of first
+        appearance) to its top rows, as ``DataFrame.nlargest`` would return
+    """
+    result: dict[str, dict[Any, pd.DataFrame]] = {metric: {} for metric in metrics}
+    if not len(df) or n <= 0:
+        return result
+
+    codes, uniques = pd.factorize(df["type"])
+    valid_rows = np.flatnonzero(codes >= 0)
+    order = valid_rows[np.argsort(codes[valid_rows], kind="stable")]
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    ends = np.append(starts[1:], len(order))
+    # Codes from an unsorted factorize follow first appearance
+    types = [uniques[code] for code in sorted_codes[starts]]
+
+    for metric in metrics:
+        values = df[metric].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+        picks = [
+            order[start + _segment_top(values[start:end], n)]
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+        columns = df.columns.get_indexer(pd.Index(_columns(metric)))
+        rows: pd.DataFrame = df.iloc[np.concatenate(picks), columns]
+        offset = 0
+        for resource_type, positions in zip(types, picks):
+            result[metric][resource_type] = rows.iloc[offset : offset + len(positions)]
+            offset += len(positions)
+
+    return result
+
+
+class TopKTracker:
+    """Incrementally track the N largest rows per type for several metrics.
+
+    Keeps one bounded min-heap per (metric, type), so memory stays at
+    ``N`` rows per group however many entries are streamed through. Rows
+    are numbered in the order they are added; ties keep the earlier row,
+    matching ``grouped_top_k`` on the concatenated data. Rows with a
+    missing metric value are never tracked.
+    """
+
+    def __init__(
+        self, metrics: Sequence[str] = ("response_time_ms", "size_kb"), n: int = 5
+    ):
+        """Initialize tracker.
+
+        Args:
+            metrics: Columns to rank by
+            n: Number of rows kept per type and metric
+        """
+        self.metrics = tuple(metrics)
+        self.n = n
+        self.rows_seen = 0
+        self._heaps: dict[
+            str, dict[Any, list[tuple[float, int, Mapping[Any, Any]]]]
+        ] = {metric: {} for metric in self.metrics}
+        self._types: dict[Any, None] = {}
+
+    def _push(
+        self, metric: str, value: float, row_id: int, row: Mapping[Any, Any]
+    ) -> None:
+        if self.n <= 0 or value != value:  # NaN values are not tracked
+            return
+        heap = self._heaps[metric].setdefault(row["type"], [])
+        # Min-heap on (value, -row id): the smallest, latest row goes first
+        item = (value, -row_id, row)
+        if len(heap) < self.n:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    def add(self, row: dict[str, Any]) -> None:
+        """Add a single row.
+
+        Args:
+            row: Mapping with the type, url, method, status_code and metric
+                values of one entry
+        """
+        row_id = self.rows_seen
+        self.rows_seen += 1
+        self._types.setdefault(row["type"], None)
+        for metric in self.metrics:
+            self._push(metric, float(row[metric]), row_id, row)
+
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """Add a chunk of rows, pushing only each group's local top rows.
+
+        Args:
+            df: DataFrame chunk with HAR data
+        """
+        base = self.rows_seen
+        self.rows_seen += len(df)
+        for resource_type in pd.unique(df["type"]):
+            self._types.setdefault(resource_type, None)
+
+        positions = pd.RangeIndex(base, base + len(df))
+        chunk = df.set_axis(positions)
+        for metric, groups in grouped_top_k(chunk, self.metrics, self.n).items():
+            for rows in groups.values():
+                for row_id, row in zip(rows.index, rows.to_dict("records")):
+                    self._push(metric, float(row[metric]), int(row_id), row)
+
+    def merge(self, other: "TopKTracker") -> None:
+        """Add the rows tracked by another tracker, numbered after this one's.
+
+        Args:
+            other: Tracker with the same metrics
+        """
+        if other.metrics != self.metrics:
+            raise ValueError("Cannot merge trackers with different metrics")
+        base = self.rows_seen
+        self.rows_seen += other.rows_seen
+        for resource_type in other._types:
+            self._types.setdefault(resource_type, None)
+        for metric, groups in other._heaps.items():
+            for heap in groups.values():
+                for value, neg_id, row in heap:
+                    self._push(metric, value, base - neg_id, row)
+
+    def result(self) -> dict[str, dict[Any, pd.DataFrame]]:
+        """Build the current top rows per metric and type.
+
+        Returns:
+            Same structure as ``grouped_top_k``; rows are indexed by the
+            order in which they were added
+        """
+        result: dict[str, dict[Any, pd.DataFrame]] = {}
+        for metric in self.metrics:
+            columns = _columns(metric)
+            groups = self._heaps[metric]
+            result[metric] = {}
+            for resource_type in self._types:
+                heap = sorted(
+                    groups.get(resource_type, []), key=lambda i: (-i[0], -i[1])
+                )
+                result[metric][resource_type] = pd.DataFrame(
+                    [[row[column] for column in columns] for _, _, row in heap],
+                    columns=columns,
+                    index=pd.Index([-neg_id for _, neg_id, _ in heap]),
+                )
+        return result
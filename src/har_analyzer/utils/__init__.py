@@ -1,5 +1,6 @@
 """Utility functions package."""
 
+from har_analyzer.utils.compression import detect_compression, open_har
 from har_analyzer.utils.exceptions import (
     ConfigurationError,
     HARAnalyzerError,
@@ -10,6 +11,7 @@ from har_analyzer.utils.exceptions import (
     ValidationError,
 )
 from har_analyzer.utils.helpers import (
+    ResourceClassifier,
     categorize_resource_type,
     format_bytes,
     format_duration,
@@ -18,8 +20,15 @@ from har_analyzer.utils.helpers import (
     safe_get,
 )
 from har_analyzer.utils.logging import get_logger, setup_logging
+from har_analyzer.utils.memory import MemoryGuard
+from har_analyzer.utils.profiling import PeakMemorySampler, StageProfiler
 from har_analyzer.utils.validators import (
+    ValidationReport,
+    check_entry,
+    check_har_file,
+    has_har_extension,
     validate_har_file,
+    validate_har_path,
     validate_memory_usage,
     validate_output_directory,
 )
@@ -38,13 +47,27 @@ __all__ = [
     "format_bytes",
     "format_duration",
     "generate_timestamp",
+    "ResourceClassifier",
     "categorize_resource_type",
     "safe_get",
+    # Memory
+    "MemoryGuard",
+    # Profiling
+    "PeakMemorySampler",
+    "StageProfiler",
+    # Compression
+    "detect_compression",
+    "open_har",
     # Logging
     "setup_logging",
     "get_logger",
     # Validators
+    "ValidationReport",
+    "check_entry",
+    "check_har_file",
+    "has_har_extension",
     "validate_har_file",
+    "validate_har_path",
     "validate_output_directory",
     "validate_memory_usage",
 ]
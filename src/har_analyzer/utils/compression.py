@@ -0,0 +1,143 @@
+"""Transparent reading of compressed HAR files."""
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, Union
+
+from har_analyzer.utils.exceptions import InvalidHARFileError
+
+# Leading bytes identifying each supported compression format
+COMPRESSION_MAGIC: dict[str, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+# File name suffixes accepted after ``.har`` for compressed files
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz")
+
+_OPENERS: dict[str, Callable[[Path], io.BufferedIOBase]] = {
+    "gzip": gzip.GzipFile,
+    "bz2": bz2.BZ2File,
+    "xz": lzma.LZMAFile,
+}
+
+_DECOMPRESSION_ERRORS = (OSError, EOFError, zlib.error, lzma.LZMAError)
+
+# Decompressed bytes produced per read, and blocks buffered ahead of the parser
+_BLOCK_SIZE = 1024 * 1024
+_PREFETCH_BLOCKS = 4
+
+
+def detect_compression(file_path: Path) -> Optional[str]:
+    """Detect the compression format of a file from its magic bytes.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Format name ("gzip", "bz2" or "xz"), or None for uncompressed files
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(max(len(magic) for magic in COMPRESSION_MAGIC.values()))
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+class _PrefetchReader(io.RawIOBase):
+    """Decompress a stream in a background thread, ahead of the reader.
+
+    zlib, bz2 and lzma release the GIL while decompressing, so this overlaps
+    disk reads and decompression with parsing in the calling thread.
+    """
+
+    def __init__(self, source: io.BufferedIOBase):
+        super().__init__()
+        self._source = source
+        self._blocks: queue.Queue[Union[bytes, BaseException]] = queue.Queue(
+            _PREFETCH_BLOCKS
+        )
+        self._pending = b""
+        self._done = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Union[bytes, BaseException]) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            while True:
+                block = self._source.read(_BLOCK_SIZE)
+                if not self._put(block) or not block:
+                    return
+        except BaseException as e:
+            self._put(e)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(_BLOCK_SIZE), b""))
+
+        parts = [self._pending]
+        length = len(self._pending)
+        while length < size and not self._done:
+            block = self._blocks.get()
+            if isinstance(block, BaseException):
+                self._done = True
+                if isinstance(block, _DECOMPRESSION_ERRORS):
+                    raise InvalidHARFileError(
+                        f"Corrupt compressed HAR file: {block}"
+                    ) from block
+                raise block
+            if not block:
+                self._done = True
+            parts.append(block)
+            length += len(block)
+
+        data = b"".join(parts)
+        self._pending = data[size:]
+        return data[:size]
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+def open_har(file_path: Path) -> BinaryIO:
+    """Open a HAR file for binary reading, decompressing it if needed.
+
+    Compressed files are decompressed as a stream while being read; the
+    decompressed document is never held in memory or written to disk.
+
+    Args:
+        file_path: Path to a plain, gzip, bz2 or xz compressed HAR file
+
+    Returns:
+        Binary stream of the uncompressed document
+    """
+    compression = detect_compression(file_path)
+    if compression is None:
+        return open(file_path, "rb")
+    source = _OPENERS[compression](file_path)
+    return _PrefetchReader(source)  # type: ignore[return-value]
@@ -1,9 +1,23 @@
 """Utility functions for HAR Analyzer."""
 
+import functools
+import os
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Union
 
-import psutil
+if TYPE_CHECKING:
+    import pandas as pd
+    import psutil
+
+
+@functools.lru_cache(maxsize=4)
+def _process(pid: int) -> "psutil.Process":
+    """Process handle, cached per pid so forked workers get their own."""
+    # Imported on first use; the command line should start without it
+    import psutil
+
+    return psutil.Process(pid)
 
 
 def get_memory_usage() -> float:
@@ -12,8 +26,7 @@ def get_memory_usage() -> float:
     Returns:
         Memory usage in megabytes
     """
-    process = psutil.Process()
-    return float(process.memory_info().rss / 1024 / 1024)
+    return float(_process(os.getpid()).memory_info().rss / 1024 / 1024)
 
 
 def format_bytes(bytes_value: Union[int, float]) -> str:
@@ -64,6 +77,211 @@ def generate_timestamp(format_str: str = "%d%m%Y%H%M%S") -> str:
     return datetime.now().strftime(format_str)
 
 
+class ResourceRule(NamedTuple):
+    """Rule assigning a resource type from MIME type and URL."""
+
+    name: str
+    mime_substrings: tuple[str, ...] = ()
+    extensions: tuple[str, ...] = ()
+    url_substrings: tuple[str, ...] = ()
+
+
+# Rules are tried in order; the first match wins
+DEFAULT_RESOURCE_RULES: tuple[ResourceRule, ...] = (
+    ResourceRule("JS", ("javascript",), (".js",)),
+    ResourceRule("CSS", ("css",), (".css",)),
+    ResourceRule(
+        "Image", ("image",), (".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg")
+    ),
+    ResourceRule("HTML", ("html",), (".html",)),
+    ResourceRule("Font", ("font",), (".woff", ".woff2", ".ttf", ".otf")),
+    ResourceRule("API", ("json",), (), ("api",)),
+    ResourceRule("Video", ("video",)),
+    ResourceRule("Audio", ("audio",)),
+)
+
+DEFAULT_RESOURCE_TYPE = "Other"
+
+# Scalar lookups are memoized; the table is reset if URLs make it grow large
+_MAX_CACHED_KEYS = 4096
+
+
+class ResourceClassifier:
+    """Resource-type classifier with a memoized rule lookup table.
+
+    Classification only depends on the MIME type, the longest extension
+    listed by a rule that the URL ends with, and which configured URL
+    substrings the URL contains, so every distinct key is resolved against
+    the rules once. Extensions may span several dots (``.min.js``) and are
+    given a leading dot if they lack one.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Any] = DEFAULT_RESOURCE_RULES,
+        default: str = DEFAULT_RESOURCE_TYPE,
+    ):
+        """Initialize resource classifier.
+
+        Args:
+            rules: Objects with name, mime_substrings, extensions and
+                url_substrings attributes, tried in order
+            default: Type used when no rule matches
+
+        Raises:
+            ValueError: If a rule lists an empty extension
+        """
+        self._rules: list[
+            tuple[str, tuple[str, ...], frozenset[str], tuple[str, ...]]
+        ] = [
+            (
+                str(rule.name),
+                tuple(s.lower() for s in rule.mime_substrings),
+                frozenset(_normalize_extension(rule.name, e) for e in rule.extensions),
+                tuple(s.lower() for s in rule.url_substrings),
+            )
+            for rule in rules
+        ]
+        self._default = default
+        self._extensions = frozenset(e for *_, exts, _ in self._rules for e in exts)
+        # Dots in the longest extension: how far back a URL must be searched
+        self._max_dots = max((e.count(".") for e in self._extensions), default=0)
+        self._markers = tuple(
+            sorted({marker for *_, markers in self._rules for marker in markers})
+        )
+        self._cache: dict[tuple[str, str, tuple[bool, ...]], str] = {}
+
+    def _extension(self, url: str) -> str:
+        """Longest known extension a lowercase URL ends with, or ''."""
+        extension = ""
+        end = len(url)
+        for _ in range(self._max_dots):
+            end = url.rfind(".", 0, end)
+            if end < 0:
+                break
+            if url[end:] in self._extensions:
+                extension = url[end:]
+        return extension
+
+    def _url_key(self, url: str) -> tuple[str, tuple[bool, ...]]:
+        """Reduce a URL to its known extension and URL substring flags."""
+        url = url.lower()
+        return self._extension(url), tuple(marker in url for marker in self._markers)
+
+    @property
+    def signature(self) -> str:
+        """Stable description of the rules, for keying cached results."""
+        rules = [
+            (name, mime, sorted(exts), urls) for name, mime, exts, urls in self._rules
+        ]
+        return repr((rules, self._default))
+
+    def _resolve(self, mime_type: str, extension: str, flags: tuple[bool, ...]) -> str:
+        """Resolve one classification key against the rules."""
+        mime_type = mime_type.lower()
+        present = {m for m, flag in zip(self._markers, flags) if flag}
+        for name, mime_substrings, extensions, url_substrings in self._rules:
+            # Shorter extensions the URL ends with are suffixes of the longest
+            if (
+                any(s in mime_type for s in mime_substrings)
+                or (extension and extension.endswith(tuple(extensions)))
+                or any(s in present for s in url_substrings)
+            ):
+                return name
+        return self._default
+
+    def classify(self, mime_type: str, url: str) -> str:
+        """Classify a single resource.
+
+        Args:
+            mime_type: MIME type from response
+            url: Resource URL
+
+        Returns:
+            Resource category (JS, CSS, Image, etc.)
+        """
+        return self._lookup(mime_type, *self._url_key(url))
+
+    def _lookup(self, mime_type: str, extension: str, flags: tuple[bool, ...]) -> str:
+        """Resolve a classification key through the memo table."""
+        key = (mime_type, extension, flags)
+        result = self._cache.get(key)
+        if result is None:
+            if len(self._cache) >= _MAX_CACHED_KEYS:
+                self._cache.clear()
+            result = self._cache[key] = self._resolve(*key)
+        return result
+
+    def classify_many(self, mime_types: Any, urls: Any) -> "pd.Categorical":
+        """Classify whole columns of resources.
+
+        Args:
+            mime_types: Array-like of MIME types
+            urls: Array-like of URLs, aligned with ``mime_types``
+
+        Returns:
+            Categorical of resource categories with sorted categories
+        """
+        import numpy as np
+        import pandas as pd
+
+        mime_codes, mime_uniques = pd.factorize(
+            np.asarray(mime_types, dtype=object), use_na_sentinel=False
+        )
+
+        # Reduce each URL to an integer key: extension code plus marker bits
+        lowered = [str(url).lower() for url in urls]
+        extensions = [self._extension(url) for url in lowered]
+        ext_codes, ext_uniques = pd.factorize(np.array(extensions, dtype=object))
+        del extensions
+
+        url_keys = ext_codes.astype(np.int64) << len(self._markers)
+        for bit, marker in enumerate(self._markers):
+            flags = np.fromiter(
+                (marker in url for url in lowered), dtype=bool, count=len(lowered)
+            )
+            url_keys |= flags.astype(np.int64) << bit
+        del lowered
+
+        width = len(ext_uniques) << len(self._markers) or 1
+        combined = mime_codes.astype(np.int64) * width + url_keys
+        unique_keys, inverse = np.unique(combined, return_inverse=True)
+
+        labels = []
+        for key in unique_keys.tolist():
+            mime_code, url_key = divmod(key, width)
+            ext_code = url_key >> len(self._markers)
+            flags_key = tuple(
+                bool(url_key >> bit & 1) for bit in range(len(self._markers))
+            )
+            labels.append(
+                self._lookup(mime_uniques[mime_code], ext_uniques[ext_code], flags_key)
+            )
+
+        categories, label_codes = np.unique(
+            np.array(labels, dtype=object), return_inverse=True
+        )
+        result: pd.Categorical = pd.Categorical.from_codes(
+            label_codes[inverse.ravel()], categories=pd.Index(categories)
+        )
+        return result
+
+
+def _normalize_extension(rule: str, extension: str) -> str:
+    """Lowercase an extension and give it a leading dot.
+
+    Raises:
+        ValueError: If the extension is empty
+    """
+    extension = extension.strip().lower()
+    if not extension.strip("."):
+        raise ValueError(f"Resource rule {rule!r} has an empty extension")
+    return extension if extension.startswith(".") else f".{extension}"
+
+
+_DEFAULT_CLASSIFIER = ResourceClassifier()
+
+
 def categorize_resource_type(mime_type: str, url: str) -> str:
     """Categorize resource type based on MIME type and URL.
 
@@ -74,31 +292,7 @@ def categorize_resource_type(mime_type: str, url: str) -> str:
     Returns:
         Resource category (JS, CSS, Image, etc.)
     """
-    mime_type = mime_type.lower()
-    url = url.lower()
-
-    if "javascript" in mime_type or url.endswith(".js"):
-        return "JS"
-    elif "css" in mime_type or url.endswith(".css"):
-        return "CSS"
-    elif "image" in mime_type or any(
-        url.endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg"]
-    ):
-        return "Image"
-    elif "html" in mime_type or url.endswith(".html"):
-        return "HTML"
-    elif "font" in mime_type or any(
-        url.endswith(ext) for ext in [".woff", ".woff2", ".ttf", ".otf"]
-    ):
-        return "Font"
-    elif "json" in mime_type or "api" in url:
-        return "API"
-    elif "video" in mime_type:
-        return "Video"
-    elif "audio" in mime_type:
-        return "Audio"
-    else:
-        return "Other"
+    return _DEFAULT_CLASSIFIER.classify(mime_type, url)
 
 
 def safe_get(data: dict[str, Any], *keys: str, default: Any = None) -> Any:
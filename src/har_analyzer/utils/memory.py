@@ -0,0 +1,179 @@
+"""Memory guard for long-running parse loops."""
+
+import time
+from typing import Callable, Optional
+
+from har_analyzer.utils.exceptions import (
+    ConfigurationError,
+    MemoryLimitExceededError,
+)
+from har_analyzer.utils.helpers import get_memory_usage
+from har_analyzer.utils.logging import get_logger
+
+# Sample RSS after this much time or input, whichever comes first
+DEFAULT_INTERVAL_S = 0.5
+DEFAULT_INTERVAL_BYTES = 16 * 1024 * 1024
+
+# Project the peak only once this share (and amount) of the input is read,
+# so start-up allocations do not dominate the per-row estimate
+WARMUP_FRACTION = 0.05
+WARMUP_BYTES = 8 * 1024 * 1024
+
+
+class MemoryGuard:
+    """Check memory usage while parsing, on a time and byte budget.
+
+    ``check`` is cheap enough to call for every entry: it only reads RSS
+    once ``interval_s`` seconds have passed or ``interval_bytes`` of input
+    were consumed since the last sample. When the input size is known, each
+    sample also projects the peak usage from the memory used per row and
+    the rows per byte seen so far, so a parse that cannot fit is stopped
+    early instead of after the limit is already exceeded.
+
+    With a ``spill_fraction``, there is no projection; ``check`` instead
+    reports when usage passes that share of the headroom between the
+    baseline and the limit, so the caller can move rows out of memory.
+    """
+
+    def __init__(
+        self,
+        limit_mb: float,
+        total_bytes: Optional[int] = None,
+        bytes_read: Optional[Callable[[], int]] = None,
+        interval_s: float = DEFAULT_INTERVAL_S,
+        interval_bytes: int = DEFAULT_INTERVAL_BYTES,
+        spill_fraction: Optional[float] = None,
+    ):
+        """Initialize memory guard and take the baseline sample.
+
+        Args:
+            limit_mb: Memory limit in megabytes
+            total_bytes: Size of the input, None if unknown (no projection)
+            bytes_read: Returns the number of input bytes consumed so far
+            interval_s: Longest time between two samples
+            interval_bytes: Most input consumed between two samples
+            spill_fraction: Share of the headroom above the baseline after
+                which ``check`` returns True, None to project the peak
+
+        Raises:
+            MemoryLimitExceededError: If usage already exceeds the limit
+            ConfigurationError: If spilling and the limit is not above the
+                usage before any row is parsed, leaving nothing to spill
+        """
+        self.logger = get_logger(__name__)
+        self.limit_mb = limit_mb
+        self.total_bytes = total_bytes
+        self.interval_s = interval_s
+        self.interval_bytes = interval_bytes
+        self._bytes_read = bytes_read or (lambda: 0)
+        self.samples = 0
+        self.peak_mb = 0.0
+        self.projected_mb: Optional[float] = None
+        self.spill_mb: Optional[float] = None
+        if spill_fraction is None:
+            self.baseline_mb = self.sample(0)
+        else:
+            self.baseline_mb = self._spill_baseline(limit_mb)
+            self.spill_mb = (
+                self.baseline_mb + (limit_mb - self.baseline_mb) * spill_fraction
+            )
+        self._next_time = time.monotonic() + interval_s
+        self._next_bytes = interval_bytes
+
+    def _spill_baseline(self, limit_mb: float) -> float:
+        """Take the baseline sample of a guard that spills rows.
+
+        Rows can be spilled to stay below the limit, but not the memory in
+        use before the first row, so a limit below it is a setting error.
+        """
+        current = self.rss_mb()
+        self.samples += 1
+        self.peak_mb = current
+        if current >= limit_mb:
+            raise ConfigurationError(
+                f"Memory limit ({limit_mb}MB) is below the memory already in "
+                f"use ({current:.1f}MB); out-of-core parsing needs a higher limit"
+            )
+        return current
+
+    def rss_mb(self) -> float:
+        """Read the resident set size of this process.
+
+        Returns:
+            Memory usage in megabytes
+        """
+        return get_memory_usage()
+
+    def check(self, rows: int) -> bool:
+        """Sample memory usage if the time or byte budget is used up.
+
+        Args:
+            rows: Number of rows parsed so far
+
+        Returns:
+            Whether the sampled usage is above ``spill_mb``
+
+        Raises:
+            MemoryLimitExceededError: If usage or projected peak usage
+                exceeds the limit
+        """
+        consumed = self._bytes_read()
+        now = time.monotonic()
+        if consumed < self._next_bytes and now < self._next_time:
+            return False
+        self._next_time = now + self.interval_s
+        self._next_bytes = consumed + self.interval_bytes
+        current = self.sample(rows, consumed)
+        return self.spill_mb is not None and current > self.spill_mb
+
+    def sample(self, rows: int, consumed: Optional[int] = None) -> float:
+        """Read memory usage now and check it against the limit.
+
+        Args:
+            rows: Number of rows parsed so far
+            consumed: Input bytes consumed so far, read if None
+
+        Returns:
+            Current memory usage in megabytes
+
+        Raises:
+            MemoryLimitExceededError: If usage or projected peak usage
+                exceeds the limit
+        """
+        current = self.rss_mb()
+        self.samples += 1
+        self.peak_mb = max(self.peak_mb, current)
+        if current > self.limit_mb:
+            raise MemoryLimitExceededError(
+                f"Memory usage ({current:.1f}MB) exceeds limit ({self.limit_mb}MB)"
+            )
+
+        consumed = self._bytes_read() if consumed is None else consumed
+        # Spilled rows no longer count, so their peak is not projected
+        projected_rows = (
+            self._projected_rows(rows, consumed) if self.spill_mb is None else None
+        )
+        if projected_rows is not None:
+            per_row = max(current - self.baseline_mb, 0.0) / rows
+            self.projected_mb = self.baseline_mb + per_row * projected_rows
+            if self.projected_mb > self.limit_mb:
+                raise MemoryLimitExceededError(
+                    f"Projected memory usage ({self.projected_mb:.1f}MB for about "
+                    f"{projected_rows:,} rows) exceeds limit ({self.limit_mb}MB)"
+                )
+
+        self.logger.debug(
+            f"Parsed {rows} rows: {current:.1f}MB used"
+            + (f", {self.projected_mb:.1f}MB projected" if self.projected_mb else "")
+        )
+        return current
+
+    def _projected_rows(self, rows: int, consumed: int) -> Optional[int]:
+        """Estimate the rows in the whole input from the rows per byte so far."""
+        if not self.total_bytes or not rows or consumed <= 0:
+            return None
+        if consumed < min(
+            self.total_bytes, max(WARMUP_BYTES, self.total_bytes * WARMUP_FRACTION)
+        ):
+            return None
+        return round(rows * max(self.total_bytes / consumed, 1.0))
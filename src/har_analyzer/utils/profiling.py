@@ -0,0 +1,190 @@
+"""Timing and memory instrumentation of pipeline stages."""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from har_analyzer.utils.helpers import get_memory_usage
+from har_analyzer.utils.logging import get_logger
+
+# Seconds between RSS readings of the peak sampler
+SAMPLE_INTERVAL_S = 0.01
+
+
+class PeakMemorySampler:
+    """Track the peak resident set size while a block runs.
+
+    A daemon thread reads RSS at a fixed interval, so short allocation
+    spikes between the start and end of a block are still seen.
+    """
+
+    def __init__(self, interval_s: float = SAMPLE_INTERVAL_S):
+        """Initialize sampler.
+
+        Args:
+            interval_s: Seconds between readings
+        """
+        self.interval_s = interval_s
+        self.start_mb = 0.0
+        self.end_mb = 0.0
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PeakMemorySampler":
+        self.start_mb = self.peak_mb = get_memory_usage()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.end_mb = get_memory_usage()
+        self.peak_mb = max(self.peak_mb, self.end_mb)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.peak_mb = max(self.peak_mb, get_memory_usage())
+
+
+class StageProfiler:
+    """Record wall time and memory of named, possibly nested, stages.
+
+    Each stage reads RSS when it starts and ends, which costs a few
+    microseconds. With ``detailed`` enabled a background thread also tracks
+    the peak RSS within each stage, and hot loops may report the time of
+    their sub-steps through ``add_time``.
+    """
+
+    def __init__(self, detailed: bool = False):
+        """Initialize profiler.
+
+        Args:
+            detailed: Sample peak memory and time per-entry sub-steps
+        """
+        self.logger = get_logger(__name__)
+        self.detailed = detailed
+        self.stages: list[dict[str, Any]] = []
+        self.timers: dict[str, float] = {}
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    @contextmanager
+    def stage(self, name: str, **details: Any) -> Iterator[dict[str, Any]]:
+        """Time a block as one stage.
+
+        Args:
+            name: Stage name, e.g. "parse" or "metrics.percentiles"
+            **details: JSON-serializable values stored with the stage
+
+        Yields:
+            The stage record, to which the block may add details
+        """
+        record: dict[str, Any] = {"name": name, "depth": self._depth, **details}
+        self.stages.append(record)
+        self._depth += 1
+        sampler = PeakMemorySampler() if self.detailed else None
+        if sampler is not None:
+            sampler.__enter__()
+        start_mb = sampler.start_mb if sampler is not None else get_memory_usage()
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            seconds = time.perf_counter() - started
+            if sampler is not None:
+                sampler.__exit__()
+                end_mb, peak_mb = sampler.end_mb, sampler.peak_mb
+            else:
+                end_mb = get_memory_usage()
+                peak_mb = max(start_mb, end_mb)
+            self._depth -= 1
+            record.update(
+                start_s=round(started - self._origin, 6),
+                seconds=round(seconds, 6),
+                rss_start_mb=round(start_mb, 1),
+                rss_delta_mb=round(end_mb - start_mb, 1),
+                peak_rss_mb=round(peak_mb, 1),
+            )
+            self.logger.debug(
+                f"Stage {name}: {seconds:.3f}s, "
+                f"{end_mb - start_mb:+.1f}MB (peak {peak_mb:.1f}MB)"
+            )
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add time spent in a sub-step that is too fine-grained for a stage.
+
+        Args:
+            name: Timer name, e.g. "parse.json_decode"
+            seconds: Seconds to add
+        """
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    def summary(self) -> dict[str, Any]:
+        """Get the recorded stages.
+
+        Returns:
+            Dictionary with the stages in start order, the accumulated
+            sub-step timers, the total time of top-level stages and the
+            highest RSS seen
+        """
+        finished = [stage for stage in self.stages if "seconds" in stage]
+        return {
+            "stages": [dict(stage) for stage in finished],
+            "timers": {name: round(value, 6) for name, value in self.timers.items()},
+            "total_seconds": round(
+                sum(stage["seconds"] for stage in finished if stage["depth"] == 0), 6
+            ),
+            "peak_rss_mb": max(
+                (stage["peak_rss_mb"] for stage in finished), default=0.0
+            ),
+        }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Convert the stages to the Chrome trace event format.
+
+        The result can be opened in chrome://tracing or Perfetto.
+
+        Returns:
+            Trace document with one complete ("X") event per stage
+        """
+        pid = os.getpid()
+        events = []
+        for stage in self.stages:
+            if "seconds" not in stage:
+                continue
+            args = {
+                key: value
+                for key, value in stage.items()
+                if key not in ("name", "depth", "start_s", "seconds")
+            }
+            events.append(
+                {
+                    "name": stage["name"],
+                    "cat": stage["name"].split(".")[0],
+                    "ph": "X",
+                    "ts": round(stage["start_s"] * 1e6, 3),
+                    "dur": round(stage["seconds"] * 1e6, 3),
+                    "pid": pid,
+                    "tid": 0,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, output_file: Path) -> None:
+        """Save the stages as a Chrome trace JSON file.
+
+        Args:
+            output_file: Output file path
+        """
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
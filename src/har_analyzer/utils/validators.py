@@ -1,63 +1,256 @@
 """Input validation utilities for HAR Analyzer."""
 
-import json
+import re
 from pathlib import Path
+from typing import Any
 
+from har_analyzer.utils.compression import COMPRESSED_SUFFIXES, open_har
 from har_analyzer.utils.exceptions import InvalidHARFileError, ValidationError
+from har_analyzer.utils.streaming import REQUIRED_ENTRY_FIELDS, HARStream
 
+# Entry indices kept as examples of each kind of violation
+DEFAULT_MAX_SAMPLES = 5
 
-def validate_har_file(file_path: Path) -> None:
-    """Validate HAR file format and structure.
+# Timing phases every entry reports, and those that may be -1 (not applicable)
+REQUIRED_TIMINGS = ("send", "wait", "receive")
+OPTIONAL_TIMINGS = ("blocked", "dns", "connect", "ssl")
+
+# Start of an ISO 8601 date and time, as HAR 1.2 requires
+_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+
+
+def has_har_extension(file_path: Path) -> bool:
+    """Check for a ``.har`` extension, optionally followed by a compression one.
+
+    Args:
+        file_path: Path to check
+
+    Returns:
+        True for names such as ``site.har`` or ``site.har.gz``
+    """
+    suffixes = [suffix.lower() for suffix in file_path.suffixes]
+    if suffixes[-1:] == [".har"]:
+        return True
+    return (
+        len(suffixes) >= 2
+        and suffixes[-2] == ".har"
+        and (suffixes[-1] in COMPRESSED_SUFFIXES)
+    )
+
+
+def validate_har_path(file_path: Path) -> None:
+    """Validate that a HAR file exists and has the expected extension.
+
+    Compressed files are accepted as ``.har.gz``, ``.har.bz2`` or ``.har.xz``.
 
     Args:
         file_path: Path to HAR file
 
     Raises:
-        InvalidHARFileError: If file is invalid
-        ValidationError: If file structure is invalid
+        InvalidHARFileError: If file is missing or has the wrong extension
     """
     if not file_path.exists():
         raise InvalidHARFileError(f"HAR file not found: {file_path}")
 
-    if not file_path.suffix.lower() == ".har":
+    if not has_har_extension(file_path):
         raise InvalidHARFileError(f"File must have .har extension: {file_path}")
 
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise InvalidHARFileError(f"Invalid JSON in HAR file: {e}")
-    except UnicodeDecodeError as e:
-        raise InvalidHARFileError(f"Invalid encoding in HAR file: {e}")
-
-    # Validate HAR structure
-    if not isinstance(data, dict):
-        raise ValidationError("HAR file must contain a JSON object")
-
-    if "log" not in data:
-        raise ValidationError("HAR file must contain a 'log' object")
-
-    log = data["log"]
-    if not isinstance(log, dict):
-        raise ValidationError("HAR 'log' must be an object")
-
-    if "entries" not in log:
-        raise ValidationError("HAR log must contain 'entries' array")
-
-    entries = log["entries"]
-    if not isinstance(entries, list):
-        raise ValidationError("HAR entries must be an array")
-
-    if len(entries) == 0:
-        raise ValidationError("HAR file contains no entries")
-
-    # Validate first entry structure
-    if entries:
-        entry = entries[0]
-        required_fields = ["request", "response", "time", "startedDateTime"]
-        for field in required_fields:
-            if field not in entry:
-                raise ValidationError(f"HAR entry missing required field: {field}")
+
+def validate_har_file(file_path: Path, fail_fast: bool = False) -> int:
+    """Validate HAR file format, structure and the shape of every entry.
+
+    The document is checked in a single streaming pass, decompressing it on
+    the fly if needed.
+
+    Args:
+        file_path: Path to HAR file
+        fail_fast: Stop at the first invalid entry
+
+    Returns:
+        Number of entries in the HAR file
+
+    Raises:
+        InvalidHARFileError: If file is invalid
+        ValidationError: If file structure or an entry is invalid
+    """
+    report = check_har_file(file_path, fail_fast)
+    if not report.valid:
+        raise ValidationError(
+            f"{report.invalid_entries} invalid HAR entries:\n{report.summary()}"
+        )
+    return report.entries_count
+
+
+def _is_number(value: Any) -> bool:
+    """Check for a JSON number; booleans decode as int but are not numbers."""
+    return type(value) is int or type(value) is float
+
+
+def check_entry(entry: Any) -> list[str]:
+    """Check the shape of one HAR entry.
+
+    Args:
+        entry: Decoded HAR entry
+
+    Returns:
+        Descriptions of the violations found, empty for a valid entry
+    """
+    if not isinstance(entry, dict):
+        return ["entry is not an object"]
+
+    violations = [
+        f"missing {field}" for field in REQUIRED_ENTRY_FIELDS if field not in entry
+    ]
+
+    started = entry.get("startedDateTime")
+    if started is not None and not (
+        isinstance(started, str) and _DATETIME.match(started)
+    ):
+        violations.append("startedDateTime is not an ISO 8601 string")
+
+    time = entry.get("time")
+    if time is not None and not (_is_number(time) and time >= 0):
+        violations.append("time is not a non-negative number")
+
+    request = entry.get("request")
+    if request is not None:
+        if not isinstance(request, dict):
+            violations.append("request is not an object")
+        else:
+            if not isinstance(request.get("method"), str):
+                violations.append("request.method is not a string")
+            if not isinstance(request.get("url"), str):
+                violations.append("request.url is not a string")
+
+    response = entry.get("response")
+    if response is not None:
+        if not isinstance(response, dict):
+            violations.append("response is not an object")
+        else:
+            if type(response.get("status")) is not int:
+                violations.append("response.status is not an integer")
+            if not isinstance(response.get("content", {}), dict):
+                violations.append("response.content is not an object")
+
+    timings = entry.get("timings")
+    if timings is None:
+        violations.append("missing timings")
+    elif not isinstance(timings, dict):
+        violations.append("timings is not an object")
+    else:
+        for phase in REQUIRED_TIMINGS:
+            value: Any = timings.get(phase)
+            if not (_is_number(value) and value >= 0):
+                violations.append(f"timings.{phase} is not a non-negative number")
+        for phase in OPTIONAL_TIMINGS:
+            value = timings.get(phase, -1)
+            if not (_is_number(value) and value >= -1):
+                violations.append(f"timings.{phase} is not a number >= -1")
+
+    return violations
+
+
+class ValidationReport:
+    """Violations of every entry of a HAR file, aggregated by kind.
+
+    Memory use is bounded by the number of distinct violations, not the
+    number of entries: each kind keeps a count and a few example indices.
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES):
+        """Initialize report.
+
+        Args:
+            max_samples: Entry indices kept as examples of each violation
+        """
+        self.max_samples = max_samples
+        self.entries_count = 0
+        self.invalid_entries = 0
+        self.errors: dict[str, int] = {}
+        self.samples: dict[str, list[int]] = {}
+        self.stopped_early = False
+
+    @property
+    def valid(self) -> bool:
+        """Whether no entry violated the HAR entry shape."""
+        return not self.invalid_entries
+
+    def add(self, index: int, violations: list[str]) -> None:
+        """Record the violations of one entry.
+
+        Args:
+            index: Index of the entry in ``log.entries``
+            violations: Result of ``check_entry`` for the entry
+        """
+        self.invalid_entries += 1
+        for violation in violations:
+            self.errors[violation] = self.errors.get(violation, 0) + 1
+            samples = self.samples.setdefault(violation, [])
+            if len(samples) < self.max_samples:
+                samples.append(index)
+
+    def summary(self) -> str:
+        """Describe the violations, most frequent first.
+
+        Returns:
+            One line per kind of violation with its count and examples
+        """
+        lines = []
+        for violation, count in sorted(self.errors.items(), key=lambda i: -i[1]):
+            examples = ", ".join(f"#{index}" for index in self.samples[violation])
+            more = ", ..." if count > len(self.samples[violation]) else ""
+            lines.append(f"{violation}: {count} (entries {examples}{more})")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the report as a JSON-serializable dictionary."""
+        return {
+            "valid": self.valid,
+            "entries_count": self.entries_count,
+            "invalid_entries": self.invalid_entries,
+            "stopped_early": self.stopped_early,
+            "errors": {
+                violation: {"count": count, "samples": self.samples[violation]}
+                for violation, count in self.errors.items()
+            },
+        }
+
+
+def check_har_file(
+    file_path: Path, fail_fast: bool = False, max_samples: int = DEFAULT_MAX_SAMPLES
+) -> ValidationReport:
+    """Check the document structure and the shape of every entry.
+
+    Entries are decoded and checked one at a time in a single streaming
+    pass, so memory use does not grow with the file.
+
+    Args:
+        file_path: Path to HAR file
+        fail_fast: Stop at the first invalid entry
+        max_samples: Entry indices kept as examples of each violation
+
+    Returns:
+        Report of the entry violations
+
+    Raises:
+        InvalidHARFileError: If file is missing or not valid JSON
+        ValidationError: If the document structure is invalid
+    """
+    validate_har_path(file_path)
+
+    report = ValidationReport(max_samples)
+    with open_har(file_path) as f:
+        entries = HARStream(f).iter_entries(check_first=False)
+        for index, entry in enumerate(entries):
+            report.entries_count += 1
+            violations = check_entry(entry)
+            if violations:
+                report.add(index, violations)
+                if fail_fast:
+                    report.stopped_early = True
+                    entries.close()
+                    break
+    return report
 
 
 def validate_output_directory(output_dir: Path) -> None:
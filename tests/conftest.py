@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -116,6 +117,30 @@ def sample_dataframe() -> pd.DataFrame:
     )
 
 
+@pytest.fixture
+def random_dataframe() -> pd.DataFrame:
+    """Create a larger DataFrame with missing and negative values."""
+    rng = np.random.default_rng(42)
+    n = 2000
+    response = rng.gamma(2, 300, n).astype("float32")
+    response[::97] = np.nan
+    timings = rng.normal(20, 30, (n, 6)).astype("float32")
+    timings[::53, 2] = np.nan
+    df = pd.DataFrame(
+        {
+            "url": [f"https://example.com/{i}" for i in range(n)],
+            "method": pd.Categorical(rng.choice(["GET", "POST", "PUT"], n)),
+            "status_code": rng.choice([200, 200, 304, 404, 500], n).astype("int16"),
+            "type": pd.Categorical(rng.choice(["CSS", "HTML", "Image", "JS"], n)),
+            "response_time_ms": response,
+            "size_kb": rng.exponential(200, n).astype("float32"),
+        }
+    )
+    for i, phase in enumerate(["blocked", "dns", "connect", "send", "wait", "receive"]):
+        df[f"timing_{phase}"] = timings[:, i]
+    return df
+
+
 @pytest.fixture
 def test_config() -> HARAnalyzerConfig:
     """Create test configuration."""
@@ -0,0 +1,90 @@
+"""Unit tests for single-pass aggregation."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from har_analyzer.core.aggregates import FrameAggregates, quantiles
+from har_analyzer.core.analyzer import HARAnalyzer
+
+
+class TestQuantiles:
+    """Test cases for partition-based quantiles."""
+
+    def test_matches_pandas(self):
+        """Test interpolation and NaN handling against pandas."""
+        values = np.array([5.0, np.nan, 1.0, 3.0, 2.0, 8.0])
+        qs = [0.0, 0.25, 0.5, 0.9, 1.0]
+
+        expected = pd.Series(values).quantile(qs).to_numpy()
+
+        np.testing.assert_allclose(quantiles(values, qs), expected)
+
+    def test_empty(self):
+        """Test that empty input yields NaN."""
+        assert np.isnan(quantiles(np.array([np.nan]), [0.5])).all()
+
+
+class TestFrameAggregates:
+    """Test cases for FrameAggregates class."""
+
+    def test_summary_matches_groupby(self, random_dataframe: pd.DataFrame):
+        """Test per-type statistics against a pandas groupby."""
+        grouped = random_dataframe.groupby("type", observed=True)
+        response = grouped["response_time_ms"]
+
+        summary = FrameAggregates(random_dataframe).summary_by_type.set_index("type")
+
+        np.testing.assert_allclose(
+            summary["avg_response_time_ms"], response.mean().round(2), atol=0.01
+        )
+        np.testing.assert_allclose(
+            summary["std_response_time_ms"], response.std().round(2), atol=0.01
+        )
+        np.testing.assert_allclose(
+            summary["p95_response_time_ms"],
+            response.quantile(0.95).round(2),
+            atol=0.01,
+        )
+        np.testing.assert_allclose(
+            summary["total_size_kb"], grouped["size_kb"].sum().round(2), rtol=1e-5
+        )
+        assert list(summary["requests_count"]) == list(grouped.size())
+
+    def test_overall_statistics(self, random_dataframe: pd.DataFrame):
+        """Test totals, percentiles, timings and counts against pandas."""
+        aggregates = FrameAggregates(random_dataframe)
+        response = random_dataframe["response_time_ms"]
+        dns = random_dataframe["timing_connect"].clip(lower=0)
+
+        assert aggregates.avg_response_time_ms == pytest.approx(response.mean())
+        assert aggregates.percentiles["p99"] == pytest.approx(response.quantile(0.99))
+        assert aggregates.timing_breakdown["medians"]["timing_connect"] == (
+            pytest.approx(dns.median())
+        )
+        assert aggregates.status_counts == (
+            random_dataframe["status_code"].value_counts().to_dict()
+        )
+        assert aggregates.failed_count == int(
+            (random_dataframe["status_code"] >= 400).sum()
+        )
+
+    def test_results_are_json_serializable(self, sample_har_file: Path):
+        """Test that analysis results other than DataFrames dump as JSON."""
+        results = HARAnalyzer().analyze_file(sample_har_file)
+        sections = {
+            name: results[name]
+            for name in results.keys()
+            if name not in ("summary_by_type", "top_resources")
+        }
+
+        decoded = json.loads(json.dumps(sections))
+
+        assert decoded["resource_breakdown"]["by_status"] == {"200": 2}
+        assert decoded["resource_breakdown"]["by_type"]["counts"] == {
+            "JS": 1,
+            "CSS": 1,
+        }
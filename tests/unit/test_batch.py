@@ -0,0 +1,49 @@
+"""Unit tests for batch analysis."""
+
+from pathlib import Path
+
+import pytest
+
+from har_analyzer.core.batch import BatchAnalyzer, discover_har_files
+from har_analyzer.utils.exceptions import ValidationError
+
+
+class TestBatchAnalyzer:
+    """Test cases for BatchAnalyzer class."""
+
+    @pytest.fixture
+    def har_dir(self, sample_har_file: Path, tmp_path: Path) -> Path:
+        """Create a directory with two valid HAR files and a broken one."""
+        har_dir = tmp_path / "hars"
+        har_dir.mkdir()
+        (har_dir / "a.har").write_bytes(sample_har_file.read_bytes())
+        (har_dir / "b.har").write_bytes(sample_har_file.read_bytes())
+        (har_dir / "broken.har").write_text("not json")
+        (har_dir / "notes.txt").write_text("ignored")
+        return har_dir
+
+    def test_discover_har_files(self, har_dir: Path):
+        """Test resolving directories and glob patterns."""
+        assert [p.name for p in discover_har_files(str(har_dir))] == [
+            "a.har",
+            "b.har",
+            "broken.har",
+        ]
+        assert len(discover_har_files(str(har_dir / "[ab].har"))) == 2
+
+        with pytest.raises(ValidationError):
+            discover_har_files(str(har_dir / "*.json"))
+
+    def test_analyze_isolates_failures(self, har_dir: Path, tmp_path: Path):
+        """Test that a broken file does not abort the batch."""
+        output_dir = tmp_path / "out"
+        files = discover_har_files(str(har_dir))
+
+        summary = BatchAnalyzer(workers=2).analyze(files, output_dir)
+
+        assert list(summary["status"]) == ["ok", "ok", "error"]
+        assert list(summary["requests"][:2]) == [2, 2]
+        assert "Invalid JSON" in summary["error"].iloc[2]
+        assert (output_dir / "batch_summary.csv").exists()
+        assert (output_dir / "a" / "har_analysis.csv").exists()
+        assert (output_dir / "b" / "summary.txt").exists()
@@ -0,0 +1,69 @@
+"""Unit tests for the synthetic HAR generator and benchmark harness."""
+
+import json
+from pathlib import Path
+
+from har_analyzer.benchmark import (
+    STAGES,
+    benchmark_file,
+    performance_target,
+    run_benchmark,
+    write_synthetic_har,
+)
+from har_analyzer.core.parser import HARParser
+from har_analyzer.utils import validate_har_file
+
+
+class TestSyntheticHARGenerator:
+    """Test cases for the synthetic HAR generator."""
+
+    def test_same_seed_same_file(self, tmp_path: Path):
+        """Test that generation is deterministic for a seed."""
+        first = write_synthetic_har(tmp_path / "a.har", 300, seed=7)
+        second = write_synthetic_har(tmp_path / "b.har", 300, seed=7)
+        other = write_synthetic_har(tmp_path / "c.har", 300, seed=8)
+
+        assert first.read_bytes() == second.read_bytes()
+        assert first.read_bytes() != other.read_bytes()
+
+    def test_generated_file_parses(self, tmp_path: Path):
+        """Test that the file is valid HAR with a realistic resource mix."""
+        path = write_synthetic_har(
+            tmp_path / "synthetic.har", 12_000, body_fraction=0.1
+        )
+
+        df = HARParser().parse_file(path)
+
+        assert validate_har_file(path) == 12_000
+        assert len(df) == 12_000
+        assert df["type"].nunique() >= 5
+        assert (df["status_code"] >= 400).any()
+        assert df["start_time"].is_monotonic_increasing
+
+
+class TestBenchmarkHarness:
+    """Test cases for the benchmark harness."""
+
+    def test_benchmark_file(self, sample_har_file: Path):
+        """Test that every stage is timed and measured."""
+        result = benchmark_file(sample_har_file, export_formats=["columnar"])
+
+        assert list(result["stages"]) == list(STAGES)
+        for stage in result["stages"].values():
+            assert stage["seconds"] >= 0
+            assert stage["peak_rss_mb"] > 0
+        assert result["entries"] == result["requests"] == 2
+        assert result["target"]["max_seconds"] == 5
+
+    def test_run_benchmark_is_json(self, tmp_path: Path):
+        """Test that results are machine-readable and reuse generated files."""
+        results = run_benchmark([100], work_dir=tmp_path, seed=3)
+
+        assert json.loads(json.dumps(results))["runs"][0]["entries"] == 100
+        assert (tmp_path / "synthetic_100_3.har").exists()
+
+    def test_performance_target(self):
+        """Test that limits follow the documented file size classes."""
+        assert performance_target(500 * 1024)["max_rss_mb"] == 100
+        assert performance_target(5 * 1024 * 1024)["max_seconds"] == 30
+        assert performance_target(50 * 1024 * 1024)["max_rss_mb"] == 1024
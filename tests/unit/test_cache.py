@@ -0,0 +1,110 @@
+"""Unit tests for the parsed data cache."""
+
+import io
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from har_analyzer.core.cache import (
+    ParseCache,
+    read_frame,
+    read_schema,
+    write_frame,
+)
+from har_analyzer.core.parser import HARParser
+
+
+@pytest.fixture
+def mixed_frame() -> pd.DataFrame:
+    """Create a DataFrame with a column of every stored kind."""
+    return pd.DataFrame(
+        {
+            "url": ["https://example.com/a.js", "https://例え.jp/ü", ""],
+            "type": pd.Categorical(["JS", "Other", "JS"]),
+            "status_code": pd.array([200, 404, 0], dtype="int16"),
+            "size_kb": pd.array([1.5, float("nan"), 0], dtype="float32"),
+            "start_time": pd.to_datetime(
+                ["2025-01-01T10:00:00Z", None, "2025-01-01T10:00:01Z"], utc=True
+            ),
+        }
+    )
+
+
+class TestCacheFormat:
+    """Test cases for the binary columnar cache format."""
+
+    def test_round_trip(self, mixed_frame: pd.DataFrame, tmp_path: Path):
+        """Test that every column kind survives a write and memory-mapped read."""
+        path = tmp_path / "frame.harc"
+        with open(path, "wb") as f:
+            write_frame(f, mixed_frame, {"entries_count": 3})
+
+        loaded, metadata = read_frame(path)
+
+        pd.testing.assert_frame_equal(loaded, mixed_frame)
+        assert metadata == {"entries_count": 3}
+
+    def test_read_schema(self, mixed_frame: pd.DataFrame, tmp_path: Path):
+        """Test that the schema is read from the header alone."""
+        path = tmp_path / "frame.harc"
+        with open(path, "wb") as f:
+            write_frame(f, mixed_frame, {})
+
+        schema = read_schema(path)
+
+        pd.testing.assert_frame_equal(schema, mixed_frame.iloc[:0])
+
+    def test_rejects_foreign_file(self, tmp_path: Path):
+        """Test that files without the cache header are rejected."""
+        path = tmp_path / "frame.harc"
+        path.write_bytes(b"not a cache file at all")
+
+        with pytest.raises(ValueError):
+            read_frame(path)
+
+
+class TestParseCache:
+    """Test cases for ParseCache class."""
+
+    def test_parser_uses_cache(self, sample_har_file: Path, tmp_path: Path):
+        """Test that a second parse is served from the cache."""
+        cache = ParseCache(tmp_path / "cache")
+        first = HARParser(cache=cache)
+        df = first.parse_file(sample_har_file)
+
+        second = HARParser(cache=cache)
+        second._parse_sequential = None  # type: ignore[assignment]
+        cached = second.parse_file(sample_har_file)
+
+        pd.testing.assert_frame_equal(cached, df)
+        assert second.get_metadata() == first.get_metadata()
+
+    def test_key_depends_on_content_and_salt(self, tmp_path: Path):
+        """Test that keys change with file content and salt only."""
+        cache = ParseCache(tmp_path)
+        a, b = tmp_path / "a.har", tmp_path / "b.har"
+        a.write_text("{}")
+        b.write_text("{}")
+
+        assert cache.key(a, "v1") == cache.key(b, "v1")
+        assert cache.key(a, "v1") != cache.key(a, "v2")
+        b.write_text("{ }")
+        assert cache.key(a, "v1") != cache.key(b, "v1")
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        """Test that eviction removes the oldest entries first."""
+        df = pd.DataFrame({"value": range(1000)})
+        buffer = io.BytesIO()
+        write_frame(buffer, df, {})
+        cache = ParseCache(tmp_path)
+        cache.max_bytes = len(buffer.getvalue()) * 2
+
+        for i, key in enumerate(["old", "used", "new"]):
+            cache.store(key, df, {})
+            os.utime(tmp_path / f"{key}.harc", (i, i))
+            if key == "used":
+                cache.load("used")
+
+        assert {p.stem for p in tmp_path.glob("*.harc")} == {"used", "new"}
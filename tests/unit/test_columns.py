@@ -0,0 +1,144 @@
+"""Unit tests for columnar entry building."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from har_analyzer.core.columns import (
+    ENTRY_SCHEMA,
+    ColumnarBuilder,
+    ColumnSpec,
+    parse_timestamps,
+)
+from har_analyzer.core.parser import HARParser
+
+
+class TestColumnarBuilder:
+    """Test cases for ColumnarBuilder class."""
+
+    @pytest.fixture
+    def builder(self) -> ColumnarBuilder:
+        """Create a builder with a small schema."""
+        return ColumnarBuilder(
+            [
+                ColumnSpec("type", "category"),
+                ColumnSpec("status_code", "int16"),
+                ColumnSpec("size_bytes", "int64"),
+                ColumnSpec("response_time_ms", "float32"),
+            ]
+        )
+
+    def test_build_compact_dtypes(self, builder: ColumnarBuilder):
+        """Test that built columns use compact dtypes."""
+        builder.append(("JS", 200, 2048, 150))
+        builder.append(("CSS", 404, -1, None))
+
+        df = builder.build()
+
+        assert list(df.columns) == [
+            "type",
+            "status_code",
+            "size_bytes",
+            "size_kb",
+            "response_time_ms",
+        ]
+        assert isinstance(df["type"].dtype, pd.CategoricalDtype)
+        assert list(df["type"].cat.categories) == ["CSS", "JS"]
+        assert list(df["type"]) == ["JS", "CSS"]
+        assert df["status_code"].dtype == "int16"
+        assert df["response_time_ms"].dtype == "float32"
+        assert list(df["size_kb"]) == [2.0, 0.0]
+        assert pd.isna(df["response_time_ms"].iloc[1])
+
+    def test_entry_schema_dtypes(self):
+        """Test the dtype of every column of the entry schema."""
+        builder = ColumnarBuilder(ENTRY_SCHEMA)
+        builder.append(
+            ("https://a/x.js", "GET", 200, "text/javascript", 12.5, 2048)
+            + ("2025-01-01T10:00:00.000Z", 1, 2, 3, 4, 5, 6)
+        )
+
+        dtypes = builder.build().dtypes
+
+        assert dtypes["status_code"] == "int16"
+        assert dtypes["size_bytes"] == "int64"
+        assert dtypes["size_kb"] == "float32"
+        assert str(dtypes["start_time"]) == "datetime64[ns, UTC]"
+        for name in ("method", "mime_type"):
+            assert isinstance(dtypes[name], pd.CategoricalDtype)
+        for name in ("response_time_ms",) + tuple(
+            spec.name for spec in ENTRY_SCHEMA if spec.name.startswith("timing_")
+        ):
+            assert dtypes[name] == "float32"
+
+    def test_extend_merges_categories(self, builder: ColumnarBuilder):
+        """Test that extending equals appending the other builder's rows."""
+        rows = [("JS", 200, 10, 1.0), ("CSS", 404, 20, 2.0), ("IMG", 200, 30, 3.0)]
+        other = ColumnarBuilder(builder.schema)
+        builder.append(rows[0])
+        for row in rows[1:]:
+            other.append(row)
+        expected = ColumnarBuilder(builder.schema)
+        for row in rows:
+            expected.append(row)
+
+        builder.extend(other)
+
+        assert len(builder) == 3
+        pd.testing.assert_frame_equal(builder.build(), expected.build())
+
+    def test_extend_different_schema(self, builder: ColumnarBuilder):
+        """Test that builders with different schemas are not merged."""
+        other = ColumnarBuilder([ColumnSpec("type", "category")])
+
+        with pytest.raises(ValueError, match="different schemas"):
+            builder.extend(other)
+
+    def test_matches_row_wise_frame(
+        self, sample_har_file: Path, sample_dataframe: pd.DataFrame
+    ):
+        """Test that parsed values equal the row-wise DataFrame layout."""
+        df = HARParser().parse_file(sample_har_file)
+
+        expected = sample_dataframe.assign(
+            start_time=sample_dataframe["start_time"].dt.tz_localize("UTC")
+        )
+        assert list(df.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(
+            df.astype(dict.fromkeys(("type", "method", "mime_type"), object)),
+            expected,
+            check_dtype=False,
+        )
+
+    def test_bad_row_is_not_partially_appended(self, builder: ColumnarBuilder):
+        """Test that a row failing coercion leaves no partial values."""
+        builder.append(("JS", 200, 10, 1.0))
+
+        with pytest.raises(ValueError):
+            builder.append(("JS", 200, 10, "not a number"))
+
+        assert len(builder) == 1
+        assert len(builder.build()) == 1
+
+
+class TestParseTimestamps:
+    """Test cases for vectorized timestamp parsing."""
+
+    def test_parse_mixed_formats(self):
+        """Test UTC, offset, missing and invalid timestamps."""
+        timestamps, unparsed = parse_timestamps(
+            [
+                "2025-01-01T10:00:00.000Z",
+                "2025-01-01T12:00:00+02:00",
+                None,
+                "",
+                "not a timestamp",
+            ]
+        )
+
+        assert str(timestamps.dtype) == "datetime64[ns, UTC]"
+        assert timestamps[0] == pd.Timestamp("2025-01-01T10:00:00Z")
+        assert timestamps[1] == pd.Timestamp("2025-01-01T10:00:00Z")
+        assert timestamps[2:].isna().all()
+        assert unparsed == 1
@@ -0,0 +1,79 @@
+"""Unit tests for compressed HAR input."""
+
+import bz2
+import gzip
+import json
+import lzma
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from har_analyzer.core.parser import HARParser
+from har_analyzer.utils.compression import detect_compression, open_har
+from har_analyzer.utils.exceptions import InvalidHARFileError
+from har_analyzer.utils.validators import has_har_extension, validate_har_file
+
+COMPRESSORS = {
+    "gzip": (".gz", gzip.compress),
+    "bz2": (".bz2", bz2.compress),
+    "xz": (".xz", lzma.compress),
+}
+
+
+class TestCompressedInput:
+    """Test cases for transparent decompression."""
+
+    @pytest.mark.parametrize("compression", sorted(COMPRESSORS))
+    def test_parse_compressed(
+        self,
+        compression: str,
+        sample_har_data: dict[str, Any],
+        sample_har_file: Path,
+        tmp_path: Path,
+    ):
+        """Test that compressed files parse like the plain file."""
+        suffix, compress = COMPRESSORS[compression]
+        path = tmp_path / f"sample.har{suffix}"
+        path.write_bytes(compress(json.dumps(sample_har_data).encode("utf-8")))
+
+        assert detect_compression(path) == compression
+        assert validate_har_file(path) == 2
+        pd.testing.assert_frame_equal(
+            HARParser().parse_file(path), HARParser().parse_file(sample_har_file)
+        )
+
+    def test_detect_by_content_not_name(
+        self, sample_har_data: dict[str, Any], tmp_path: Path
+    ):
+        """Test that detection relies on magic bytes, not the file name."""
+        path = tmp_path / "sample.har"
+        path.write_bytes(gzip.compress(json.dumps(sample_har_data).encode("utf-8")))
+
+        with open_har(path) as f:
+            assert json.loads(f.read()) == sample_har_data
+
+    def test_corrupt_stream(self, sample_har_data: dict[str, Any], tmp_path: Path):
+        """Test that a truncated archive raises InvalidHARFileError."""
+        data = gzip.compress(json.dumps(sample_har_data).encode("utf-8"))
+        path = tmp_path / "sample.har.gz"
+        path.write_bytes(data[: len(data) // 2])
+
+        with pytest.raises(InvalidHARFileError):
+            validate_har_file(path)
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("site.har", True),
+            ("site.HAR.GZ", True),
+            ("site.har.xz", True),
+            ("site.gz", False),
+            ("site.har.zip", False),
+            ("site.json", False),
+        ],
+    )
+    def test_has_har_extension(self, name: str, expected: bool):
+        """Test accepted file name extensions."""
+        assert has_har_extension(Path(name)) is expected
@@ -0,0 +1,69 @@
+"""Unit tests for data export formats."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.core.export import read_columnar, write_ndjson
+from har_analyzer.core.formats import export_filename
+from har_analyzer.utils import HARAnalyzerError
+
+
+@pytest.fixture
+def parsed_analyzer(sample_har_file: Path) -> HARAnalyzer:
+    """Create an analyzer holding parsed sample data."""
+    analyzer = HARAnalyzer()
+    analyzer.analyze_file(sample_har_file)
+    return analyzer
+
+
+class TestNdjsonExport:
+    """Test cases for JSON Lines export."""
+
+    def test_matches_pandas_in_chunks(
+        self, random_dataframe: pd.DataFrame, tmp_path: Path
+    ):
+        """Test that chunked output equals a single pandas serialization."""
+        df = random_dataframe.assign(
+            start_time=pd.date_range("2025-01-01", periods=2000, freq="s", tz="UTC")
+        )
+        df.loc[3, "start_time"] = pd.NaT
+        path = tmp_path / "data.ndjson"
+
+        write_ndjson(df, path, chunk_rows=333)
+
+        expected = df.to_json(orient="records", lines=True, date_format="iso")
+        assert path.read_text(encoding="utf-8").rstrip("\n") == expected.rstrip("\n")
+
+    def test_export_data(self, parsed_analyzer: HARAnalyzer, tmp_path: Path):
+        """Test that each line is one request object."""
+        path = tmp_path / "data.ndjson"
+
+        parsed_analyzer.export_data(path, "ndjson")
+
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [row["url"] for row in rows] == list(parsed_analyzer.data["url"])
+        assert rows[0]["start_time"] == "2025-01-01T10:00:00.000Z"
+
+
+class TestColumnarExport:
+    """Test cases for binary columnar export."""
+
+    def test_round_trip(self, parsed_analyzer: HARAnalyzer, tmp_path: Path):
+        """Test that dtypes, values and metadata survive the export."""
+        path = tmp_path / export_filename("columnar")
+
+        parsed_analyzer.export_data(path, "columnar")
+        loaded, metadata = read_columnar(path)
+
+        assert path.name == "har_analysis.harc"
+        pd.testing.assert_frame_equal(loaded, parsed_analyzer.data)
+        assert metadata["entries_count"] == 2
+
+    def test_unsupported_format(self, parsed_analyzer: HARAnalyzer, tmp_path: Path):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(HARAnalyzerError, match="Unsupported export format"):
+            parsed_analyzer.export_data(tmp_path / "data.xml", "xml")
@@ -0,0 +1,121 @@
+"""Unit tests for entry filter expressions."""
+
+import pickle
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from har_analyzer.benchmark.generator import write_synthetic_har
+from har_analyzer.core.columns import ENTRY_SCHEMA
+from har_analyzer.core.filters import RowFilter
+from har_analyzer.core.parser import HARParser
+from har_analyzer.utils.exceptions import ConfigurationError, HARParsingError
+
+ROW = (
+    "https://CDN.example.com/app.js?v=1",
+    "GET",
+    404,
+    "application/javascript",
+    120.5,
+    3072,
+    "2025-01-01T10:00:00.000Z",
+    1,
+    2,
+    3,
+    4,
+    5,
+    6,
+)
+
+
+class TestRowFilter:
+    """Test cases for RowFilter class."""
+
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            (
+                'type in (API, JS) and status_code >= 400 and host == "cdn.example.com"',
+                True,
+            ),
+            ("type not in (JS) or method == POST", False),
+            ("not (status_code < 400) and size_kb == 3", True),
+            ("url contains 'app.js' and timing_wait > 4.5", True),
+            ('start_time >= "2025-01-01T11:00:00+01:00"', True),
+            ('start_time < "2025-01-01T10:00:00"', False),
+            ('start_time == "2025-01-01T11:00:00+0100"', True),
+            ('start_time < "2025-01-01T10:00:00.5Z"', True),
+            ("status_code == 404 or response_time_ms > 1000 and method == PUT", True),
+        ],
+    )
+    def test_evaluate(self, expression: str, expected: bool):
+        """Test evaluating expressions against one row."""
+        assert RowFilter(expression, ENTRY_SCHEMA)(ROW) is expected
+
+    def test_row_timestamp_forms(self):
+        """Test that row timestamps in forms fromisoformat rejects are parsed."""
+        row = (*ROW[:6], "2025-01-01T11:00:00.1234567+0100", *ROW[7:])
+
+        assert RowFilter('start_time > "2025-01-01T10:00:00Z"', ENTRY_SCHEMA)(row)
+
+    def test_missing_values_never_match(self):
+        """Test that unconvertible values fail every comparison."""
+        row = (*ROW[:2], None, *ROW[3:])
+
+        assert not RowFilter("status_code != 200", ENTRY_SCHEMA)(row)
+
+    @pytest.mark.parametrize(
+        "expression, message",
+        [
+            ("", "empty"),
+            ("latency > 5", "Unknown filter field"),
+            ("status_code >= high", "needs a number"),
+            ("start_time > yesterday", "ISO 8601"),
+            ("status_code = 404", "Invalid filter expression"),
+            ("(method == GET", "expected '\\)'"),
+            ("status_code contains 4", "not text"),
+        ],
+    )
+    def test_invalid(self, expression: str, message: str):
+        """Test that invalid expressions are rejected when compiled."""
+        with pytest.raises(ConfigurationError, match=message):
+            RowFilter(expression, ENTRY_SCHEMA)
+
+    def test_pickle(self):
+        """Test that filters can be sent to worker processes."""
+        row_filter = RowFilter("type == JS", ENTRY_SCHEMA)
+
+        restored = pickle.loads(pickle.dumps(row_filter))
+
+        assert restored.tree == row_filter.tree
+        assert restored(ROW)
+
+
+class TestParserFilter:
+    """Test cases for filtering while parsing."""
+
+    def test_matches_dataframe_slicing(self, tmp_path: Path):
+        """Test that filtered parsing equals slicing the full parse."""
+        har_file = write_synthetic_har(tmp_path / "synthetic.har", 500, seed=3)
+        expression = (
+            "type in (API, JS) and status_code >= 300 or host == api.example.com"
+        )
+
+        filtered = HARParser(filter_expr=expression).parse_file(har_file)
+        df = HARParser().parse_file(har_file)
+
+        hosts = df["url"].str.extract(r"//([^/]+)/", expand=False)
+        mask = (df["type"].isin(["API", "JS"]) & (df["status_code"] >= 300)) | (
+            hosts == "api.example.com"
+        )
+        expected = df[mask].reset_index(drop=True)
+        assert 0 < len(filtered) < len(df)
+        pd.testing.assert_frame_equal(filtered, expected, check_categorical=False)
+
+    def test_no_match(self, sample_har_file: Path):
+        """Test the error when the filter rejects every entry."""
+        parser = HARParser(filter_expr="status_code >= 500")
+
+        with pytest.raises(HARParsingError, match="No entries match the filter"):
+            parser.parse_file(sample_har_file)
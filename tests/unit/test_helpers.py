@@ -0,0 +1,72 @@
+"""Unit tests for helper utilities."""
+
+import pytest
+
+from har_analyzer.utils.helpers import (
+    ResourceClassifier,
+    ResourceRule,
+    categorize_resource_type,
+)
+
+MIME_TYPES = ["application/javascript", "text/css", "IMAGE/PNG", "", "text/plain"]
+URLS = [
+    "https://example.com/app.js",
+    "https://example.com/logo.PNG",
+    "https://example.com/api/users",
+    "https://example.com/font.woff2",
+    "https://example.com/page",
+]
+
+
+class TestResourceClassifier:
+    """Test cases for ResourceClassifier class."""
+
+    def test_classify_many_matches_scalar(self):
+        """Test that column classification matches per-entry results."""
+        pairs = [(mime, url) for mime in MIME_TYPES for url in URLS]
+        mime_types, urls = zip(*pairs)
+
+        result = ResourceClassifier().classify_many(mime_types, urls)
+
+        assert list(result) == [categorize_resource_type(m, u) for m, u in pairs]
+        assert list(result.categories) == sorted(result.categories)
+
+    def test_custom_rules(self):
+        """Test classification with configured rules."""
+        classifier = ResourceClassifier(
+            [
+                ResourceRule("Tracking", url_substrings=("analytics",)),
+                ResourceRule("Data", ("json",), (".csv",)),
+            ],
+            default="Misc",
+        )
+
+        result = classifier.classify_many(
+            ["text/plain", "application/json", "text/plain", "text/html"],
+            ["https://x/analytics.js", "https://x/a", "https://x/b.CSV", "https://x/"],
+        )
+
+        assert list(result) == ["Tracking", "Data", "Data", "Misc"]
+
+    def test_extension_normalization(self):
+        """Test extensions without a dot and extensions spanning several dots."""
+        classifier = ResourceClassifier(
+            [
+                ResourceRule("JS", extensions=("JS",)),
+                ResourceRule("Minified", extensions=(".min.js", "min.css")),
+                ResourceRule("Archive", extensions=(".tar.gz",)),
+            ]
+        )
+        urls = ["https://x/a.js", "https://x/a.min.js", "https://x/a.min.css"]
+        urls += ["https://x/a.TAR.GZ", "https://x/a.gz", "https://x/amin.css"]
+
+        result = classifier.classify_many([""] * len(urls), urls)
+
+        expected = ["JS", "JS", "Minified", "Archive", "Other", "Other"]
+        assert list(result) == expected
+        assert [classifier.classify("", url) for url in urls] == expected
+
+    def test_empty_extension(self):
+        """Test that empty extensions are rejected."""
+        with pytest.raises(ValueError, match="empty extension"):
+            ResourceClassifier([ResourceRule("Bad", extensions=(".",))])
@@ -0,0 +1,64 @@
+"""Unit tests for import cost of the command line."""
+
+import subprocess
+import sys
+
+import pytest
+
+import har_analyzer
+import har_analyzer.core
+
+# Libraries only some commands need
+HEAVY_MODULES = ("pandas", "numpy", "pydantic", "yaml", "psutil", "matplotlib")
+
+# Cumulative import time of har_analyzer.cli, in ms; pandas alone is ~250ms
+IMPORT_BUDGET_MS = 150
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestLazyImports:
+    """Test cases for lazily imported modules."""
+
+    def test_cli_skips_heavy_modules(self):
+        """Test that importing the command line loads no heavy library."""
+        result = _run(
+            "import sys, har_analyzer.cli; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_cli_import_budget(self):
+        """Test that the command line imports within the time budget."""
+        timings = []
+        for _ in range(3):
+            result = _run("import har_analyzer.cli", "-X", "importtime")
+            line = next(
+                line
+                for line in result.stderr.splitlines()
+                if line.rstrip().endswith("| har_analyzer.cli")
+            )
+            timings.append(int(line.split("|")[1]) / 1000)
+
+        assert min(timings) < IMPORT_BUDGET_MS
+
+    def test_package_attributes(self):
+        """Test that main classes resolve on first access."""
+        from har_analyzer.core.analyzer import HARAnalyzer
+
+        assert har_analyzer.HARAnalyzer is HARAnalyzer
+        assert har_analyzer.core.HARAnalyzer is HARAnalyzer
+        assert "HARParser" in dir(har_analyzer.core)
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="Missing"):
+            har_analyzer.core.Missing  # noqa: B018
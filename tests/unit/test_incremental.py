@@ -0,0 +1,93 @@
+"""Unit tests for incremental analysis."""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from har_analyzer.core.aggregates import FrameAggregates
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.core.incremental import IncrementalAnalyzer
+from har_analyzer.core.topk import grouped_top_k
+from har_analyzer.utils import HARAnalyzerError
+
+
+def add_in_chunks(analyzer: IncrementalAnalyzer, df: pd.DataFrame, chunks: int):
+    """Feed a DataFrame to an incremental analyzer in consecutive chunks."""
+    for positions in np.array_split(np.arange(len(df)), chunks):
+        analyzer.add_frame(df.iloc[positions])
+
+
+class TestIncrementalAnalyzer:
+    """Test cases for IncrementalAnalyzer class."""
+
+    def test_matches_full_aggregation(self, random_dataframe: pd.DataFrame):
+        """Test running aggregates against a single pass over all rows."""
+        analyzer = IncrementalAnalyzer()
+        add_in_chunks(analyzer, random_dataframe, 9)
+        results = analyzer.snapshot()
+        exact = FrameAggregates(random_dataframe)
+
+        basic = results["basic_stats"]
+        assert basic["total_requests"] == exact.total_requests
+        assert basic["avg_response_time_ms"] == pytest.approx(
+            exact.avg_response_time_ms
+        )
+        assert results["resource_breakdown"]["by_status"] == exact.status_counts
+        assert results["performance_issues"] == (
+            analyzer.metrics.detect_performance_issues(random_dataframe, exact)
+        )
+        for key, value in exact.percentiles.items():
+            assert results["percentiles"][key] == pytest.approx(value, rel=0.02)
+
+        summary = results["summary_by_type"].set_index("type")
+        expected = exact.summary_by_type.set_index("type")
+        for column in ["avg_response_time_ms", "std_response_time_ms", "min_size_kb"]:
+            np.testing.assert_allclose(summary[column], expected[column], atol=0.01)
+        assert list(summary["requests_count"]) == list(expected["requests_count"])
+
+    def test_top_resources(self, random_dataframe: pd.DataFrame):
+        """Test that the tracked top resources match the full data."""
+        analyzer = IncrementalAnalyzer()
+        add_in_chunks(analyzer, random_dataframe, 4)
+
+        slowest = analyzer.snapshot()["top_resources"]["slowest"]
+        expected = grouped_top_k(random_dataframe, ["response_time_ms"], 5)
+
+        for resource_type, frame in expected["response_time_ms"].items():
+            assert list(slowest[resource_type]["url"]) == list(frame["url"])
+
+    def test_add_entries(self, sample_har_data: dict[str, Any], sample_har_file: Path):
+        """Test that raw entries give the same grade as a file analysis."""
+        entries = sample_har_data["log"]["entries"]
+        analyzer = IncrementalAnalyzer()
+
+        assert analyzer.add_entries(entries[:1]) == 1
+        assert analyzer.add_entries([{"request": {}}]) == 0
+        assert analyzer.add_entries(entries[1:]) == 1
+        results = analyzer.snapshot()
+        expected = HARAnalyzer().analyze_file(sample_har_file)
+
+        assert results["metadata"]["entries_count"] == 3
+        assert results["performance_grade"] == expected["performance_grade"]
+        assert results["basic_stats"]["total_time_ms"] == (
+            expected["basic_stats"]["total_time_ms"]
+        )
+
+    def test_snapshot_is_frozen(self, random_dataframe: pd.DataFrame):
+        """Test that later entries do not change an earlier snapshot."""
+        analyzer = IncrementalAnalyzer()
+        analyzer.add_frame(random_dataframe.iloc[:100])
+        first = analyzer.snapshot()
+
+        analyzer.add_frame(random_dataframe.iloc[100:])
+
+        assert first["basic_stats"]["total_requests"] == 100
+        assert analyzer.snapshot()["basic_stats"]["total_requests"] == 2000
+
+    def test_empty_snapshot(self):
+        """Test that a snapshot without entries fails."""
+        with pytest.raises(HARAnalyzerError):
+            IncrementalAnalyzer().snapshot()
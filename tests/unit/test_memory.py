@@ -0,0 +1,127 @@
+"""Unit tests for the memory guard."""
+
+from pathlib import Path
+
+import pytest
+
+from har_analyzer.core.parser import HARParser
+from har_analyzer.utils import (
+    ConfigurationError,
+    MemoryGuard,
+    MemoryLimitExceededError,
+)
+
+
+class ScriptedGuard(MemoryGuard):
+    """Memory guard reading RSS from a list instead of the process."""
+
+    def __init__(self, readings: list[float], **kwargs):
+        self.readings = iter(readings)
+        super().__init__(**kwargs)
+
+    def rss_mb(self) -> float:
+        return next(self.readings)
+
+
+class TestMemoryGuard:
+    """Test cases for MemoryGuard class."""
+
+    def test_samples_on_byte_budget(self):
+        """Test that RSS is only read once the byte budget is used up."""
+        consumed = [0]
+        guard = ScriptedGuard(
+            [100.0, 101.0],
+            limit_mb=1000,
+            bytes_read=lambda: consumed[0],
+            interval_s=3600,
+            interval_bytes=1000,
+        )
+
+        for rows in range(1, 10):
+            consumed[0] = rows * 100
+            guard.check(rows)
+
+        assert guard.samples == 1
+        consumed[0] = 1000
+        guard.check(10)
+        assert guard.samples == 2
+
+    def test_projected_peak_stops_doomed_parse(self):
+        """Test that the projection raises well before RSS hits the limit."""
+        total = 100 * 1024 * 1024
+        guard = ScriptedGuard(
+            [100.0, 150.0],
+            limit_mb=400,
+            total_bytes=total,
+            bytes_read=lambda: total // 10,
+        )
+
+        # 50MB for the first tenth of the input projects to about 600MB
+        with pytest.raises(MemoryLimitExceededError, match="Projected"):
+            guard.sample(1000)
+        assert guard.projected_mb == pytest.approx(600)
+
+    def test_no_projection_during_warmup(self):
+        """Test that early samples are only checked against the limit."""
+        total = 1024 * 1024 * 1024
+        guard = ScriptedGuard(
+            [100.0, 150.0], limit_mb=400, total_bytes=total, bytes_read=lambda: 1024
+        )
+
+        guard.sample(10)
+
+        assert guard.projected_mb is None
+        assert guard.peak_mb == 150
+
+    def test_spill_threshold(self):
+        """Test that check reports usage above the spill threshold."""
+        total = 100 * 1024 * 1024
+        guard = ScriptedGuard(
+            [100.0, 150.0, 300.0],
+            limit_mb=400,
+            total_bytes=total,
+            bytes_read=lambda: total // 10,
+            interval_s=0,
+            spill_fraction=0.5,
+        )
+
+        assert guard.spill_mb == 250
+        # 150MB would project past the limit, but spilled rows are not counted
+        assert guard.check(1000) is False
+        assert guard.check(2000) is True
+        assert guard.projected_mb is None
+
+    def test_current_usage_over_limit(self):
+        """Test that usage above the limit raises immediately."""
+        with pytest.raises(MemoryLimitExceededError, match="exceeds limit"):
+            ScriptedGuard([500.0], limit_mb=400)
+
+    def test_spilling_baseline_near_limit(self):
+        """Test that a spilling guard starts with a baseline close to the limit."""
+        guard = ScriptedGuard([79.0, 79.8], limit_mb=80, spill_fraction=0.5)
+
+        assert guard.spill_mb == pytest.approx(79.5)
+        assert guard.sample(10) == 79.8
+
+    def test_spilling_baseline_over_limit(self):
+        """Test that a limit below the baseline is reported as a setting error."""
+        with pytest.raises(ConfigurationError, match="already in use"):
+            ScriptedGuard([80.2], limit_mb=80, spill_fraction=0.5)
+
+
+class TestParserMemoryLimit:
+    """Test cases for the parser memory limit."""
+
+    def test_parser_raises_memory_limit_error(self, sample_har_file: Path):
+        """Test that the parser reports an exceeded limit as such."""
+        parser = HARParser(memory_limit_mb=1)
+
+        with pytest.raises(MemoryLimitExceededError):
+            parser.parse_file(sample_har_file)
+
+    def test_out_of_core_limit_below_baseline(self, sample_har_file: Path):
+        """Test that out-of-core parsing reports a limit below current usage."""
+        parser = HARParser(memory_limit_mb=1)
+
+        with pytest.raises(ConfigurationError, match="out-of-core"):
+            parser.parse_chunks(sample_har_file)
@@ -3,6 +3,7 @@
 import json
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from har_analyzer.core.parser import HARParser
@@ -50,6 +51,53 @@ class TestHARParser:
         assert css_row["response_time_ms"] == 100
         assert css_row["size_kb"] == 0.5
 
+    def test_projection_matches_whole_entries(self, sample_har_data, tmp_path: Path):
+        """Test that skipping unused entry members leaves the output unchanged."""
+        for entry in sample_har_data["log"]["entries"]:
+            entry["response"]["content"]["text"] = "QUJD" * 5000
+            entry["response"]["headers"] = [{"name": "x", "value": "}"}]
+        har_file = tmp_path / "bodies.har"
+        har_file.write_text(json.dumps(sample_har_data))
+        whole = ["startedDateTime", "time", "request", "response", "timings"]
+
+        projected = HARParser().parse_file(har_file)
+        decoded = HARParser(entry_fields=whole).parse_file(har_file)
+
+        pd.testing.assert_frame_equal(projected, decoded)
+
+    def test_extended_fields(self, sample_har_data, tmp_path: Path):
+        """Test extracting the opt-in columns in the same pass."""
+        first, second = sample_har_data["log"]["entries"]
+        first.update(serverIPAddress="[2606:4700::1]", connection="4711")
+        first["request"]["headersSize"] = 320
+        first["response"].update(
+            headersSize=210,
+            _transferSize=1400,
+            headers=[
+                {"name": "Cache-Control", "value": "max-age=60"},
+                {"name": "cache-control", "value": "public "},
+                {"name": "content-encoding", "value": "br"},
+            ],
+        )
+        har_file = tmp_path / "extended.har"
+        har_file.write_text(json.dumps(sample_har_data))
+
+        df = HARParser(extended=True).parse_file(har_file)
+
+        row, missing = df.iloc[0], df.iloc[1]
+        assert row["server_ip"] == "[2606:4700::1]"
+        assert row["connection_id"] == "4711"
+        assert row["transfer_size"] == 1400
+        assert row["request_headers_size"] == 320
+        assert row["response_headers_size"] == 210
+        assert row["cache_control"] == "max-age=60, public"
+        assert row["content_encoding"] == "br"
+        assert missing["transfer_size"] == -1
+        assert missing["cache_control"] == ""
+        assert isinstance(df["cache_control"].dtype, pd.CategoricalDtype)
+        assert df["request_headers_size"].dtype == "int32"
+        assert "server_ip" not in HARParser().parse_file(har_file).columns
+
     def test_parse_nonexistent_file(self, tmp_path: Path):
         """Test parsing a nonexistent file."""
         parser = HARParser()
@@ -91,6 +139,19 @@ class TestHARParser:
         assert metadata["creator"]["name"] == "Test"
         assert metadata["entries_count"] == 2
 
+    def test_parse_entries(self, sample_har_data):
+        """Test parsing decoded entries like the entries of a file."""
+        entries = sample_har_data["log"]["entries"]
+        entries[1]["startedDateTime"] = "yesterday"
+        parser = HARParser()
+
+        df = parser.parse_entries(entries + [{"request": {}}])
+
+        assert list(df["url"]) == [entry["request"]["url"] for entry in entries]
+        assert list(df["type"]) == ["JS", "CSS"]
+        assert parser.unparsed_timestamps == 1
+        assert parser.parse_entries([]).empty
+
     def test_memory_limit_validation(self, sample_har_file: Path):
         """Test memory limit validation."""
         # Use a reasonable memory limit for small test file
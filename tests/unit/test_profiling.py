@@ -0,0 +1,81 @@
+"""Unit tests for stage profiling."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.utils import StageProfiler
+
+
+class TestStageProfiler:
+    """Test cases for StageProfiler class."""
+
+    def test_nested_stages(self):
+        """Test that stages record time, memory and nesting depth."""
+        profiler = StageProfiler()
+
+        with profiler.stage("parse", file_bytes=10):
+            with profiler.stage("parse.stream") as record:
+                record["entries"] = 3
+
+        summary = profiler.summary()
+        parse, stream = summary["stages"]
+        assert (parse["name"], parse["depth"], parse["file_bytes"]) == ("parse", 0, 10)
+        assert (stream["depth"], stream["entries"]) == (1, 3)
+        assert parse["seconds"] >= stream["seconds"]
+        assert summary["total_seconds"] == parse["seconds"]
+        assert summary["peak_rss_mb"] >= parse["rss_start_mb"]
+
+    def test_stage_recorded_on_error(self):
+        """Test that a failing stage is still timed."""
+        profiler = StageProfiler(detailed=True)
+
+        with pytest.raises(ValueError):
+            with profiler.stage("metrics.percentiles"):
+                raise ValueError("boom")
+
+        assert profiler.summary()["stages"][0]["seconds"] >= 0
+
+    def test_chrome_trace(self, tmp_path: Path):
+        """Test that stages become complete events in microseconds."""
+        profiler = StageProfiler()
+        with profiler.stage("parse"):
+            pass
+        path = tmp_path / "trace.json"
+
+        profiler.write_chrome_trace(path)
+
+        (event,) = json.loads(path.read_text())["traceEvents"]
+        assert (event["name"], event["ph"], event["cat"]) == ("parse", "X", "parse")
+        assert event["dur"] == pytest.approx(profiler.stages[0]["seconds"] * 1e6, abs=1)
+        assert "peak_rss_mb" in event["args"]
+
+
+class TestAnalyzerProfile:
+    """Test cases for the profile section of the analysis results."""
+
+    def test_profile_section(self, sample_har_file: Path):
+        """Test that parsing and metrics stages appear in the results."""
+        results = HARAnalyzer().analyze_file(sample_har_file)
+
+        profile = results.to_dict()["profile"]
+
+        names = [stage["name"] for stage in profile["stages"]]
+        assert names[:3] == ["parse", "parse.stream", "parse.dataframe"]
+        assert "metrics.aggregate" in names
+        assert "metrics.resource_breakdown" in names
+        assert profile["timers"] == {}
+
+    def test_detailed_profile(self, sample_har_file: Path):
+        """Test that detailed profiling splits decoding from extraction."""
+        analyzer = HARAnalyzer(HARAnalyzerConfig(profile=True))
+
+        profile = analyzer.analyze_file(sample_har_file)["profile"]
+
+        assert set(profile["timers"]) == {
+            "parse.json_decode",
+            "parse.entry_extraction",
+        }
@@ -0,0 +1,101 @@
+"""Unit tests for lazily computed analysis results."""
+
+from pathlib import Path
+
+import pytest
+
+from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.core.results import SECTIONS, AnalysisResults, resolve_sections
+from har_analyzer.utils import ConfigurationError, HARAnalyzerError
+
+
+class TestResolveSections:
+    """Test cases for resolve_sections function."""
+
+    def test_aliases_and_required_sections(self):
+        """Test that aliases resolve and required sections are added."""
+        assert resolve_sections(["percentiles", " Grade", ""]) == (
+            "metadata",
+            "basic_stats",
+            "performance_grade",
+            "percentiles",
+        )
+
+    def test_all_by_default(self):
+        """Test that no selection means every section."""
+        assert resolve_sections(None) == SECTIONS
+
+    def test_unknown_section(self):
+        """Test that unknown names are rejected."""
+        with pytest.raises(ConfigurationError, match="p95"):
+            resolve_sections(["p95"])
+
+
+class TestAnalysisResults:
+    """Test cases for AnalysisResults class."""
+
+    def test_sections_computed_once_on_access(self):
+        """Test that builders run on first access only."""
+        calls = []
+        results = AnalysisResults(
+            {"a": lambda: calls.append("a") or 1, "b": lambda: calls.append("b") or 2}
+        )
+
+        assert results.computed == []
+        assert results["a"] == 1 and results["a"] == 1
+        assert calls == ["a"]
+        assert dict(results) == {"a": 1, "b": 2}
+        assert calls == ["a", "b"]
+
+    def test_unselected_sections_are_absent(self):
+        """Test dict-like behavior for sections that were not selected."""
+        results = AnalysisResults({"a": lambda: 1, "b": lambda: 2}, ["b"])
+
+        assert "a" not in results
+        assert results.get("a") is None
+        assert list(results) == ["b"]
+        with pytest.raises(KeyError):
+            results["a"]
+
+    def test_builder_errors_are_wrapped(self):
+        """Test that failures surface as HARAnalyzerError."""
+        results = AnalysisResults({"a": lambda: 1 / 0})
+
+        with pytest.raises(HARAnalyzerError, match="Failed to compute a"):
+            results["a"]
+
+
+class TestSelectedAnalysis:
+    """Test cases for analysis with selected sections."""
+
+    def test_only_selected_sections(self, sample_har_file: Path):
+        """Test that only the selected sections are computed."""
+        config = HARAnalyzerConfig(analysis_sections=["grade", "percentiles"])
+        analyzer = HARAnalyzer(config)
+
+        results = analyzer.analyze_file(sample_har_file)
+        summary = analyzer.get_summary_text()
+
+        assert list(results) == [
+            "metadata",
+            "basic_stats",
+            "performance_grade",
+            "percentiles",
+        ]
+        assert "Overall Grade" in summary
+        assert set(results.computed) == {"basic_stats", "performance_grade"}
+
+    def test_full_results_match_sections(self, sample_har_file: Path):
+        """Test that all sections are available by default."""
+        results = HARAnalyzer().analyze_file(sample_har_file)
+
+        full = results.to_dict()
+
+        assert list(full) == list(SECTIONS)
+        assert set(full["top_resources"]) == {"slowest", "largest"}
+
+    def test_unknown_section_in_config(self):
+        """Test that unknown sections fail when the analyzer is created."""
+        with pytest.raises(ConfigurationError):
+            HARAnalyzer(HARAnalyzerConfig(analysis_sections=["everything"]))
@@ -0,0 +1,187 @@
+"""Unit tests for sampled analysis."""
+
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from har_analyzer.benchmark.generator import write_synthetic_har
+from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.aggregates import FrameAggregates
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.core.parser import HARParser
+from har_analyzer.core.sampling import (
+    BernoulliSampler,
+    ReservoirSampler,
+    quantile_intervals,
+)
+from har_analyzer.utils import HARParsingError
+
+
+@pytest.fixture
+def synthetic_har_file(tmp_path: Path) -> Path:
+    """Create a synthetic HAR file with 2000 entries."""
+    return write_synthetic_har(tmp_path / "synthetic.har", 2000, seed=5)
+
+
+class TestSamplers:
+    """Test cases for the stream samplers."""
+
+    def test_reservoir_is_uniform(self):
+        """Test that every item is kept with about the same frequency."""
+        counts: Counter = Counter()
+        for seed in range(2000):
+            sampler = ReservoirSampler(5, seed)
+            for item in range(50):
+                sampler.offer(item)
+            counts.update(sampler.items())
+
+        # Each item is kept with probability 5/50 in each of 2000 runs
+        assert len(counts) == 50
+        assert min(counts.values()) > 140
+        assert max(counts.values()) < 260
+
+    def test_reservoir_keeps_stream_order(self):
+        """Test that sampled items come back in stream order."""
+        sampler = ReservoirSampler(100, seed=1)
+        for item in range(10_000):
+            assert sampler.offer(item) is False
+
+        items = sampler.items()
+        assert len(items) == 100
+        assert items == sorted(items)
+
+    def test_reservoir_smaller_stream(self):
+        """Test that a stream shorter than the reservoir is kept whole."""
+        sampler = ReservoirSampler(10)
+        for item in "abc":
+            sampler.offer(item)
+
+        assert sampler.items() == ["a", "b", "c"]
+
+    def test_bernoulli_fraction(self):
+        """Test that about the requested fraction of items is kept."""
+        sampler = BernoulliSampler(0.2, seed=3)
+
+        kept = sum(sampler.offer(item) for item in range(10_000))
+
+        assert 1800 < kept < 2200
+        assert sampler.seen == 10_000
+
+    @pytest.mark.parametrize(
+        "sampler, value", [(ReservoirSampler, 0), (BernoulliSampler, 1.5)]
+    )
+    def test_invalid_parameters(self, sampler: type, value: float):
+        """Test that empty samples and fractions above one are rejected."""
+        with pytest.raises(ValueError):
+            sampler(value)
+
+
+class TestQuantileIntervals:
+    """Test cases for quantile confidence intervals."""
+
+    def test_coverage(self):
+        """Test that intervals cover the population quantile as often as stated."""
+        rng = np.random.default_rng(0)
+        population = rng.lognormal(5, 1, 20_000)
+        true_p90 = np.quantile(population, 0.9)
+
+        covered = 0
+        for _ in range(200):
+            sample = rng.choice(population, 400, replace=False)
+            [(low, high)] = quantile_intervals(sample, [0.9], len(population), 0.95)
+            covered += low <= true_p90 <= high
+
+        assert covered >= 180
+
+    def test_whole_population(self):
+        """Test that a census gives the order statistics around the quantile."""
+        values = np.array([4.0, 1.0, np.nan, 3.0, 2.0])
+
+        assert quantile_intervals(values, [0.5, 0.0], population=4) == [
+            (2.0, 3.0),
+            (1.0, 1.0),
+        ]
+
+    def test_empty(self):
+        """Test that an empty sample has unknown bounds."""
+        [(low, high)] = quantile_intervals(np.array([]), [0.5], population=10)
+
+        assert np.isnan(low) and np.isnan(high)
+
+
+class TestSampledParsing:
+    """Test cases for sampled parsing and analysis."""
+
+    def test_exact_totals(self, synthetic_har_file: Path):
+        """Test that totals and counts do not depend on the sample."""
+        full = FrameAggregates(HARParser().parse_file(synthetic_har_file))
+        parser = HARParser(sample_size=150, sample_seed=7)
+
+        sample = parser.parse_file(synthetic_har_file)
+        totals = parser.sample_totals.snapshot()
+
+        assert len(sample) == 150
+        assert sample.index.is_monotonic_increasing
+        assert totals.total_requests == full.total_requests
+        assert totals.total_size_kb == pytest.approx(full.total_size_kb)
+        assert totals.type_counts == full.type_counts
+        assert totals.status_counts == full.status_counts
+        assert parser.get_metadata()["sampling"] == {
+            "method": "reservoir",
+            "sample_size": 150,
+            "seed": 7,
+            "sampled_requests": 150,
+            "population": 2000,
+        }
+
+    def test_sampling_is_reproducible(self, synthetic_har_file: Path):
+        """Test that the same seed selects the same entries."""
+        first = HARParser(sample_fraction=0.05, sample_seed=2)
+        second = HARParser(sample_fraction=0.05, sample_seed=2)
+
+        selected = list(first.parse_file(synthetic_har_file)["start_time"])
+
+        assert selected == list(second.parse_file(synthetic_har_file)["start_time"])
+        assert first.get_metadata()["sampling"]["method"] == "bernoulli"
+
+    def test_empty_sample(self, sample_har_file: Path):
+        """Test the error when no entry is sampled."""
+        parser = HARParser(sample_fraction=1e-9)
+
+        with pytest.raises(HARParsingError, match="No entries were sampled out of 2"):
+            parser.parse_file(sample_har_file)
+
+    def test_analysis_reports_intervals(self, synthetic_har_file: Path):
+        """Test that sampled results keep exact totals and add intervals."""
+        exact = HARAnalyzer().analyze_file(synthetic_har_file)
+        analyzer = HARAnalyzer(HARAnalyzerConfig(sample_size=500))
+
+        results = analyzer.analyze_file(synthetic_har_file)
+
+        basic = results["basic_stats"]
+        assert basic["percentile_mode"] == "sample"
+        assert basic["total_requests"] == exact["basic_stats"]["total_requests"]
+        assert basic["avg_response_time_ms"] == pytest.approx(
+            exact["basic_stats"]["avg_response_time_ms"]
+        )
+        assert results["resource_breakdown"] == exact["resource_breakdown"]
+
+        sampling = results["sampling"]
+        intervals = sampling["confidence_intervals"]
+        assert sampling["population"] == 2000
+        assert intervals["level"] == 0.95
+        for name, (low, high) in intervals["percentiles"].items():
+            assert low <= results["percentiles"][name] <= high
+        assert set(intervals["summary_by_type"]) <= set(
+            results["summary_by_type"]["type"]
+        )
+        assert intervals["grade"]["best"] <= intervals["grade"]["worst"]
+        assert "sample of 500 of 2,000 requests" in analyzer.get_summary_text()
+
+    def test_unsampled_analysis(self, sample_har_file: Path):
+        """Test that the sampling section is empty without sampling."""
+        results = HARAnalyzer().analyze_file(sample_har_file)
+
+        assert results["sampling"] is None
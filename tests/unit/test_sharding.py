@@ -0,0 +1,148 @@
+"""Unit tests for sharded parallel parsing."""
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from har_analyzer.core.parser import HARParser
+from har_analyzer.core.sharding import (
+    ShardMismatchError,
+    iter_shard_entries,
+    plan_shards,
+)
+from har_analyzer.utils import MemoryLimitExceededError, get_memory_usage
+from har_analyzer.utils.streaming import HARStream
+
+
+def _exceed_limit(*args: Any) -> None:
+    """Shard parser standing in for a worker that runs out of memory."""
+    raise MemoryLimitExceededError("Memory usage exceeds limit")
+
+
+@pytest.fixture
+def large_har_file(sample_har_data: dict[str, Any], tmp_path: Path) -> Path:
+    """Create a HAR file with many entries and log members after them."""
+    entries = sample_har_data["log"]["entries"]
+    for i in range(300):
+        entry = json.loads(json.dumps(entries[i % 2]))
+        entry["request"]["url"] += f"?v={i}"
+        entry["comment"] = "},{" * (i % 3)  # Boundary look-alikes in strings
+        entries.append(entry)
+    sample_har_data["log"]["comment"] = "after entries"
+
+    har_file = tmp_path / "large.har"
+    har_file.write_text(json.dumps(sample_har_data, indent=2), encoding="utf-8")
+    return har_file
+
+
+@pytest.fixture
+def headers_har_file(sample_har_data: dict[str, Any], tmp_path: Path) -> Path:
+    """Create a HAR file whose entries hold long arrays of header objects."""
+    entries = sample_har_data["log"]["entries"]
+    for i in range(200):
+        entry = json.loads(json.dumps(entries[i % 2]))
+        entry["request"]["url"] += f"?v={i}"
+        entry["request"]["headers"] = [
+            {"name": f"x-header-{j}", "value": "v" * j} for j in range(40)
+        ]
+        entry["response"]["cookies"] = [{"name": "a", "value": "1"}] * 5
+        entries.append(entry)
+
+    har_file = tmp_path / "headers.har"
+    har_file.write_text(json.dumps(sample_har_data), encoding="utf-8")
+    return har_file
+
+
+class TestSharding:
+    """Test cases for sharded parsing."""
+
+    def test_parallel_matches_sequential(self, large_har_file: Path):
+        """Test that sharded parsing returns the same frame and metadata."""
+        sequential = HARParser()
+        parallel = HARParser(workers=3, min_shard_bytes=1024)
+
+        expected = sequential.parse_file(large_har_file)
+        result = parallel.parse_file(large_har_file)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert parallel.get_metadata() == sequential.get_metadata()
+        assert parallel.get_metadata()["entries_count"] == 302
+        assert parallel._log is not None
+        assert parallel._log["comment"] == "after entries"
+
+    def test_workers_share_headroom(
+        self, large_har_file: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that workers start even when limit / workers is below usage."""
+        # Each worker's equal share of the whole limit is below the baseline
+        limit_mb = int(get_memory_usage()) + 256
+        caplog.set_level("INFO")
+        parser = HARParser(memory_limit_mb=limit_mb, workers=16, min_shard_bytes=1024)
+
+        result = parser.parse_file(large_har_file)
+
+        pd.testing.assert_frame_equal(result, HARParser().parse_file(large_har_file))
+        assert "16 shards" in caplog.text
+        assert "falling back" not in caplog.text
+
+    def test_worker_memory_fallback(
+        self,
+        large_har_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test that a worker over its memory share falls back to sequential."""
+        monkeypatch.setattr("har_analyzer.core.parser._parse_shard", _exceed_limit)
+        parser = HARParser(workers=3, min_shard_bytes=1024)
+
+        result = parser.parse_file(large_har_file)
+
+        assert len(result) == 302
+        assert "falling back to sequential parsing" in caplog.text
+
+    def test_plan_shards(self, large_har_file: Path):
+        """Test that shards are contiguous and start at entries."""
+        raw = large_har_file.read_bytes()
+        with open(large_har_file, "rb") as f:
+            first = HARStream(f).locate_entries()
+
+        shards = plan_shards(large_har_file, first, 4, 1024)
+
+        assert len(shards) == 4
+        assert shards[-1][1] is None
+        for (start, length), (next_start, _) in zip(shards, shards[1:]):
+            assert start + length == next_start
+            assert raw[next_start : next_start + 1] == b"{"
+
+    def test_boundaries_skip_header_arrays(
+        self, headers_har_file: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that separators between header objects are not boundaries."""
+        raw = headers_har_file.read_bytes()
+        entries = json.loads(raw)["log"]["entries"]
+        with open(headers_har_file, "rb") as f:
+            first = HARStream(f).locate_entries()
+
+        shards = plan_shards(headers_har_file, first, 8, 1024)
+
+        assert len(shards) == 8
+        decoder = json.JSONDecoder()
+        for start, _ in shards:
+            entry, _ = decoder.raw_decode(raw.decode("utf-8"), start)
+            assert entry in entries
+
+        parser = HARParser(workers=4, min_shard_bytes=1024)
+        result = parser.parse_file(headers_har_file)
+        assert len(result) == 202
+        assert "falling back" not in caplog.text
+
+    def test_misaligned_shard(self):
+        """Test that a shard cut inside an entry is rejected."""
+        raw = b'{"a": 1}, {"b": "x'
+
+        with pytest.raises(ShardMismatchError):
+            list(iter_shard_entries(io.BytesIO(raw), False, {}))
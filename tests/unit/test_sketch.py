@@ -0,0 +1,87 @@
+"""Unit tests for the mergeable quantile sketch."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from har_analyzer.core.aggregates import FrameAggregates
+from har_analyzer.core.sketch import QuantileSketch
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    """Create skewed response times with zeros and a few negatives."""
+    rng = np.random.default_rng(7)
+    data = rng.lognormal(5, 1.2, 20000)
+    data[:50] = 0
+    data[50:60] = -1
+    return data
+
+
+class TestQuantileSketch:
+    """Test cases for QuantileSketch class."""
+
+    @pytest.mark.parametrize("q", [0.0, 0.01, 0.5, 0.9, 0.95, 0.99, 1.0])
+    def test_relative_error_bound(self, values: np.ndarray, q: float):
+        """Test that estimates stay within the documented relative error."""
+        sketch = QuantileSketch(0.01).add(values)
+        exact = np.sort(values)[int(np.floor(q * (len(values) - 1)))]
+
+        assert abs(sketch.quantile(q) - exact) <= 0.01 * abs(exact) + 1e-12
+
+    def test_merge_is_exact(self, values: np.ndarray):
+        """Test that merged partial sketches equal a sketch of all values."""
+        whole = QuantileSketch().add(values)
+        parts = [QuantileSketch().add(chunk) for chunk in np.array_split(values, 7)]
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+
+        qs = [0.1, 0.5, 0.95, 0.999]
+        assert merged.quantiles(qs) == whole.quantiles(qs)
+        assert merged.count == whole.count
+        assert merged.mean == pytest.approx(whole.mean)
+
+    def test_serialization_round_trip(self, values: np.ndarray):
+        """Test that a serialized sketch restores identical estimates."""
+        sketch = QuantileSketch(0.02).add(values)
+
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+
+        assert restored.quantiles([0.5, 0.99]) == sketch.quantiles([0.5, 0.99])
+
+    def test_rejects_mismatched_accuracy(self):
+        """Test that sketches with different accuracies do not merge."""
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_empty_and_nan(self):
+        """Test that NaN is skipped and empty sketches return NaN."""
+        sketch = QuantileSketch().add([np.nan])
+
+        assert sketch.count == 0
+        assert np.isnan(sketch.quantile(0.5))
+
+
+class TestSketchAggregates:
+    """Test cases for sketch-mode aggregation."""
+
+    def test_sketch_mode_close_to_exact(self, sample_dataframe: pd.DataFrame):
+        """Test that sketch percentiles approximate exact ones per type."""
+        df = pd.concat([sample_dataframe] * 50, ignore_index=True)
+        df["response_time_ms"] = np.linspace(10, 1000, len(df))
+
+        exact = FrameAggregates(df, "exact")
+        sketched = FrameAggregates(df, "sketch")
+
+        assert sketched.percentile_mode == "sketch"
+        assert set(sketched.type_sketches) == {"CSS", "JS"}
+        for key, value in exact.percentiles.items():
+            assert sketched.percentiles[key] == pytest.approx(value, rel=0.02)
+
+    def test_auto_mode_is_exact_for_small_inputs(self, sample_dataframe: pd.DataFrame):
+        """Test that auto mode keeps exact percentiles for small inputs."""
+        aggregates = FrameAggregates(sample_dataframe, "auto")
+
+        assert aggregates.percentile_mode == "exact"
+        assert aggregates.response_sketch is None
@@ -0,0 +1,173 @@
+"""Unit tests for out-of-core parsing and analysis."""
+
+import itertools
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+import pandas as pd
+import pytest
+
+from har_analyzer.benchmark.generator import write_synthetic_har
+from har_analyzer.config import HARAnalyzerConfig
+from har_analyzer.core.analyzer import HARAnalyzer
+from har_analyzer.core.export import read_columnar
+from har_analyzer.core.parser import HARParser
+from har_analyzer.core.spill import SpilledFrame
+from har_analyzer.utils import MemoryGuard
+
+
+class SpillingGuard(MemoryGuard):
+    """Memory guard asking for a spill every 300 rows."""
+
+    def check(self, rows: int) -> bool:
+        return self.spill_mb is not None and rows >= 300
+
+
+@pytest.fixture
+def synthetic_har_file(tmp_path: Path) -> Path:
+    """Create a synthetic HAR file with 1000 entries."""
+    return write_synthetic_har(tmp_path / "synthetic.har", 1000, seed=11)
+
+
+@pytest.fixture
+def spilling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make parsers spill every 300 rows regardless of memory usage."""
+    monkeypatch.setattr("har_analyzer.core.parser.MemoryGuard", SpillingGuard)
+
+
+class TestSpilledFrame:
+    """Test cases for SpilledFrame class."""
+
+    def test_chunks_round_trip(self, sample_dataframe: pd.DataFrame, tmp_path: Path):
+        """Test that spilled chunks and the tail come back in order."""
+        frames = SpilledFrame(tmp_path)
+        frames.spill(sample_dataframe.iloc[:2])
+        frames.tail = sample_dataframe.iloc[2:]
+
+        chunks = list(frames.chunks())
+
+        assert frames.spilled and len(frames) == len(sample_dataframe)
+        pd.testing.assert_frame_equal(frames.columns, sample_dataframe.iloc[:0])
+        pd.testing.assert_frame_equal(chunks[0], sample_dataframe.iloc[:2])
+        pd.testing.assert_frame_equal(
+            frames.to_frame(), sample_dataframe, check_categorical=False
+        )
+
+    def test_close_removes_files(self, sample_dataframe: pd.DataFrame, tmp_path: Path):
+        """Test that closing deletes the spill directory."""
+        frames = SpilledFrame(tmp_path)
+        frames.spill(sample_dataframe)
+        directory = frames.directory
+
+        frames.close()
+
+        assert not directory.exists()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSpillThreshold:
+    """Test cases for the spill decision of the memory guard."""
+
+    def test_spills_past_threshold(
+        self, synthetic_har_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that rows are spilled once sampled usage passes spill_mb."""
+        clock = itertools.count()
+
+        def sample(guard: MemoryGuard, rows: int, consumed: Optional[int] = None):
+            # Usage grows by 0.1MB per row held in memory
+            return 100.0 + rows / 10
+
+        # Every check samples, with a 100MB baseline and a 200MB limit
+        monkeypatch.setattr(
+            "har_analyzer.utils.memory.time",
+            SimpleNamespace(monotonic=lambda: next(clock)),
+        )
+        monkeypatch.setattr(MemoryGuard, "rss_mb", lambda guard: 100.0)
+        monkeypatch.setattr(MemoryGuard, "sample", sample)
+        parser = HARParser(memory_limit_mb=200)
+
+        frames = parser.parse_chunks(synthetic_har_file)
+
+        # The threshold is 100MB + 40% of the 100MB headroom, passed at 401 rows
+        assert [len(chunk) for chunk in frames.chunks()] == [401, 401, 198]
+        pd.testing.assert_frame_equal(
+            frames.to_frame(),
+            HARParser().parse_file(synthetic_har_file),
+            check_categorical=False,
+        )
+        frames.close()
+
+
+@pytest.mark.usefixtures("spilling")
+class TestOutOfCore:
+    """Test cases for parsing and analyzing spilled data."""
+
+    def test_parse_chunks(self, synthetic_har_file: Path, tmp_path: Path):
+        """Test that spilled chunks hold exactly the parsed rows."""
+        expected = HARParser().parse_file(synthetic_har_file)
+        parser = HARParser(spill_dir=tmp_path / "spill")
+
+        frames = parser.parse_chunks(synthetic_har_file)
+
+        assert [len(chunk) for chunk in frames.chunks()] == [300, 300, 300, 100]
+        assert parser.get_metadata()["spill"]["spilled_requests"] == 900
+        pd.testing.assert_frame_equal(
+            frames.to_frame(), expected, check_categorical=False
+        )
+        frames.close()
+
+    def test_analysis_matches_in_memory(self, synthetic_har_file: Path):
+        """Test that chunked aggregation equals the in-memory analysis."""
+        exact = HARAnalyzer().analyze_file(synthetic_har_file)
+        analyzer = HARAnalyzer(HARAnalyzerConfig(out_of_core=True))
+
+        results = analyzer.analyze_file(synthetic_har_file)
+
+        assert analyzer.data is None and analyzer.spilled is not None
+        basic = results["basic_stats"]
+        assert basic["percentile_mode"] == "sketch"
+        assert basic["total_requests"] == 1000
+        assert basic["total_size_kb"] == pytest.approx(
+            exact["basic_stats"]["total_size_kb"]
+        )
+        assert results["resource_breakdown"] == exact["resource_breakdown"]
+        assert results["performance_issues"] == exact["performance_issues"]
+        for name, value in exact["percentiles"].items():
+            assert results["percentiles"][name] == pytest.approx(value, rel=0.02)
+        slowest = results["top_resources"]["slowest"]
+        for resource_type, frame in exact["top_resources"]["slowest"].items():
+            assert list(slowest[resource_type]["url"]) == list(frame["url"])
+        assert "spilled to disk in 3 chunks" in analyzer.get_summary_text()
+
+    @pytest.mark.parametrize("format", ["csv", "ndjson"])
+    def test_export_chunks(self, synthetic_har_file: Path, tmp_path: Path, format):
+        """Test that spilled data is exported like in-memory data."""
+        in_memory = HARAnalyzer()
+        in_memory.analyze_file(synthetic_har_file)
+        analyzer = HARAnalyzer(HARAnalyzerConfig(out_of_core=True))
+        analyzer.analyze_file(synthetic_har_file)
+
+        in_memory.export_data(tmp_path / f"expected.{format}", format)
+        analyzer.export_data(tmp_path / f"spilled.{format}", format)
+
+        assert (tmp_path / f"spilled.{format}").read_bytes() == (
+            tmp_path / f"expected.{format}"
+        ).read_bytes()
+
+    def test_export_columnar_chunks(self, synthetic_har_file: Path, tmp_path: Path):
+        """Test that spilled data is exported in the columnar format."""
+        in_memory = HARAnalyzer()
+        in_memory.analyze_file(synthetic_har_file)
+        analyzer = HARAnalyzer(HARAnalyzerConfig(out_of_core=True))
+        analyzer.analyze_file(synthetic_har_file)
+
+        in_memory.export_data(tmp_path / "expected.harc", "columnar")
+        analyzer.export_data(tmp_path / "spilled.harc", "columnar")
+
+        expected, _ = read_columnar(tmp_path / "expected.harc")
+        spilled, metadata = read_columnar(tmp_path / "spilled.harc")
+        assert len(spilled) == 1000
+        assert metadata["spill"]["spilled_requests"] == 900
+        pd.testing.assert_frame_equal(spilled, expected, check_categorical=False)
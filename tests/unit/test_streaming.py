@@ -0,0 +1,188 @@
+"""Unit tests for streaming JSON reading."""
+
+import io
+import json
+from typing import Any
+
+import pytest
+
+from har_analyzer.utils.exceptions import InvalidHARFileError, ValidationError
+from har_analyzer.utils.streaming import (
+    HARStream,
+    JSONStreamReader,
+    build_projection,
+)
+
+
+def _stream(data: Any, chunk_size: int = 7) -> HARStream:
+    """Create a HAR stream over serialized data with a tiny chunk size."""
+    raw = json.dumps(data, indent=1).encode("utf-8")
+    return HARStream(io.BytesIO(raw), chunk_size=chunk_size)
+
+
+class TestJSONStreamReader:
+    """Test cases for JSONStreamReader class."""
+
+    def test_values_across_chunk_boundaries(self):
+        """Test decoding values that straddle refill boundaries."""
+        doc = [12345678, 'esc\\"aped é', {"a": [1, 2, {"b": None}]}, True]
+        reader = JSONStreamReader(io.BytesIO(json.dumps(doc).encode()), 3)
+
+        values = [reader.read_value() for _ in reader.iter_array()]
+
+        assert values == doc
+        assert reader.at_end()
+
+    def test_skip_value(self):
+        """Test skipping nested values without decoding them."""
+        doc = {"skip": {"x": ["]", "}", {"y": "\\\\"}]}, "keep": 1.5e3}
+        reader = JSONStreamReader(io.BytesIO(json.dumps(doc).encode()), 4)
+
+        kept = {}
+        for key in reader.iter_object():
+            if key == "skip":
+                reader.skip_value()
+            else:
+                kept[key] = reader.read_value()
+
+        assert kept == {"keep": 1500.0}
+
+    def test_skip_strings_with_escapes(self):
+        """Test skipping strings whose escaped quotes straddle refills."""
+        doc = ['a\\"b' * 20, "\\" * 9, '"' * 11, "after"]
+        reader = JSONStreamReader(io.BytesIO(json.dumps(doc).encode()), 5)
+
+        for index in reader.iter_array():
+            if index < 3:
+                reader.skip_value()
+            else:
+                assert reader.read_value() == "after"
+
+    @pytest.mark.parametrize("chunk_size", [3, 64, 4096])
+    def test_read_projected(self, chunk_size: int):
+        """Test that only projected members are kept, in or out of buffer."""
+        doc = {
+            "a": 1,
+            "body": 'x\\"' * 50,
+            "nested": {"keep": [1, {"b": 2}], "drop": ["}", "{"]},
+            "whole": {"x": None},
+        }
+        reader = JSONStreamReader(io.BytesIO(json.dumps(doc).encode()), chunk_size)
+        projection = build_projection(["a", "nested.keep", "whole", "missing.x"])
+
+        value = reader.read_projected(projection)
+
+        assert value == {
+            "a": 1,
+            "nested": {"keep": [1, {"b": 2}]},
+            "whole": {"x": None},
+        }
+        assert reader.at_end()
+
+    @pytest.mark.parametrize("chunk_size, decoded", [(64, False), (1 << 20, True)])
+    def test_projection_skips_large_members(
+        self, chunk_size: int, decoded: bool, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that unprojected members are only decoded if the object fits."""
+        body = "<p>body</p>" * 1000
+        doc = {"response": {"status": 200, "content": {"size": 1, "text": body}}}
+        raw_decode = json.JSONDecoder.raw_decode
+        values = []
+
+        def recording(decoder: json.JSONDecoder, text: str, start: int = 0):
+            value, end = raw_decode(decoder, text, start)
+            values.append(value)
+            return value, end
+
+        monkeypatch.setattr(json.JSONDecoder, "raw_decode", recording)
+        reader = JSONStreamReader(io.BytesIO(json.dumps(doc).encode()), chunk_size)
+
+        projection = build_projection(["response.status", "response.content.size"])
+
+        value = reader.read_projected(projection)
+
+        assert value == {"response": {"status": 200, "content": {"size": 1}}}
+        assert (body in repr(values)) is decoded
+
+    def test_build_projection(self):
+        """Test that a path prefix keeps the whole member."""
+        projection = build_projection(["request.url", "timings", "timings.dns"])
+
+        assert projection == {"request": {"url": None}, "timings": None}
+
+    def test_malformed_json(self):
+        """Test that malformed JSON raises InvalidHARFileError."""
+        reader = JSONStreamReader(io.BytesIO(b'[{"a": 1,}]'), 4)
+
+        with pytest.raises(InvalidHARFileError):
+            [reader.read_value() for _ in reader.iter_array()]
+
+
+class TestHARStream:
+    """Test cases for HARStream class."""
+
+    def test_iter_entries_and_log(self, sample_har_data: dict[str, Any]):
+        """Test streaming entries and collecting log metadata."""
+        sample_har_data["log"]["pages"] = [{"id": "page_1"}]
+        stream = _stream(sample_har_data)
+
+        entries = list(stream.iter_entries())
+
+        assert entries == sample_har_data["log"]["entries"]
+        assert stream.entries_count == 2
+        assert stream.log["version"] == "1.2"
+        assert stream.log["pages"] == [{"id": "page_1"}]
+        assert "entries" not in stream.log
+
+    def test_iter_entries_projection(self, sample_har_data: dict[str, Any]):
+        """Test decoding only some members of each entry."""
+        stream = _stream(sample_har_data)
+        projection = build_projection(["time", "request.url"])
+
+        entries = list(stream.iter_entries(projection=projection))
+
+        assert entries == [
+            {"time": entry["time"], "request": {"url": entry["request"]["url"]}}
+            for entry in sample_har_data["log"]["entries"]
+        ]
+
+    @pytest.mark.parametrize("trailer", [b" {}", b" garbage", b"]", b"\n\x00"])
+    def test_trailing_data(self, sample_har_data: dict[str, Any], trailer: bytes):
+        """Test that data after the HAR document is rejected."""
+        raw = json.dumps(sample_har_data).encode("utf-8") + trailer
+
+        with pytest.raises(InvalidHARFileError, match="extra data"):
+            list(HARStream(io.BytesIO(raw), chunk_size=7).iter_entries())
+        with pytest.raises(InvalidHARFileError, match="extra data"):
+            HARStream(io.BytesIO(raw), chunk_size=7).skip_entries()
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            ([1, 2], "JSON object"),
+            ({"other": {}}, "'log' object"),
+            ({"log": []}, "'log' must be an object"),
+            ({"log": {"version": "1.2"}}, "'entries' array"),
+            ({"log": {"entries": {}}}, "must be an array"),
+            ({"log": {"entries": "entries"}}, "must be an array"),
+            ({"log": {"entries": None}}, "must be an array"),
+            ({"log": {"entries": [1]}}, "entry must be an object"),
+            ({"log": {"entries": [["request", "response"]]}}, "must be an object"),
+            ({"log": {"version": "1.2", "pages": []}}, "'entries' array"),
+            ({"version": "1.2", "entries": []}, "'log' object"),
+            ({}, "'log' object"),
+            ({"log": {"entries": []}}, "no entries"),
+            ({"log": {"entries": [{"request": {}}]}}, "required field: response"),
+        ],
+    )
+    def test_structure_validation(self, data: Any, message: str):
+        """Test structural checks applied while streaming."""
+        with pytest.raises(ValidationError, match=message):
+            _stream(data).skip_entries()
+
+    def test_skip_entries(self, sample_har_data: dict[str, Any]):
+        """Test counting entries without decoding them."""
+        stream = _stream(sample_har_data)
+
+        assert stream.skip_entries() == 2
+        assert stream.log["creator"]["name"] == "Test"
@@ -0,0 +1,104 @@
+"""Unit tests for per-type top-N selection."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from har_analyzer.core.topk import TopKTracker, grouped_top_k
+
+METRICS = ["response_time_ms", "size_kb"]
+
+
+@pytest.fixture
+def ranked_dataframe() -> pd.DataFrame:
+    """Create a DataFrame with many ties and missing values."""
+    rng = np.random.default_rng(3)
+    n = 3000
+    response = rng.integers(0, 40, n).astype("float32")
+    response[::41] = np.nan
+    return pd.DataFrame(
+        {
+            "url": [f"https://example.com/{i}" for i in range(n)],
+            "method": pd.Categorical(rng.choice(["GET", "POST"], n)),
+            "status_code": rng.choice([200, 304, 404], n).astype("int16"),
+            "type": pd.Categorical(rng.choice(["JS", "CSS", "Image", "Font"], n)),
+            "response_time_ms": response,
+            "size_kb": rng.integers(0, 25, n).astype("float32"),
+        }
+    )
+
+
+def nlargest_by_type(df: pd.DataFrame, metric: str, n: int) -> dict:
+    """Reference implementation with a mask and nlargest per type."""
+    columns = ["url", metric, "type", "method", "status_code"]
+    return {
+        resource_type: df[df["type"] == resource_type].nlargest(n, metric)[columns]
+        for resource_type in df["type"].unique()
+    }
+
+
+def assert_same_top(actual: dict, expected: dict, check_index: bool = True) -> None:
+    """Assert two per-type results hold the same rows in the same order."""
+    assert list(actual) == list(expected)
+    for resource_type, frame in expected.items():
+        pd.testing.assert_frame_equal(
+            actual[resource_type].reset_index(drop=not check_index),
+            frame.reset_index(drop=not check_index),
+            check_dtype=False,
+            check_categorical=False,
+        )
+
+
+class TestGroupedTopK:
+    """Test cases for grouped_top_k function."""
+
+    @pytest.mark.parametrize("n", [1, 5, 2000])
+    def test_matches_nlargest(self, ranked_dataframe: pd.DataFrame, n: int):
+        """Test rows, tie order and type order against nlargest."""
+        result = grouped_top_k(ranked_dataframe, METRICS, n)
+
+        for metric in METRICS:
+            assert_same_top(
+                result[metric], nlargest_by_type(ranked_dataframe, metric, n)
+            )
+
+    def test_empty(self, ranked_dataframe: pd.DataFrame):
+        """Test that empty input yields no groups."""
+        assert grouped_top_k(ranked_dataframe.iloc[:0], METRICS) == {
+            "response_time_ms": {},
+            "size_kb": {},
+        }
+
+
+class TestTopKTracker:
+    """Test cases for TopKTracker class."""
+
+    def test_add_frame_matches_grouped(self, ranked_dataframe: pd.DataFrame):
+        """Test that chunked updates equal one pass over all rows."""
+        tracker = TopKTracker(METRICS, n=5)
+        for chunk in np.array_split(np.arange(len(ranked_dataframe)), 7):
+            tracker.add_frame(ranked_dataframe.iloc[chunk])
+
+        expected = grouped_top_k(ranked_dataframe, METRICS, 5)
+        for metric in METRICS:
+            assert_same_top(tracker.result()[metric], expected[metric])
+
+    def test_add_rows_and_merge(self, ranked_dataframe: pd.DataFrame):
+        """Test per-row updates and merging of partial trackers."""
+        first, second = TopKTracker(METRICS, n=3), TopKTracker(METRICS, n=3)
+        records = ranked_dataframe.to_dict("records")
+        for row in records[:1000]:
+            first.add(row)
+        second.add_frame(ranked_dataframe.iloc[1000:])
+
+        first.merge(second)
+
+        assert first.rows_seen == len(ranked_dataframe)
+        expected = grouped_top_k(ranked_dataframe, METRICS, 3)
+        for metric in METRICS:
+            assert_same_top(first.result()[metric], expected[metric])
+
+    def test_rejects_mismatched_metrics(self):
+        """Test that trackers with different metrics do not merge."""
+        with pytest.raises(ValueError):
+            TopKTracker(["size_kb"]).merge(TopKTracker(["response_time_ms"]))
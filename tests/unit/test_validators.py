@@ -0,0 +1,113 @@
+"""Unit tests for HAR validation."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from har_analyzer.utils import (
+    ValidationError,
+    check_entry,
+    check_har_file,
+    validate_har_file,
+)
+
+
+def _write(data: dict[str, Any], tmp_path: Path) -> Path:
+    path = tmp_path / "test.har"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def broken_har_data(sample_har_data: dict[str, Any]) -> dict[str, Any]:
+    """Create HAR data whose later entries violate the entry shape."""
+    entry = sample_har_data["log"]["entries"][0]
+    entries = [json.loads(json.dumps(entry)) for _ in range(10)]
+    entries[2]["time"] = "150"
+    entries[4]["timings"]["wait"] = None
+    entries[6]["time"] = -1
+    entries[8] = ["not", "an", "entry"]
+    sample_har_data["log"]["entries"] = entries
+    return sample_har_data
+
+
+class TestCheckEntry:
+    """Test cases for check_entry function."""
+
+    def test_valid_entry(self, sample_har_data: dict[str, Any]):
+        """Test that the sample entries have no violations."""
+        for entry in sample_har_data["log"]["entries"]:
+            assert check_entry(entry) == []
+
+    @pytest.mark.parametrize(
+        "field, value, violation",
+        [
+            ("startedDateTime", 1735725600, "startedDateTime is not an ISO"),
+            ("time", True, "time is not a non-negative number"),
+            ("request", {"url": "https://example.com/"}, "request.method"),
+            ("response", {"status": 200.0}, "response.status is not an integer"),
+            ("timings", {"send": 1, "wait": 2}, "timings.receive"),
+            ("timings", {"send": 1, "wait": 2, "receive": 3, "dns": -2}, "timings.dns"),
+        ],
+    )
+    def test_violations(
+        self, sample_har_data: dict[str, Any], field: str, value: Any, violation: str
+    ):
+        """Test that each type and timing rule is checked."""
+        entry = {**sample_har_data["log"]["entries"][0], field: value}
+
+        (found,) = check_entry(entry)
+
+        assert found.startswith(violation)
+
+    def test_missing_fields(self):
+        """Test that every missing required field is reported."""
+        assert check_entry({"time": 1}) == [
+            "missing request",
+            "missing response",
+            "missing startedDateTime",
+            "missing timings",
+        ]
+
+
+class TestCheckHarFile:
+    """Test cases for check_har_file function."""
+
+    def test_aggregates_every_entry(
+        self, broken_har_data: dict[str, Any], tmp_path: Path
+    ):
+        """Test that violations are counted with example indices."""
+        report = check_har_file(_write(broken_har_data, tmp_path), max_samples=1)
+
+        assert report.entries_count == 10
+        assert report.invalid_entries == 4
+        assert report.errors["time is not a non-negative number"] == 2
+        assert report.samples["time is not a non-negative number"] == [2]
+        assert report.samples["entry is not an object"] == [8]
+        assert "(entries #2, ...)" in report.summary()
+        assert not report.to_dict()["valid"]
+
+    def test_fail_fast(self, broken_har_data: dict[str, Any], tmp_path: Path):
+        """Test that fail-fast stops at the first invalid entry."""
+        report = check_har_file(_write(broken_har_data, tmp_path), fail_fast=True)
+
+        assert report.stopped_early
+        assert report.entries_count == 3
+        assert list(report.errors) == ["time is not a non-negative number"]
+
+    def test_broken_first_entry(self, sample_har_data: dict[str, Any], tmp_path: Path):
+        """Test that a broken first entry is reported like any other."""
+        del sample_har_data["log"]["entries"][0]["response"]
+
+        report = check_har_file(_write(sample_har_data, tmp_path))
+
+        assert report.samples == {"missing response": [0]}
+
+    def test_validate_har_file_raises(
+        self, broken_har_data: dict[str, Any], tmp_path: Path
+    ):
+        """Test that validate_har_file rejects files with invalid entries."""
+        with pytest.raises(ValidationError, match="4 invalid HAR entries"):
+            validate_har_file(_write(broken_har_data, tmp_path))